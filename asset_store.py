@@ -0,0 +1,250 @@
+# asset_store.py
+# A content-addressed store for the images referenced by world assets.
+#
+# Usage:
+#   python asset_store.py import portrait.png other.jpg [--transcode]
+#   python asset_store.py adopt [--transcode]
+#   python asset_store.py gc [--dry-run]
+
+import argparse
+import hashlib
+import io
+import json
+import os
+import shutil
+from typing import Dict, Iterable, List, Optional, Tuple
+
+try:
+    from PIL import Image
+except ImportError: # Transcoding is optional; images are then stored as imported
+    Image = None
+
+IMAGE_EXTENSIONS = (".png", ".jpg", ".jpeg", ".webp", ".gif", ".bmp")
+IMAGE_ASSET_TYPES = ("characters", "locations", "factions", "items") # World asset types with an "image" field
+TRANSCODE_FORMAT = ("WEBP", ".webp")
+TRANSCODE_QUALITY = 85
+MAX_DIMENSION = 2048 # Longest side kept when transcoding
+
+def content_hash(data: bytes) -> str:
+    return hashlib.sha256(data).hexdigest()
+
+def transcode(data: bytes) -> Optional[Tuple[bytes, str]]:
+    """
+    Re-encodes an image as WebP, downscaled to MAX_DIMENSION. Returns None if Pillow is
+    missing, the image can't be read, or the result isn't smaller than the original.
+    """
+    if Image is None:
+        return None
+    try:
+        with Image.open(io.BytesIO(data)) as image:
+            image.thumbnail((MAX_DIMENSION, MAX_DIMENSION))
+            if image.mode not in ("RGB", "RGBA"):
+                image = image.convert("RGBA" if "transparency" in image.info or image.mode in ("LA", "PA") else "RGB")
+            out = io.BytesIO()
+            image.save(out, TRANSCODE_FORMAT[0], quality=TRANSCODE_QUALITY, method=6)
+    except (OSError, ValueError):
+        return None
+    encoded = out.getvalue()
+    return (encoded, TRANSCODE_FORMAT[1]) if len(encoded) < len(data) else None
+
+def _image_assets(world_data):
+    """
+    Yields (asset_type, asset_id, asset) for every asset that can have an image, from
+    either a schemas.WorldData or its raw JSON dict.
+    """
+    raw = isinstance(world_data, dict)
+    for asset_type in IMAGE_ASSET_TYPES:
+        assets = world_data.get(asset_type, {}) if raw else getattr(world_data, asset_type)
+        for asset_id, asset in list(assets.items()):
+            yield asset_type, asset_id, asset
+    sleuth = world_data.get("sleuth") if raw else world_data.sleuth
+    if sleuth:
+        yield "sleuth", "sleuth", sleuth
+
+def _image_of(asset):
+    return asset.get("image") if isinstance(asset, dict) else asset.image
+
+def image_references(world_data) -> Dict[str, List[Tuple[str, str]]]:
+    """Maps each image reference in the world to the (asset_type, asset_id) pairs using it."""
+    references: Dict[str, List[Tuple[str, str]]] = {}
+    for asset_type, asset_id, asset in _image_assets(world_data):
+        image = _image_of(asset)
+        if image:
+            references.setdefault(image, []).append((asset_type, asset_id))
+    return references
+
+class ImageStore:
+    """
+    Stores images under the hash of their content, so identical bytes are kept once.
+    Entities reference an image by its path in the store, which never changes once
+    imported. A manifest records the original file names and the hashes of imported
+    sources that were transcoded, so re-importing the same source is also a no-op.
+    """
+    MANIFEST = "manifest.json"
+    VERSION = 1
+
+    def __init__(self, root: str = os.path.join("data", "images")):
+        self.root = root
+        self.manifest_path = os.path.join(root, self.MANIFEST)
+        self.images: Dict[str, dict] = {} # Content hash -> {"file", "bytes", "sources"}
+        self.aliases: Dict[str, str] = {} # Source hash -> hash of the stored (transcoded) image
+        self.load()
+
+    def load(self):
+        try:
+            with open(self.manifest_path, "r", encoding="utf-8") as f:
+                data = json.load(f)
+        except (OSError, ValueError):
+            return
+        if data.get("version") == self.VERSION:
+            self.images = data.get("images", {})
+            self.aliases = data.get("aliases", {})
+
+    def save(self):
+        os.makedirs(self.root, exist_ok=True)
+        data = {"version": self.VERSION, "images": self.images, "aliases": self.aliases}
+        temp_path = f"{self.manifest_path}.tmp"
+        with open(temp_path, "w", encoding="utf-8") as f:
+            json.dump(data, f, indent=4)
+        os.replace(temp_path, self.manifest_path)
+
+    def reference(self, digest: str) -> str:
+        """The stable reference saved in an entity's image field."""
+        return os.path.join(self.root, self.images[digest]["file"]).replace(os.sep, "/")
+
+    def digest_of(self, reference: str) -> Optional[str]:
+        """The content hash of a reference into this store, or None for an outside path."""
+        if not reference:
+            return None
+        digest = os.path.splitext(os.path.basename(reference))[0]
+        if digest in self.images and os.path.normpath(reference) == os.path.normpath(self.reference(digest)):
+            return digest
+        return None
+
+    def import_bytes(self, data: bytes, name: str, transcode_images: bool = False) -> str:
+        """Adds an image and returns its reference; identical content is stored only once."""
+        source_digest = content_hash(data)
+        digest = self.aliases.get(source_digest, source_digest)
+        if digest not in self.images:
+            extension = os.path.splitext(name)[1].lower() or ".bin"
+            if extension == ".jpeg":
+                extension = ".jpg"
+            if transcode_images:
+                transcoded = transcode(data)
+                if transcoded is not None:
+                    data, extension = transcoded
+                    digest = content_hash(data)
+                    self.aliases[source_digest] = digest
+            if digest not in self.images:
+                os.makedirs(self.root, exist_ok=True)
+                path = os.path.join(self.root, digest + extension)
+                temp_path = f"{path}.tmp"
+                with open(temp_path, "wb") as f:
+                    f.write(data)
+                os.replace(temp_path, path)
+                self.images[digest] = {"file": digest + extension, "bytes": len(data), "sources": []}
+        sources = self.images[digest]["sources"]
+        if os.path.basename(name) not in sources:
+            sources.append(os.path.basename(name))
+        self.save()
+        return self.reference(digest)
+
+    def import_file(self, path: str, transcode_images: bool = False) -> str:
+        with open(path, "rb") as f:
+            data = f.read()
+        return self.import_bytes(data, path, transcode_images)
+
+    def adopt(self, world_data, transcode_images: bool = False) -> Dict[str, str]:
+        """
+        Imports every image the world references from outside the store and rewrites the
+        references to point into it. Returns {old reference: new reference}; the old files
+        are left in place for gc() or the user to remove.
+        """
+        moved = {}
+        for asset_type, asset_id, asset in _image_assets(world_data):
+            reference = _image_of(asset)
+            if not reference or self.digest_of(reference) is not None or not os.path.isfile(reference):
+                continue
+            if reference not in moved:
+                moved[reference] = self.import_file(reference, transcode_images)
+            if isinstance(asset, dict):
+                asset["image"] = moved[reference]
+            else:
+                asset.image = moved[reference]
+        return moved
+
+    def orphans(self, referenced: Iterable[str]) -> List[str]:
+        """Paths of files in the store directory that no reference points at."""
+        kept = {os.path.normpath(reference) for reference in referenced if reference}
+        orphans = []
+        if not os.path.isdir(self.root):
+            return orphans
+        for name in sorted(os.listdir(self.root)):
+            path = os.path.join(self.root, name)
+            if name == self.MANIFEST or not os.path.isfile(path) or not name.lower().endswith(IMAGE_EXTENSIONS):
+                continue
+            if os.path.normpath(path) not in kept:
+                orphans.append(path)
+        return orphans
+
+    def gc(self, referenced: Iterable[str], dry_run: bool = False) -> List[str]:
+        """Deletes the unreferenced images in the store directory and returns their paths."""
+        orphans = self.orphans(referenced)
+        if dry_run:
+            return orphans
+        removed = set()
+        for path in orphans:
+            try:
+                os.remove(path)
+            except OSError:
+                continue
+            removed.add(os.path.basename(path))
+        self.images = {digest: entry for digest, entry in self.images.items() if entry["file"] not in removed}
+        self.aliases = {source: digest for source, digest in self.aliases.items() if digest in self.images}
+        self.save()
+        return orphans
+
+    def total_bytes(self) -> int:
+        return sum(entry["bytes"] for entry in self.images.values())
+
+# --- Command line ---
+
+def _load_world(data_dir):
+    path = os.path.join(data_dir, "world.json")
+    with open(path, "r", encoding="utf-8") as f:
+        return path, json.load(f)
+
+def main():
+    parser = argparse.ArgumentParser(description="Manage the content-addressed image store.")
+    parser.add_argument("--data", default="data", help="Data directory holding world.json and images/.")
+    commands = parser.add_subparsers(dest="command", required=True)
+    import_command = commands.add_parser("import", help="Import image files and print their references.")
+    import_command.add_argument("paths", nargs="+")
+    import_command.add_argument("--transcode", action="store_true", help="Re-encode as WebP when smaller (needs Pillow).")
+    adopt_command = commands.add_parser("adopt", help="Move images referenced by world.json into the store.")
+    adopt_command.add_argument("--transcode", action="store_true")
+    gc_command = commands.add_parser("gc", help="Delete images no world asset references.")
+    gc_command.add_argument("--dry-run", action="store_true")
+    args = parser.parse_args()
+
+    store = ImageStore(os.path.join(args.data, "images"))
+    if args.command == "import":
+        for path in args.paths:
+            print(f"{path} -> {store.import_file(path, args.transcode)}")
+    elif args.command == "adopt":
+        world_path, world_data = _load_world(args.data)
+        moved = store.adopt(world_data, args.transcode)
+        if moved:
+            shutil.copyfile(world_path, f"{world_path}.bak")
+            with open(world_path, "w", encoding="utf-8") as f:
+                json.dump(world_data, f, indent=4)
+        for old, new in moved.items():
+            print(f"{old} -> {new}")
+    elif args.command == "gc":
+        _, world_data = _load_world(args.data)
+        for path in store.gc(image_references(world_data), args.dry_run):
+            print(("Would remove " if args.dry_run else "Removed ") + path)
+    print(f"{len(store.images)} images, {store.total_bytes()} bytes")
+
+if __name__ == "__main__":
+    main()
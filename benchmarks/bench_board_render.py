@@ -0,0 +1,115 @@
+# bench_board_render.py
+# Compares plot graph frame times of the raster and OpenGL viewports on a synthetic board.
+#
+# Usage:
+#   python benchmarks/bench_board_render.py --cards 1000 --frames 120
+#
+# Headless CI has no GPU; run under a virtual X server with Mesa's software renderer:
+#   xvfb-run -s "-screen 0 3840x2160x24" python benchmarks/bench_board_render.py --llvmpipe
+
+import argparse
+import json
+import math
+import os
+import statistics
+import sys
+import time
+
+REPO_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, REPO_ROOT)
+
+def build_board(view, card_count):
+    """Fills the view with a grid of real clue cards and a chain of dependency edges."""
+    from PySide6.QtCore import QPointF
+    import main
+    import schemas
+    from case_graph import CaseEdge, node_key
+
+    scene = view.begin_scene("benchmark", show=False)
+    scene.begin_bulk_insert()
+    columns = math.ceil(math.sqrt(card_count))
+    for i in range(card_count):
+        clue = schemas.Clue(clue_id=f"clue_{i}", clue_summary=f"Synthetic clue {i}", source="Benchmark")
+        row, column = divmod(i, columns)
+        scene.add_node(main.ClueCard(clue), QPointF(300 * column, 150 * row), node_key("clue", clue.clue_id))
+    scene.end_bulk_insert()
+    view.show_derived_edges(
+        [CaseEdge("Dependency", node_key("clue", f"clue_{i - 1}"), node_key("clue", f"clue_{i}")) for i in range(1, card_count)],
+        scene,
+    )
+    view.activate_scene("benchmark")
+
+def measure_frames(app, view, frame_count):
+    """Pans diagonally across the board, timing one synchronous repaint per frame."""
+    finish_gl = None
+    if view.opengl_enabled:
+        view.viewport().makeCurrent()
+        finish_gl = view.viewport().context().functions().glFinish
+
+    h_bar, v_bar = view.horizontalScrollBar(), view.verticalScrollBar()
+    frame_times = []
+    for frame in range(frame_count):
+        progress = frame / max(1, frame_count - 1)
+        h_bar.setValue(int(h_bar.minimum() + (h_bar.maximum() - h_bar.minimum()) * progress))
+        v_bar.setValue(int(v_bar.minimum() + (v_bar.maximum() - v_bar.minimum()) * progress))
+        app.processEvents() # Let newly visible cards be built before timing the frame
+        start = time.perf_counter()
+        view.viewport().repaint()
+        if finish_gl:
+            finish_gl() # Include the time the (software) GPU needs to finish the frame
+        frame_times.append((time.perf_counter() - start) * 1000)
+    return frame_times
+
+def summarize(frame_times):
+    ordered = sorted(frame_times)
+    return {
+        "frames": len(ordered),
+        "mean_ms": round(statistics.fmean(ordered), 3),
+        "p50_ms": round(ordered[len(ordered) // 2], 3),
+        "p95_ms": round(ordered[min(len(ordered) - 1, int(len(ordered) * 0.95))], 3),
+        "max_ms": round(ordered[-1], 3),
+    }
+
+def main():
+    parser = argparse.ArgumentParser(description="Compare raster and OpenGL plot graph frame times.")
+    parser.add_argument("--cards", type=int, default=1000)
+    parser.add_argument("--frames", type=int, default=120)
+    parser.add_argument("--width", type=int, default=3840)
+    parser.add_argument("--height", type=int, default=2160)
+    parser.add_argument("--mode", choices=["raster", "opengl", "both"], default="both")
+    parser.add_argument("--llvmpipe", action="store_true", help="Force Mesa's llvmpipe software renderer.")
+    parser.add_argument("--output", help="Write the results as JSON to this path.")
+    args = parser.parse_args()
+
+    if args.llvmpipe:
+        os.environ["LIBGL_ALWAYS_SOFTWARE"] = "1"
+        os.environ["GALLIUM_DRIVER"] = "llvmpipe"
+
+    from PySide6.QtCore import Qt
+    from PySide6.QtWidgets import QApplication
+    QApplication.setAttribute(Qt.AA_ShareOpenGLContexts)
+    app = QApplication(sys.argv)
+    import main as agency
+
+    results = {"cards": args.cards, "viewport": [args.width, args.height]}
+    modes = ["raster", "opengl"] if args.mode == "both" else [args.mode]
+    for mode in modes:
+        view = agency.PlotGraphView()
+        view.resize(args.width, args.height)
+        view.show()
+        if mode == "opengl" and not view.set_opengl_enabled(True):
+            results[mode] = {"error": "OpenGL context could not be created"}
+            continue
+        build_board(view, args.cards)
+        app.processEvents()
+        measure_frames(app, view, 5) # Warm-up: first paints build caches and GL resources
+        results[mode] = summarize(measure_frames(app, view, args.frames))
+        view.close()
+
+    print(json.dumps(results, indent=4))
+    if args.output:
+        with open(args.output, "w", encoding="utf-8") as f:
+            json.dump(results, f, indent=4)
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,77 @@
+# bench_memory.py
+# Compares the memory a loaded world takes with plain dataclasses and with the compact
+# layout (slots, shared empty lists, interned ids). Each layout is loaded in its own
+# process, since compact.ENABLED is fixed when schemas is imported.
+#
+# Usage:
+#   python benchmarks/bench_memory.py --characters 100000
+
+import argparse
+import json
+import os
+import subprocess
+import sys
+import tempfile
+import time
+import tracemalloc
+
+REPO_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, REPO_ROOT)
+
+def measure(data_path):
+    """Loads the data directory and returns the memory the loaded objects hold."""
+    tracemalloc.start()
+    start = time.perf_counter()
+    from core import DataManager
+    baseline = tracemalloc.get_traced_memory()[0]
+    data_manager = DataManager(data_path)
+    held = tracemalloc.get_traced_memory()[0] - baseline
+    elapsed = time.perf_counter() - start
+    tracemalloc.stop()
+    world = data_manager.world_data
+    data_manager.close()
+    return {
+        "held_mb": round(held / 2**20, 2),
+        "bytes_per_character": round(held / max(1, len(world.characters))),
+        "load_s": round(elapsed, 3), # Slowed down by tracemalloc; only comparable between layouts
+    }
+
+def main():
+    parser = argparse.ArgumentParser(description="Compare memory use of the plain and compact schema layouts.")
+    parser.add_argument("--characters", type=int, default=20000)
+    parser.add_argument("--cases", type=int, default=20)
+    parser.add_argument("--clues", type=int, default=100)
+    parser.add_argument("--links", type=float, default=3.0)
+    parser.add_argument("--seed", type=int, default=7)
+    parser.add_argument("--output", help="Write the results as JSON to this path.")
+    parser.add_argument("--measure", help=argparse.SUPPRESS) # Internal: load this data directory and print its footprint
+    args = parser.parse_args()
+
+    if args.measure:
+        print(json.dumps(measure(args.measure)))
+        return
+
+    from synthetic import Generator, write_data_dir
+    with tempfile.TemporaryDirectory(prefix="agency_mem_") as workdir:
+        data_path = os.path.join(workdir, "data")
+        generator = Generator(args.seed, args.links)
+        world = generator.world(characters=args.characters, locations=args.characters // 5, factions=max(1, args.characters // 100),
+                                items=args.characters // 2, districts=max(1, args.characters // 1000))
+        write_data_dir(data_path, world, generator.cases(world, args.cases, args.clues))
+        del world, generator
+
+        results = {"characters": args.characters, "cases": args.cases, "clues": args.clues, "links": args.links}
+        for layout, flag in (("plain", "0"), ("compact", "1")):
+            env = dict(os.environ, AGENCY_COMPACT=flag, AGENCY_PROFILE="0")
+            output = subprocess.run([sys.executable, os.path.abspath(__file__), "--measure", data_path],
+                                    cwd=workdir, env=env, capture_output=True, text=True, check=True).stdout
+            results[layout] = json.loads(output.strip().splitlines()[-1])
+    results["saved_pct"] = round(100 * (1 - results["compact"]["held_mb"] / results["plain"]["held_mb"]), 1)
+
+    print(json.dumps(results, indent=4))
+    if args.output:
+        with open(args.output, "w", encoding="utf-8") as f:
+            json.dump(results, f, indent=4)
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,62 @@
+# bench_name_index.py
+# Times NameIndex builds, incremental updates and type-ahead queries on a synthetic world.
+#
+# Usage:
+#   python benchmarks/bench_name_index.py --entities 100000
+
+import argparse
+import json
+import os
+import random
+import statistics
+import sys
+import time
+
+REPO_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, REPO_ROOT)
+
+from name_index import NameIndex
+
+FIRST_NAMES = ["James", "Mary", "John", "Patricia", "Robert", "Jennifer", "Michael", "Linda", "Evelyn", "Vincent", "Harriet", "Ambrose"]
+SYLLABLES = ["mor", "gan", "ash", "ford", "wel", "ling", "ton", "bra", "hal", "ver", "son", "dun", "ste", "rin", "ka", "lo", "vic", "tor"]
+QUERIES = ["j", "ja", "james", "james mor", "morgan", "organ", "tonford", "vincent ashforb", "the ash", "zzz"]
+
+def synthetic_names(count, seed):
+    rng = random.Random(seed)
+    for i in range(count):
+        surname = "".join(rng.choices(SYLLABLES, k=3)).capitalize()
+        alias = f"The {rng.choice(SYLLABLES).capitalize()}" if rng.random() < 0.2 else ""
+        yield f"character_{i}", [f"{rng.choice(FIRST_NAMES)} {surname}", alias]
+
+def time_ms(func, repeat):
+    samples = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        func()
+        samples.append((time.perf_counter() - start) * 1000)
+    return round(statistics.median(samples), 4)
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark the type-ahead name index.")
+    parser.add_argument("--entities", type=int, default=100000)
+    parser.add_argument("--repeat", type=int, default=50)
+    parser.add_argument("--seed", type=int, default=7)
+    parser.add_argument("--output", help="Write the results as JSON to this path.")
+    args = parser.parse_args()
+
+    index = NameIndex()
+    entries = list(synthetic_names(args.entities, args.seed))
+    start = time.perf_counter()
+    index.rebuild(entries)
+    results = {"entities": args.entities, "build_s": round(time.perf_counter() - start, 3)}
+
+    results["update_ms"] = time_ms(lambda: index.update("character_0", [f"Renamed {random.random()}"]), args.repeat)
+    results["search_ms"] = {query: time_ms(lambda: index.search(query), args.repeat) for query in QUERIES}
+
+    print(json.dumps(results, indent=4))
+    if args.output:
+        with open(args.output, "w", encoding="utf-8") as f:
+            json.dump(results, f, indent=4)
+
+if __name__ == "__main__":
+    main()
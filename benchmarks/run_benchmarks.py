@@ -0,0 +1,167 @@
+# run_benchmarks.py
+# Times load, save, validation, search and board population on a synthetic data set,
+# and flags regressions against a saved baseline.
+#
+# Usage:
+#   python benchmarks/run_benchmarks.py --save-baseline benchmarks/baseline.json
+#   python benchmarks/run_benchmarks.py --baseline benchmarks/baseline.json --output results.json
+#   python benchmarks/run_benchmarks.py --preset large --repeat 1
+
+import argparse
+import json
+import os
+import platform
+import shutil
+import statistics
+import sys
+import tempfile
+import time
+
+REPO_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, REPO_ROOT)
+
+from core import DataManager, validate_project
+from name_index import NameIndex
+from text_index import FullTextIndex
+from synthetic import PRESETS, Generator, write_data_dir
+
+QUERIES = ["rain", "neon ledger", "alibi pistol", "the harbor casino", "ambrose", "character_0000042", "zzz"]
+BOARD_CASES = 10 # Cases populated per board sample
+MIN_DELTA_MS = 1.0 # Slowdowns smaller than this are treated as noise whatever the ratio
+
+def time_ms(func, repeat):
+    samples = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        func()
+        samples.append((time.perf_counter() - start) * 1000)
+    return round(statistics.median(samples), 4)
+
+def board_benchmark(data_manager):
+    """
+    Returns a function that populates fresh boards for up to BOARD_CASES cases, or None
+    if PySide6 isn't available. Runs offscreen unless a platform is already chosen.
+    """
+    os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+    try:
+        from PySide6.QtWidgets import QApplication
+        from main import CaseBuilder, PlotGraphScene
+    except ImportError:
+        return None
+    app = QApplication.instance() or QApplication([])
+    builder = CaseBuilder(data_manager)
+    cases = list(data_manager.case_files.items())[:BOARD_CASES]
+
+    def populate():
+        for case_id, case_file in cases:
+            scene = PlotGraphScene(case_id)
+            scene.begin_bulk_insert()
+            builder.populate_board(scene, case_file)
+            scene.end_bulk_insert()
+            scene.clear()
+            scene.deleteLater()
+        app.processEvents()
+    return populate
+
+def run(data_path, repeat, skip_board=False):
+    metrics = {}
+    metrics["load_ms"] = time_ms(lambda: DataManager(data_path).close(), repeat)
+    data_manager = DataManager(data_path)
+    world_data, case_files = data_manager.world_data, data_manager.case_files
+    metrics["load_world_ms"] = time_ms(data_manager.load_world_data, repeat)
+    metrics["load_cases_ms"] = time_ms(data_manager.load_all_cases, repeat)
+
+    # Saves return once the write is queued; the metrics include waiting for the disk
+    metrics["save_world_ms"] = time_ms(lambda: data_manager.save_world_data().result(), repeat)
+    if case_files:
+        first_case = next(iter(case_files.values()))
+        metrics["save_case_ms"] = time_ms(lambda: data_manager.save_case(first_case).result(), repeat)
+
+    metrics["validate_ms"] = time_ms(lambda: validate_project(world_data, case_files), repeat)
+
+    index = FullTextIndex.build(world_data, case_files)
+    metrics["search_build_ms"] = time_ms(lambda: FullTextIndex.build(world_data, case_files), repeat)
+    metrics["search_query_ms"] = time_ms(lambda: [index.search(query) for query in QUERIES], repeat)
+    entries = [(character_id, [character.full_name, character.alias]) for character_id, character in world_data.characters.items()]
+    names = NameIndex()
+    metrics["name_index_build_ms"] = time_ms(lambda: names.rebuild(entries), repeat)
+    metrics["name_index_query_ms"] = time_ms(lambda: [names.search(query) for query in QUERIES], repeat)
+
+    populate = None if skip_board or not case_files else board_benchmark(data_manager)
+    if populate is not None:
+        metrics["board_populate_ms"] = time_ms(populate, repeat)
+    data_manager.close()
+    return metrics
+
+def compare(metrics, baseline, threshold):
+    """Returns (metric, baseline ms, current ms) for every metric slower than the baseline by more than threshold."""
+    regressions = []
+    for name, base_ms in baseline.get("metrics", {}).items():
+        current_ms = metrics.get(name)
+        if current_ms is None:
+            continue
+        if current_ms > base_ms * (1 + threshold) and current_ms - base_ms > MIN_DELTA_MS:
+            regressions.append((name, base_ms, current_ms))
+    return regressions
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark the data layer, search and board population.")
+    parser.add_argument("--data", help="Benchmark a copy of this data directory instead of generating one.")
+    parser.add_argument("--preset", choices=sorted(PRESETS), default="small")
+    for key in PRESETS["small"]:
+        parser.add_argument(f"--{key}", type=int, help=f"Overrides the preset's {key} count.")
+    parser.add_argument("--links", type=float, default=3.0, help="Average ids per reference list.")
+    parser.add_argument("--seed", type=int, default=7)
+    parser.add_argument("--repeat", type=int, default=5)
+    parser.add_argument("--skip-board", action="store_true", help="Don't time board population (needs PySide6).")
+    parser.add_argument("--output", help="Write the results as JSON to this path.")
+    parser.add_argument("--baseline", help="Compare against results saved with --save-baseline or --output.")
+    parser.add_argument("--threshold", type=float, default=0.2, help="Allowed slowdown against the baseline (0.2 = 20%%).")
+    parser.add_argument("--save-baseline", help="Write the results to this path as the new baseline.")
+    args = parser.parse_args()
+
+    sizes = dict(PRESETS[args.preset])
+    sizes.update({key: getattr(args, key) for key in sizes if getattr(args, key) is not None})
+    with tempfile.TemporaryDirectory(prefix="agency_bench_") as workdir:
+        data_path = os.path.join(workdir, "data")
+        start = time.perf_counter()
+        if args.data:
+            # Saves are timed too, so never touch the original files
+            shutil.copytree(args.data, data_path)
+            config = {"data": os.path.abspath(args.data)}
+        else:
+            generator = Generator(args.seed, args.links)
+            world = generator.world(sizes["characters"], sizes["locations"], sizes["factions"], sizes["items"], sizes["districts"])
+            write_data_dir(data_path, world, generator.cases(world, sizes["cases"], sizes["clues"]))
+            config = dict(sizes, links=args.links, seed=args.seed)
+        config.update(repeat=args.repeat, setup_s=round(time.perf_counter() - start, 3))
+        # DataManager and the search index write logs and caches relative to the working directory
+        cwd = os.getcwd()
+        os.chdir(workdir)
+        try:
+            metrics = run(data_path, args.repeat, args.skip_board)
+        finally:
+            os.chdir(cwd)
+
+    results = {"config": config, "python": platform.python_version(), "metrics": metrics}
+    print(json.dumps(results, indent=4))
+    for path in (args.output, args.save_baseline):
+        if path:
+            with open(path, "w", encoding="utf-8") as f:
+                json.dump(results, f, indent=4)
+
+    if args.baseline:
+        with open(args.baseline, "r", encoding="utf-8") as f:
+            baseline = json.load(f)
+        comparable = lambda c: {key: value for key, value in c.items() if key != "setup_s"}
+        if comparable(baseline.get("config", {})) != comparable(config):
+            print("Warning: the baseline was recorded with a different configuration.", file=sys.stderr)
+        regressions = compare(metrics, baseline, args.threshold)
+        for name, base_ms, current_ms in regressions:
+            print(f"REGRESSION {name}: {base_ms:.2f} ms -> {current_ms:.2f} ms ({current_ms / base_ms - 1:+.0%})", file=sys.stderr)
+        if regressions:
+            sys.exit(1)
+        print(f"No regressions beyond {args.threshold:.0%} of the baseline.", file=sys.stderr)
+
+if __name__ == "__main__":
+    main()
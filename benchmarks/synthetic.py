@@ -0,0 +1,187 @@
+# synthetic.py
+# Deterministic generator of synthetic worlds and cases for benchmarks and load testing.
+#
+# Usage:
+#   python benchmarks/synthetic.py --output /tmp/agency_data --characters 100000 --cases 5000 --clues 500
+#   python main.py  (from a directory whose data/ is the generated output)
+
+import argparse
+import json
+import os
+import random
+import sys
+from dataclasses import asdict
+from typing import Dict, List, get_args
+
+REPO_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, REPO_ROOT)
+
+import schemas
+
+FIRST_NAMES = ["James", "Mary", "John", "Patricia", "Robert", "Jennifer", "Michael", "Linda", "Evelyn", "Vincent",
+               "Harriet", "Ambrose", "Clara", "Silas", "Dorothy", "Felix", "Mabel", "Otto", "Ruth", "Cyrus"]
+SYLLABLES = ["mor", "gan", "ash", "ford", "wel", "ling", "ton", "bra", "hal", "ver", "son", "dun", "ste", "rin", "ka", "lo", "vic", "tor"]
+WORDS = ["rain", "neon", "ledger", "alibi", "cigarette", "harbor", "jazz", "pistol", "letter", "debt", "motive", "shadow",
+         "dockyard", "casino", "witness", "train", "ticket", "blood", "glove", "whisper", "fog", "key", "safe", "photograph",
+         "poison", "bribe", "inheritance", "mistress", "lighthouse", "warehouse", "telegram", "badge", "diamond", "suitcase"]
+LOCATION_TYPES = ["Bar", "Office", "Warehouse", "Apartment", "Club", "Precinct", "Dock", "Hotel", "Diner", "Mansion"]
+ITEM_TYPES = ["Weapon", "Document", "Jewelry", "Tool", "Clothing", "Key", "Photograph", "Vial"]
+
+PRESETS = {
+    "small": dict(characters=2000, locations=500, factions=40, items=1000, districts=12, cases=50, clues=50),
+    "medium": dict(characters=20000, locations=4000, factions=200, items=10000, districts=40, cases=500, clues=200),
+    "large": dict(characters=100000, locations=20000, factions=1000, items=50000, districts=100, cases=5000, clues=500),
+}
+
+class Generator:
+    """
+    Builds a WorldData and CaseFiles from a seed. link_density is the average number of
+    ids in each reference list (allies, members, clue dependencies, ...), so it scales
+    both file size and the work of everything that follows references.
+    """
+    def __init__(self, seed: int = 7, link_density: float = 3.0):
+        self.rng = random.Random(seed)
+        self.link_density = link_density
+
+    def name(self) -> str:
+        return f"{self.rng.choice(FIRST_NAMES)} {''.join(self.rng.choices(SYLLABLES, k=3)).capitalize()}"
+
+    def sentence(self, words: int = 12) -> str:
+        return " ".join(self.rng.choices(WORDS, k=words)).capitalize() + "."
+
+    def links(self, ids: List[str]) -> List[str]:
+        if not ids:
+            return []
+        k = min(len(ids), max(0, round(self.rng.expovariate(1 / self.link_density)))) if self.link_density > 0 else 0
+        return self.rng.sample(ids, k)
+
+    def choice(self, options):
+        return self.rng.choice(list(options)) if options else None
+
+    def world(self, characters=1000, locations=200, factions=20, items=500, districts=10) -> schemas.WorldData:
+        rng = self.rng
+        district_ids = [f"district_{i:06d}" for i in range(districts)]
+        faction_ids = [f"faction_{i:06d}" for i in range(factions)]
+        location_ids = [f"location_{i:06d}" for i in range(locations)]
+        character_ids = [f"character_{i:07d}" for i in range(characters)]
+        item_ids = [f"item_{i:07d}" for i in range(items)]
+        world = schemas.WorldData()
+
+        for district_id in district_ids:
+            world.districts[district_id] = schemas.District(
+                district_id=district_id, district_name=f"{self.choice(SYLLABLES).capitalize()} Heights",
+                description=self.sentence(), wealth_class=self.choice(get_args(schemas.WealthClass)),
+                atmosphere=self.sentence(6), key_locations=self.links(location_ids),
+                population_density=self.choice(get_args(schemas.PopulationDensity)),
+                notable_features=[self.sentence(4) for _ in range(2)], dominant_faction=self.choice(faction_ids))
+        for faction_id in faction_ids:
+            world.factions[faction_id] = schemas.Faction(
+                faction_id=faction_id, name=f"The {self.choice(WORDS).capitalize()} Syndicate", archetype=self.choice(WORDS),
+                description=self.sentence(20), ideology=self.sentence(8), headquarters=self.choice(location_ids),
+                resources=rng.sample(WORDS, 3), ally_factions=self.links(faction_ids), enemy_factions=self.links(faction_ids),
+                members=self.links(character_ids), influence=self.choice(get_args(schemas.FactionInfluence)),
+                public_perception=self.sentence(8))
+        for location_id in location_ids:
+            world.locations[location_id] = schemas.Location(
+                location_id=location_id, name=f"The {self.choice(WORDS).capitalize()} {self.choice(LOCATION_TYPES)}",
+                type=self.choice(LOCATION_TYPES), description=self.sentence(20), district=self.choice(district_ids),
+                owning_faction=self.choice(faction_ids), danger_level=self.choice(get_args(schemas.DangerLevel)),
+                population=rng.randint(0, 500), key_characters=self.links(character_ids),
+                associated_items=self.links(item_ids), accessibility=self.choice(get_args(schemas.AccessibilityLevel)),
+                hidden=rng.random() < 0.1, internal_logic_notes=self.sentence(10))
+        for character_id in character_ids:
+            world.characters[character_id] = schemas.Character(
+                character_id=character_id, full_name=self.name(),
+                alias=f"The {self.choice(WORDS).capitalize()}" if rng.random() < 0.2 else "",
+                age=rng.randint(18, 90), gender=self.choice(get_args(schemas.Gender)), employment=self.choice(WORDS),
+                biography=self.sentence(40), faction=self.choice(faction_ids) if rng.random() < 0.5 else None,
+                wealth_class=self.choice(get_args(schemas.WealthClass)), district=self.choice(district_ids),
+                allies=self.links(character_ids), enemies=self.links(character_ids), items=self.links(item_ids),
+                archetype=self.choice(WORDS), personality=self.sentence(8), values=rng.sample(WORDS, 2),
+                secrets=[self.sentence(6)], motivations=[self.sentence(6)],
+                alignment=self.choice(get_args(schemas.Alignment)),
+                honesty=round(rng.random(), 2), victim_likelihood=round(rng.random(), 2), killer_likelihood=round(rng.random(), 2))
+        for item_id in item_ids:
+            world.items[item_id] = schemas.Item(
+                item_id=item_id, name=f"{self.choice(WORDS).capitalize()} {self.choice(ITEM_TYPES).lower()}",
+                type=self.choice(ITEM_TYPES), description=self.sentence(15), use=[self.choice(WORDS)],
+                possible_means=rng.random() < 0.2, default_location=self.choice(location_ids),
+                default_owner=self.choice(character_ids), clue_potential=self.choice(get_args(schemas.CluePotential)),
+                condition=self.choice(get_args(schemas.ItemCondition)))
+        world.sleuth = schemas.Sleuth(character_id="sleuth", full_name=self.name(), city="Neo-Kyoto",
+                                      biography=self.sentence(40), relationships=self.links(character_ids))
+        return world
+
+    def interviews(self, clue_ids: List[str], count: int) -> List[schemas.InterviewQuestion]:
+        questions = []
+        for q in range(count):
+            is_lie = self.rng.random() < 0.3
+            answer = schemas.InterviewAnswer(answer_id=f"a{q}", answer=self.sentence(12), is_lie=is_lie,
+                                             debunking_clue=self.choice(clue_ids) if is_lie else None)
+            questions.append(schemas.InterviewQuestion(question_id=f"q{q}", question=self.sentence(8), answer=answer))
+        return questions
+
+    def case(self, world: schemas.WorldData, victim: str, clues: int = 100, suspects: int = 6, locations: int = 5) -> schemas.CaseFile:
+        rng = self.rng
+        character_ids = list(world.characters)
+        location_ids = list(world.locations)
+        item_ids = list(world.items)
+        clue_ids = [f"clue_{i:05d}" for i in range(clues)]
+        suspect_ids = rng.sample(character_ids, min(suspects, len(character_ids)))
+        case_location_ids = rng.sample(location_ids, min(locations, len(location_ids)))
+
+        case = schemas.CaseFile()
+        case.case_meta = schemas.CaseMeta(
+            victim=victim, culprit=self.choice(suspect_ids), crime_scene=self.choice(case_location_ids),
+            murder_weapon=self.choice(item_ids), means_clue=self.choice(clue_ids), motive_clue=self.choice(clue_ids),
+            opportunity_clue=self.choice(clue_ids), red_herring_clues=self.links(clue_ids),
+            core_mystery_solution_details=self.sentence(30), opening_monologue=self.sentence(30))
+        for i, clue_id in enumerate(clue_ids):
+            earlier = clue_ids[:i]
+            case.clues.append(schemas.Clue(
+                clue_id=clue_id, critical_clue=rng.random() < 0.1, character_implicated=self.choice(suspect_ids),
+                red_herring=rng.random() < 0.15, source=self.sentence(4), clue_summary=self.sentence(10),
+                dependencies=self.links(earlier[-50:]), reveals_unlocks=self.links(case_location_ids + suspect_ids),
+                associated_item=self.choice(item_ids) if rng.random() < 0.3 else None,
+                associated_location=self.choice(case_location_ids), associated_character=self.choice(suspect_ids)))
+        case.key_suspects = [schemas.CaseSuspect(character_id=s, interviews=self.interviews(clue_ids, 6)) for s in suspect_ids]
+        for location_id in case_location_ids:
+            witnesses = [schemas.CaseWitness(character_id=w, interviews=self.interviews(clue_ids, 3))
+                         for w in rng.sample(character_ids, min(2, len(character_ids)))]
+            case.locations.append(schemas.CaseLocation(location_id=location_id, location_clues=self.links(clue_ids), witnesses=witnesses))
+        return case
+
+    def cases(self, world: schemas.WorldData, count: int = 10, clues: int = 100) -> Dict[str, schemas.CaseFile]:
+        """Cases keyed by victim id, as DataManager keys them; every case has a different victim."""
+        victims = self.rng.sample(list(world.characters), min(count, len(world.characters)))
+        return {victim: self.case(world, victim, clues) for victim in victims}
+
+def write_data_dir(path: str, world: schemas.WorldData, cases: Dict[str, schemas.CaseFile]):
+    """Writes world.json and cases/<victim>.json in the layout DataManager reads."""
+    os.makedirs(os.path.join(path, "cases"), exist_ok=True)
+    with open(os.path.join(path, "world.json"), "w", encoding="utf-8") as f:
+        json.dump(asdict(world), f)
+    for case_id, case in cases.items():
+        with open(os.path.join(path, "cases", f"{case_id}.json"), "w", encoding="utf-8") as f:
+            json.dump(asdict(case), f)
+
+def main():
+    parser = argparse.ArgumentParser(description="Generate a synthetic data directory.")
+    parser.add_argument("--output", required=True, help="Directory to write world.json and cases/ into.")
+    parser.add_argument("--preset", choices=sorted(PRESETS), default="small")
+    for key in PRESETS["small"]:
+        parser.add_argument(f"--{key}", type=int, help=f"Overrides the preset's {key} count.")
+    parser.add_argument("--links", type=float, default=3.0, help="Average ids per reference list.")
+    parser.add_argument("--seed", type=int, default=7)
+    args = parser.parse_args()
+
+    sizes = dict(PRESETS[args.preset])
+    sizes.update({key: getattr(args, key) for key in sizes if getattr(args, key) is not None})
+    generator = Generator(args.seed, args.links)
+    world = generator.world(sizes["characters"], sizes["locations"], sizes["factions"], sizes["items"], sizes["districts"])
+    cases = generator.cases(world, sizes["cases"], sizes["clues"])
+    write_data_dir(args.output, world, cases)
+    print(f"Wrote {sizes} to {args.output}")
+
+if __name__ == "__main__":
+    main()
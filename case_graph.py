@@ -0,0 +1,226 @@
+# case_graph.py
+# Derives the plot-graph relationships of a case from the case and world data.
+
+from dataclasses import dataclass
+from typing import Dict, List, Literal, Optional, Set, Tuple, get_args
+import schemas
+
+# --- Type Definitions for Relationships ---
+
+RelationType = Literal["Dependency", "Unlocks", "Debunks", "Association", "Testimony"]
+RELATION_TYPES = get_args(RelationType)
+
+@dataclass(frozen=True)
+class CaseEdge:
+    """A derived connection between two board nodes."""
+    relation: RelationType
+    start_node: str # Board node key
+    end_node: str # Board node key
+
+def node_key(kind: str, entity_id: str) -> str:
+    """Returns the board node key of an entity, e.g. "clue:<clue_id>"."""
+    return f"{kind}:{entity_id}"
+
+# --- Edge Index ---
+
+class CaseEdgeIndex:
+    """
+    Holds the derived edges of one case, grouped by the record that produced them,
+    so a single clue can be re-derived without walking the rest of the case.
+    """
+    def __init__(self, case_file: schemas.CaseFile, world_data: schemas.WorldData):
+        self.world_data = world_data
+        self._clue_ids: Set[str] = set()
+        self._edges_by_source: Dict[str, Set[CaseEdge]] = {} # Source key -> edges it produced
+        self._unresolved: Dict[str, Set[str]] = {} # Unknown reveals_unlocks id -> clue ids referencing it
+        self._clue_targets: Dict[str, Set[str]] = {} # Clue id -> reveals_unlocks ids it is filed under in _unresolved or _revealed_by
+        self._revealed_by: Dict[str, Set[str]] = {} # Clue id -> clue ids whose reveals_unlocks resolved to it
+        self._signatures: Dict[str, tuple] = {} # Clue id -> the fields its edges were derived from
+        self._clues: Dict[str, schemas.Clue] = {}
+        self.rebuild(case_file)
+
+    def rebuild(self, case_file: schemas.CaseFile):
+        """Derives every edge of the case in a single pass."""
+        self._clues = {clue.clue_id: clue for clue in case_file.clues}
+        self._clue_ids = set(self._clues)
+        self._edges_by_source.clear()
+        self._unresolved.clear()
+        self._clue_targets.clear()
+        self._revealed_by.clear()
+        self._signatures.clear()
+
+        for clue in case_file.clues:
+            self._edges_by_source[node_key("clue", clue.clue_id)] = self._derive_clue_edges(clue)
+        for source, edges in self._derive_interviews(case_file).items():
+            self._edges_by_source.setdefault(source, set()).update(edges)
+
+    def edges(self) -> List[CaseEdge]:
+        return [edge for edges in self._edges_by_source.values() for edge in edges]
+
+    def sync(self, case_file: schemas.CaseFile) -> Tuple[Set[CaseEdge], Set[CaseEdge]]:
+        """
+        Brings the index up to date with a saved case. Only clues that were added,
+        removed or whose linking fields changed are re-derived; the interview edges,
+        a handful per interviewee, are derived again and compared. Returns (added, removed).
+        """
+        added, removed = set(), set()
+
+        def merge(change):
+            # An edge removed and then added again (or the reverse) is no change at all
+            change_added, change_removed = change
+            for edge in change_removed:
+                if edge in added:
+                    added.discard(edge)
+                else:
+                    removed.add(edge)
+            for edge in change_added:
+                if edge in removed:
+                    removed.discard(edge)
+                else:
+                    added.add(edge)
+
+        changed, removed_ids = self.stale_clues(case_file)
+        for clue_id in removed_ids:
+            merge(self.remove_clue(clue_id))
+        for clue in changed:
+            merge(self.update_clue(clue))
+        merge(self.sync_interviews(case_file))
+        return added, removed
+
+    def stale_clues(self, case_file: schemas.CaseFile) -> Tuple[List[schemas.Clue], List[str]]:
+        """The clues of a saved case that are new or whose linking fields changed, and the ids of the clues it no longer has."""
+        clues = {clue.clue_id: clue for clue in case_file.clues}
+        removed = [clue_id for clue_id in self._clues if clue_id not in clues]
+        changed = [clue for clue_id, clue in clues.items()
+                   if self._clues.get(clue_id) is not clue or self._signatures.get(clue_id) != _clue_signature(clue)]
+        return changed, removed
+
+    def sync_interviews(self, case_file: schemas.CaseFile) -> Tuple[Set[CaseEdge], Set[CaseEdge]]:
+        """Derives the interview edges again and keeps the ones that differ. Returns (added, removed)."""
+        added, removed = set(), set()
+        interview_edges = self._derive_interviews(case_file)
+        for source in [source for source in self._edges_by_source if source.startswith("interviews:")]:
+            if source not in interview_edges:
+                removed |= self._edges_by_source.pop(source)
+        for source, new_edges in interview_edges.items():
+            old_edges = self._edges_by_source.get(source, set())
+            if new_edges != old_edges:
+                self._edges_by_source[source] = new_edges
+                added |= new_edges - old_edges
+                removed |= old_edges - new_edges
+        return added - removed, removed - added
+
+    def update_clue(self, clue: schemas.Clue) -> Tuple[Set[CaseEdge], Set[CaseEdge]]:
+        """Re-derives the edges of one added or edited clue. Returns (added, removed)."""
+        is_new = clue.clue_id not in self._clue_ids
+        self._clues[clue.clue_id] = clue
+        self._clue_ids.add(clue.clue_id)
+
+        sources = [clue]
+        if is_new:
+            # Clues that reveal this id could not resolve it until now
+            sources.extend(self._clues[clue_id] for clue_id in self._unresolved.pop(clue.clue_id, ()) if clue_id in self._clues)
+        return self._rederive(sources)
+
+    def remove_clue(self, clue_id: str) -> Tuple[Set[CaseEdge], Set[CaseEdge]]:
+        """
+        Forgets a deleted clue. Clues that revealed it are re-derived, their Unlocks
+        edge to it becoming unresolved. Returns (added, removed).
+        """
+        self._clue_ids.discard(clue_id)
+        self._clues.pop(clue_id, None)
+        self._signatures.pop(clue_id, None)
+        self._forget_reveals(clue_id)
+        removed = self._edges_by_source.pop(node_key("clue", clue_id), set())
+        revealers = [self._clues[revealer] for revealer in self._revealed_by.pop(clue_id, ()) if revealer in self._clues]
+        added, rederived_removed = self._rederive(revealers)
+        return added, removed | rederived_removed
+
+    def _rederive(self, clues) -> Tuple[Set[CaseEdge], Set[CaseEdge]]:
+        added, removed = set(), set()
+        for clue in clues:
+            self._forget_reveals(clue.clue_id)
+            source = node_key("clue", clue.clue_id)
+            old_edges = self._edges_by_source.get(source, set())
+            new_edges = self._derive_clue_edges(clue)
+            self._edges_by_source[source] = new_edges
+            added |= new_edges - old_edges
+            removed |= old_edges - new_edges
+        return added - removed, removed - added
+
+    def _forget_reveals(self, clue_id: str):
+        """Drops what a clue's reveals_unlocks recorded, before it is derived again or removed."""
+        for target_id in self._clue_targets.pop(clue_id, ()):
+            for index in (self._unresolved, self._revealed_by):
+                clue_ids = index.get(target_id)
+                if clue_ids is not None:
+                    clue_ids.discard(clue_id)
+                    if not clue_ids:
+                        del index[target_id]
+
+    # --- Derivation ---
+
+    def _derive_clue_edges(self, clue: schemas.Clue) -> Set[CaseEdge]:
+        source = node_key("clue", clue.clue_id)
+        self._signatures[clue.clue_id] = _clue_signature(clue)
+        edges = set()
+        for dependency_id in clue.dependencies:
+            edges.add(CaseEdge("Dependency", node_key("clue", dependency_id), source))
+        for target_id in clue.reveals_unlocks:
+            target = self._resolve(target_id)
+            if target:
+                edges.add(CaseEdge("Unlocks", source, target))
+                if target_id in self._clue_ids:
+                    self._revealed_by.setdefault(target_id, set()).add(clue.clue_id)
+                    self._clue_targets.setdefault(clue.clue_id, set()).add(target_id)
+            else:
+                self._unresolved.setdefault(target_id, set()).add(clue.clue_id)
+                self._clue_targets.setdefault(clue.clue_id, set()).add(target_id)
+        if clue.debunking_clue:
+            edges.add(CaseEdge("Debunks", node_key("clue", clue.debunking_clue), source))
+        if clue.associated_character:
+            edges.add(CaseEdge("Association", source, node_key("character", clue.associated_character)))
+        if clue.associated_location:
+            edges.add(CaseEdge("Association", source, node_key("location", clue.associated_location)))
+        if clue.associated_item:
+            edges.add(CaseEdge("Association", source, node_key("item", clue.associated_item)))
+        return edges
+
+    def _derive_interviews(self, case_file: schemas.CaseFile) -> Dict[str, Set[CaseEdge]]:
+        """The edges of every suspect's and witness's interviews, by source key."""
+        interviewees = list(case_file.key_suspects)
+        for location in case_file.locations:
+            interviewees.extend(location.witnesses)
+        edges_by_source = {}
+        for interviewee in interviewees:
+            source = node_key("interviews", interviewee.character_id)
+            edges_by_source.setdefault(source, set()).update(self._derive_interview_edges(interviewee))
+        return edges_by_source
+
+    def _derive_interview_edges(self, interviewee: schemas.CaseSuspect) -> Set[CaseEdge]:
+        character = node_key("character", interviewee.character_id)
+        edges = set()
+        for interview in interviewee.interviews:
+            answer = interview.answer
+            if answer.clue_id:
+                edges.add(CaseEdge("Testimony", character, node_key("clue", answer.clue_id)))
+            if answer.is_lie and answer.debunking_clue:
+                edges.add(CaseEdge("Debunks", node_key("clue", answer.debunking_clue), character))
+        return edges
+
+    def _resolve(self, entity_id: str) -> Optional[str]:
+        """Finds the node key of an id from reveals_unlocks, which may name any entity type."""
+        if entity_id in self._clue_ids:
+            return node_key("clue", entity_id)
+        if entity_id in self.world_data.locations:
+            return node_key("location", entity_id)
+        if entity_id in self.world_data.items:
+            return node_key("item", entity_id)
+        if entity_id in self.world_data.characters:
+            return node_key("character", entity_id)
+        return None
+
+def _clue_signature(clue: schemas.Clue) -> tuple:
+    """The fields of a clue that its edges depend on, to tell whether a saved clue needs re-deriving."""
+    return (tuple(clue.dependencies), tuple(clue.reveals_unlocks), clue.debunking_clue,
+            clue.associated_character, clue.associated_location, clue.associated_item)
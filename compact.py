@@ -0,0 +1,90 @@
+# compact.py
+# A memory-lean layout for the schema dataclasses: slots instead of a per-instance
+# __dict__, one shared empty tuple for every loaded list field that holds nothing
+# until it is read, and interned id strings.
+#
+# Set AGENCY_COMPACT=0 to get plain dataclasses, e.g. to compare memory use with
+# benchmarks/bench_memory.py.
+
+import os
+import sys
+from dataclasses import dataclass, fields
+from typing import get_args, get_origin
+
+ENABLED = os.environ.get("AGENCY_COMPACT", "1") != "0"
+EMPTY = () # Stored by the decoder in place of every empty list
+
+class LazyListField:
+    """
+    Data descriptor wrapping the slot of a list field. A slot holding the shared EMPTY
+    tuple is given its own list the first time the field is read, and that list is
+    returned from then on, so references to it alias the field like any list
+    attribute. Assigned values are stored as they are.
+    """
+    __slots__ = ("slot",)
+
+    def __init__(self, slot):
+        self.slot = slot
+
+    def __get__(self, obj, objtype=None):
+        if obj is None:
+            return self
+        value = self.slot.__get__(obj, objtype)
+        if value is EMPTY:
+            value = []
+            self.slot.__set__(obj, value)
+        return value
+
+    def __set__(self, obj, value):
+        self.slot.__set__(obj, value)
+
+def share_empty(value):
+    """What a decoder should assign to a list field: EMPTY in place of an empty list."""
+    return EMPTY if ENABLED and type(value) is list and not value else value
+
+def peek(obj, name):
+    """
+    Reads a field without giving a shared empty list field a list of its own, for
+    read-only passes over every entity (encoding, indexing). The value must not be
+    changed: it may be the EMPTY tuple.
+    """
+    descriptor = type(obj).__dict__.get(name)
+    if type(descriptor) is LazyListField:
+        return descriptor.slot.__get__(obj, type(obj))
+    return getattr(obj, name)
+
+def intern_value(value):
+    """Interns a string, or every string in a list; other values are returned as they are."""
+    if not ENABLED:
+        return value
+    if type(value) is str:
+        return sys.intern(value)
+    if type(value) is list:
+        return [sys.intern(v) if type(v) is str else v for v in value]
+    return value
+
+def is_reference(field_name, field_type) -> bool:
+    """
+    Whether a field holds ids or short enumerated values worth interning: *_id fields,
+    optional strings and literals (character_id, Gender, ...) and lists of strings.
+    Free text fields such as biography are left alone.
+    """
+    if field_name.endswith("_id"):
+        return True
+    origin = get_origin(field_type)
+    if origin is list:
+        return get_args(field_type)[0] is str or get_origin(get_args(field_type)[0]) is not None
+    return origin is not None and type(None) in get_args(field_type)
+
+def entity(cls):
+    """
+    @dataclass for the schemas. When compaction is enabled the class is slotted and
+    its list fields can share EMPTY until they are first read; see LazyListField.
+    """
+    if not ENABLED:
+        return dataclass(cls)
+    cls = dataclass(slots=True)(cls)
+    for f in fields(cls):
+        if get_origin(f.type) is list and f.name in cls.__dict__:
+            setattr(cls, f.name, LazyListField(cls.__dict__[f.name]))
+    return cls
@@ -0,0 +1,30 @@
+# core/__init__.py
+# The Qt-free data layer: loading and saving, undo history, the JSON codec, validation,
+# background file I/O, columnar queries, suspect ranking and instrumentation.
+# Submodules are imported on first use, so "import core" stays cheap for scripts.
+
+import importlib
+
+_EXPORTS = {
+    "DataManager": "core.data",
+    "DataclassJSONEncoder": "core.codec",
+    "from_dict_to_dataclass": "core.codec",
+    "validate_project": "core.validation",
+    "ColumnStore": "core.columns",
+    "RankingEngine": "core.ranking",
+    "History": "core.history",
+    "IOExecutor": "core.io",
+    "profiler": "core.instrumentation",
+}
+
+__all__ = list(_EXPORTS)
+
+def __getattr__(name):
+    if name not in _EXPORTS:
+        raise AttributeError(f"module 'core' has no attribute '{name}'")
+    value = getattr(importlib.import_module(_EXPORTS[name]), name)
+    globals()[name] = value # Later lookups skip __getattr__
+    return value
+
+def __dir__():
+    return sorted(list(globals()) + __all__)
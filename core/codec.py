@@ -0,0 +1,67 @@
+# core/codec.py
+# Converts between the schema dataclasses and their JSON form.
+
+import json
+from dataclasses import is_dataclass, fields, replace
+from typing import get_args
+import compact
+
+# --- Enhanced JSON Encoder for Dataclasses ---
+class DataclassJSONEncoder(json.JSONEncoder):
+    def default(self, o):
+        if is_dataclass(o):
+            return to_plain(o)
+        return super().default(o)
+
+def to_plain(o):
+    """
+    dataclasses.asdict() that reads fields with compact.peek(), leaving shared empty
+    lists shared. Containers are copied before they are walked (a single step under
+    the GIL), so it can run on another thread while the data is being edited.
+    """
+    if is_dataclass(o):
+        return {f.name: to_plain(compact.peek(o, f.name)) for f in fields(o)}
+    if isinstance(o, (list, tuple)):
+        return [to_plain(v) for v in list(o)]
+    if isinstance(o, dict):
+        return {k: to_plain(v) for k, v in list(o.items())}
+    return o
+
+def snapshot(o):
+    """
+    A copy of a dataclass with its list and dict fields copied one level deep, cheap
+    enough to take on the GUI thread before encoding elsewhere: which assets, clues,
+    suspects, ... exist is fixed, while the records themselves are shared.
+    """
+    copies = {}
+    for f in fields(o):
+        value = compact.peek(o, f.name)
+        if isinstance(value, (list, dict)):
+            copies[f.name] = value.copy()
+        elif value is compact.EMPTY:
+            copies[f.name] = value # Passed on, so replace() doesn't read the field and give it a list
+    return replace(o, **copies)
+
+# --- Data Reconstruction Helper ---
+def from_dict_to_dataclass(cls, data):
+    if not isinstance(data, dict): return data
+    field_types = {f.name: f.type for f in fields(cls)}
+    kwargs = {}
+    for f_name, f_type in field_types.items():
+        if f_name in data:
+            val = data[f_name]
+            if compact.is_reference(f_name, f_type):
+                val = compact.intern_value(val) # Ids repeat across every reference to them
+            origin = getattr(f_type, '__origin__', None)
+            if origin is list and val is not None:
+                item_type = get_args(f_type)[0]
+                val = [from_dict_to_dataclass(item_type, i) for i in val] if is_dataclass(item_type) else val
+                kwargs[f_name] = compact.share_empty(val)
+            elif origin is dict and val is not None:
+                key_type, value_type = get_args(f_type)
+                kwargs[f_name] = {compact.intern_value(key_type(k)): from_dict_to_dataclass(value_type, v) for k, v in val.items()} if is_dataclass(value_type) else val
+            elif is_dataclass(f_type) and val is not None:
+                kwargs[f_name] = from_dict_to_dataclass(f_type, val)
+            else:
+                kwargs[f_name] = val
+    return cls(**kwargs)
@@ -0,0 +1,190 @@
+# core/columns.py
+# Columnar NumPy copies of the numeric and categorical world fields, for vectorized
+# filters, facet counts and histograms over whole asset types.
+
+import math
+from typing import Dict, Iterable, List, Optional
+
+import numpy as np
+
+from core.instrumentation import profiler
+
+# Columns kept per asset type. Numeric columns are float64 with NaN for unset values;
+# categorical ones are int32 codes into a per-column list of values, with -1 for None.
+COLUMNS = {
+    "characters": {
+        "numeric": ("age", "honesty", "victim_likelihood", "killer_likelihood"),
+        "categorical": ("district", "faction", "gender", "wealth_class", "alignment"),
+    },
+    "locations": {
+        "numeric": ("danger_level", "population"),
+        "categorical": ("district", "owning_faction", "accessibility", "type"),
+    },
+    "items": {
+        "numeric": (),
+        "categorical": ("type", "condition", "clue_potential", "default_location", "default_owner"),
+    },
+}
+MIN_CAPACITY = 64
+
+class ColumnTable:
+    """
+    The columns of one asset type. Rows are appended as assets appear and are never
+    reused; a removed asset only clears its row in the alive mask, so row numbers stay
+    valid for the arrays already handed out.
+    """
+    def __init__(self, numeric: Iterable[str], categorical: Iterable[str]):
+        self.ids: List[str] = []
+        self.rows: Dict[str, int] = {}
+        self.alive = np.zeros(MIN_CAPACITY, dtype=bool)
+        self.numeric = {name: np.full(MIN_CAPACITY, np.nan) for name in numeric}
+        self.codes = {name: np.full(MIN_CAPACITY, -1, dtype=np.int32) for name in categorical}
+        self.categories: Dict[str, list] = {name: [] for name in categorical} # Code -> value
+        self._category_codes: Dict[str, dict] = {name: {} for name in categorical} # Value -> code
+
+    def __len__(self):
+        return int(self.alive[:len(self.ids)].sum())
+
+    def _grow(self, needed):
+        capacity = len(self.alive)
+        if needed <= capacity:
+            return
+        while capacity < needed:
+            capacity *= 2
+        extra = capacity - len(self.alive)
+        self.alive = np.concatenate([self.alive, np.zeros(extra, dtype=bool)])
+        for name, column in self.numeric.items():
+            self.numeric[name] = np.concatenate([column, np.full(extra, np.nan)])
+        for name, column in self.codes.items():
+            self.codes[name] = np.concatenate([column, np.full(extra, -1, dtype=np.int32)])
+
+    def code_of(self, column: str, value) -> int:
+        """The code of a category value, adding the value if it is new. None is -1."""
+        if value is None:
+            return -1
+        codes = self._category_codes[column]
+        code = codes.get(value)
+        if code is None:
+            code = codes[value] = len(self.categories[column])
+            self.categories[column].append(value)
+        return code
+
+    def find_code(self, column: str, value) -> Optional[int]:
+        """The code of a category value without adding it: -1 for None, None if the value never occurs."""
+        return -1 if value is None else self._category_codes[column].get(value)
+
+    def set(self, asset_id: str, asset):
+        row = self.rows.get(asset_id)
+        if row is None:
+            row = self.rows[asset_id] = len(self.ids)
+            self.ids.append(asset_id)
+            self._grow(len(self.ids))
+        self.alive[row] = True
+        for name, column in self.numeric.items():
+            value = getattr(asset, name)
+            column[row] = value if isinstance(value, (int, float)) else math.nan
+        for name, column in self.codes.items():
+            column[row] = self.code_of(name, getattr(asset, name))
+
+    def extend(self, assets):
+        """Bulk form of set() for (asset_id, asset) pairs of new assets: each column is filled in one go."""
+        assets = [(asset_id, asset) for asset_id, asset in assets if asset_id not in self.rows]
+        start = len(self.ids)
+        for offset, (asset_id, _) in enumerate(assets):
+            self.rows[asset_id] = start + offset
+            self.ids.append(asset_id)
+        self._grow(len(self.ids))
+        end = len(self.ids)
+        self.alive[start:end] = True
+        for name, column in self.numeric.items():
+            values = (getattr(asset, name) for _, asset in assets)
+            column[start:end] = [value if isinstance(value, (int, float)) else math.nan for value in values]
+        code_of = self.code_of
+        for name, column in self.codes.items():
+            column[start:end] = [code_of(name, getattr(asset, name)) for _, asset in assets]
+
+    def remove(self, asset_id: str):
+        row = self.rows.get(asset_id)
+        if row is not None:
+            self.alive[row] = False
+
+    # --- Queries ---
+
+    def mask(self, **criteria) -> np.ndarray:
+        """
+        Rows of live assets matching every criterion. A numeric column takes a
+        (minimum, maximum) pair, either end None for open; a categorical column takes
+        one value or a list of values, where None matches unset fields.
+        """
+        count = len(self.ids)
+        mask = self.alive[:count].copy()
+        for name, wanted in criteria.items():
+            if name in self.numeric:
+                low, high = wanted
+                column = self.numeric[name][:count]
+                if low is not None:
+                    mask &= column >= low
+                if high is not None:
+                    mask &= column <= high
+            elif name in self.codes:
+                values = wanted if isinstance(wanted, (list, tuple, set, frozenset)) else [wanted]
+                known = self._category_codes[name]
+                codes = [-1 if value is None else known[value] for value in values if value is None or value in known]
+                mask &= np.isin(self.codes[name][:count], codes)
+            else:
+                raise KeyError(f"No column '{name}'")
+        return mask
+
+    def filter(self, **criteria) -> List[str]:
+        """Ids of the assets matching mask(**criteria), in the order they were added."""
+        return [self.ids[row] for row in np.flatnonzero(self.mask(**criteria))]
+
+    def facet_counts(self, column: str, mask: Optional[np.ndarray] = None) -> Dict[object, int]:
+        """{value: number of rows} for a categorical column, within mask if given. Unset values count under None."""
+        if mask is None:
+            mask = self.alive[:len(self.ids)]
+        codes = self.codes[column][:len(mask)][mask]
+        counts = np.bincount(codes + 1, minlength=len(self.categories[column]) + 1)
+        values = [None] + self.categories[column]
+        return {values[code]: int(n) for code, n in enumerate(counts) if n}
+
+    def histogram(self, column: str, bins: int = 10, value_range=None, mask: Optional[np.ndarray] = None):
+        """(counts, bin edges) of a numeric column's set values, within mask if given."""
+        if mask is None:
+            mask = self.alive[:len(self.ids)]
+        values = self.numeric[column][:len(mask)][mask]
+        return np.histogram(values[~np.isnan(values)], bins=bins, range=value_range)
+
+class ColumnStore:
+    """
+    The column tables of a world, built per asset type on first use and then kept in
+    sync through DataManager's save listener.
+    """
+    def __init__(self, world_data):
+        self.world_data = world_data
+        self._tables: Dict[str, ColumnTable] = {}
+
+    def table(self, asset_type: str) -> ColumnTable:
+        table = self._tables.get(asset_type)
+        if table is None:
+            with profiler.span(f"columns.build.{asset_type}", "columns"):
+                table = ColumnTable(**COLUMNS[asset_type])
+                table.extend(getattr(self.world_data, asset_type).items())
+            self._tables[asset_type] = table
+        return table
+
+    def on_data_saved(self, kind, keys):
+        if kind != "world":
+            return
+        if keys is None:
+            self._tables.clear() # Rebuilt on next use
+            return
+        for asset_type, asset_id in keys:
+            table = self._tables.get(asset_type)
+            if table is None:
+                continue
+            asset = getattr(self.world_data, asset_type).get(asset_id)
+            if asset is None:
+                table.remove(asset_id)
+            else:
+                table.set(asset_id, asset)
@@ -0,0 +1,188 @@
+# core/data.py
+# Loads and saves the world and case files.
+
+import json
+import logging
+import os
+import uuid
+from concurrent.futures import as_completed
+import schemas
+from asset_store import ImageStore
+from core.codec import DataclassJSONEncoder, from_dict_to_dataclass, snapshot
+from core.history import History
+from core.instrumentation import profiler
+from core.io import IOExecutor, read_text, write_text
+
+logger = logging.getLogger(__name__)
+
+class DataManager:
+    """
+    Abstracts all file I/O. Responsible for reading/writing case files.
+    This would be replaced by a database interaction layer in a production build.
+
+    Files are read and written on an IOExecutor. Loads wait for their reads, since the
+    data is needed to go on (the app loads on a worker thread). Saves take a shallow
+    snapshot on the calling thread and return the Future of a job that encodes and
+    writes it. A record edited while its save is being encoded may be written with the
+    edit, which the save that follows the edit writes anyway.
+
+    A DataManager that creates its own IOExecutor shuts it down in close(); it can be
+    used as a context manager.
+    """
+    def __init__(self, base_path="data", progress=None, io=None):
+        self.base_path = base_path
+        self.world_data_path = os.path.join(self.base_path, "world.json")
+        self.cases_path = os.path.join(self.base_path, "cases")
+        self._owns_io = io is None
+        self.io = io or IOExecutor()
+        self.write_listeners = [] # Called with the Future of every write as it is submitted
+        self.world_data = self.load_world_data()
+        self.case_files = self.load_all_cases(progress)
+        self.image_store = ImageStore(os.path.join(self.base_path, "images"))
+        self.listeners = [] # Called as listener(kind, keys) after every save
+        self.history = History(self) # Undo/redo of edits made through it
+        self._columns = None
+        self._ranking = None
+
+    @property
+    def columns(self):
+        """The world's ColumnStore, built on first use (it needs NumPy) and kept in sync with saves."""
+        if self._columns is None:
+            from core.columns import ColumnStore
+            self._columns = ColumnStore(self.world_data)
+            self.add_listener(self._columns.on_data_saved)
+        return self._columns
+
+    @property
+    def ranking(self):
+        """The world's suspect and victim RankingEngine, created on first use."""
+        if self._ranking is None:
+            from core.ranking import RankingEngine
+            self._ranking = RankingEngine(self)
+        return self._ranking
+
+    @profiler.timed("data.load_world", "io")
+    def load_world_data(self):
+        os.makedirs(self.base_path, exist_ok=True)
+        if os.path.exists(self.world_data_path):
+            try:
+                return self.io.submit(self.world_data_path, _read_asset, schemas.WorldData, self.world_data_path).result()
+            except Exception as e:
+                logger.error(f"Failed to load world data: {e}")
+        return schemas.WorldData()
+
+    def add_listener(self, listener):
+        """
+        Registers a callback for saves. It is called as listener("world", changed) with
+        the saved [(asset_type, asset_id)] pairs, or None if any world data may have
+        changed, and as listener("case", [case_id]) after a case is saved.
+        """
+        self.listeners.append(listener)
+
+    def notify_listeners(self, kind, keys):
+        for listener in self.listeners:
+            try:
+                listener(kind, keys)
+            except Exception as e:
+                logger.error(f"Save listener failed: {e}")
+
+    def _write(self, path, obj, description):
+        """Snapshots obj now and encodes and writes it on the IOExecutor; failures are logged when the write finishes."""
+        future = self.io.submit(path, _encode_and_write, path, snapshot(obj))
+
+        def log_failure(done):
+            if done.exception() is not None:
+                logger.error(f"Failed to save {description}: {done.exception()}")
+        future.add_done_callback(log_failure)
+        for listener in self.write_listeners:
+            listener(future)
+        return future
+
+    @profiler.timed("data.save_world", "io")
+    def save_world_data(self, changed=None):
+        """Saves the world file. Returns the write's Future, or None if the data could not be snapshotted."""
+        future = None
+        try:
+            future = self._write(self.world_data_path, self.world_data, "world data")
+        except Exception as e:
+            logger.error(f"Failed to save world data: {e}")
+        self.notify_listeners("world", changed)
+        return future
+
+    @profiler.timed("data.load_cases", "io")
+    def load_all_cases(self, progress=None):
+        """
+        Loads every case file, several at a time, calling progress(files done, total
+        files) as they finish. Cases keep the directory's file order.
+        """
+        os.makedirs(self.cases_path, exist_ok=True)
+        filenames = [filename for filename in os.listdir(self.cases_path) if filename.endswith(".json")]
+        if progress is not None:
+            progress(0, len(filenames))
+        futures = {}
+        for filename in filenames:
+            path = os.path.join(self.cases_path, filename)
+            futures[self.io.submit(path, _read_asset, schemas.CaseFile, path)] = filename
+        for done, future in enumerate(as_completed(futures), 1):
+            if future.exception() is not None:
+                logger.error(f"Failed to load case file {futures[future]}: {future.exception()}")
+            if progress is not None:
+                progress(done, len(filenames))
+        cases = {}
+        for future in futures:
+            if future.exception() is None:
+                case_obj = future.result()
+                cases[case_obj.case_meta.victim] = case_obj
+        return cases
+
+    @profiler.timed("data.save_case", "io")
+    def save_case(self, case_obj):
+        """Saves a case file. Returns the write's Future, or None if the case could not be snapshotted."""
+        case_id = case_obj.case_meta.victim or f"case_{uuid.uuid4().hex[:8]}"
+        path = os.path.join(self.cases_path, f"{case_id}.json")
+        future = None
+        try:
+            future = self._write(path, case_obj, f"case {case_id}")
+            self.case_files[case_id] = case_obj
+        except Exception as e:
+            logger.error(f"Failed to save case {case_id}: {e}")
+        self.notify_listeners("case", [case_id])
+        return future
+
+    def flush(self, timeout=None):
+        """Waits for the writes still in flight, e.g. before exiting. False if timeout ran out first."""
+        return self.io.flush(timeout)
+
+    def close(self):
+        """Waits for the pending writes and, if this DataManager created its IOExecutor, shuts it down."""
+        if self._owns_io:
+            self.io.shutdown()
+        else:
+            self.flush()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+    def data_file_paths(self):
+        """The world file and every case file, e.g. for checking whether derived caches are stale."""
+        paths = [self.world_data_path]
+        if os.path.isdir(self.cases_path):
+            paths.extend(os.path.join(self.cases_path, name) for name in sorted(os.listdir(self.cases_path)) if name.endswith(".json"))
+        return paths
+
+def _read_asset(cls, path):
+    """Reads and decodes one data file; runs on an IOExecutor thread."""
+    text = read_text(path)
+    with profiler.span("json.parse", "codec"):
+        data = json.loads(text)
+    with profiler.span("codec.decode", "codec"):
+        return from_dict_to_dataclass(cls, data)
+
+def _encode_and_write(path, obj):
+    """Encodes a snapshot and writes it; runs on an IOExecutor thread."""
+    with profiler.span("codec.encode", "codec"):
+        text = json.dumps(obj, indent=4, cls=DataclassJSONEncoder)
+    write_text(path, text)
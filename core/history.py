@@ -0,0 +1,147 @@
+# core/history.py
+# Undo/redo of edits to the world and case data, recorded as field-level changes.
+
+import sys
+from collections import deque
+from dataclasses import dataclass, fields, is_dataclass
+from typing import Any, Callable, List, Optional, Tuple
+
+DEFAULT_BUDGET_BYTES = 32 * 2**20 # History kept, estimated; the oldest edits are forgotten beyond it
+
+def estimate_size(value, depth: int = 3) -> int:
+    """
+    Roughly how many bytes a recorded value keeps alive: strings, lists and dicts are
+    followed, dataclasses (e.g. an inserted asset) a few levels deep.
+    """
+    size = sys.getsizeof(value)
+    if depth <= 0 or isinstance(value, (str, bytes, int, float, bool)) or value is None:
+        return size
+    if isinstance(value, (list, tuple, set, frozenset)):
+        return size + sum(estimate_size(v, depth - 1) for v in value)
+    if isinstance(value, dict):
+        return size + sum(estimate_size(k, 0) + estimate_size(v, depth - 1) for k, v in value.items())
+    if is_dataclass(value):
+        return size + sum(estimate_size(getattr(value, f.name), depth - 1) for f in fields(value))
+    return size
+
+# What a command must save afterwards: ("world", (asset_type, asset_id)) or ("case", case_file)
+SaveKey = Tuple[str, Any]
+
+@dataclass
+class Command:
+    """
+    One undoable edit. Field edits keep the replaced and new values of just the
+    changed fields: the values are shared with the data, not copied. An insert keeps
+    the inserted asset.
+    """
+    label: str
+    key: SaveKey
+    target: Any = None # Object whose fields changed
+    changes: Tuple[Tuple[str, Any, Any], ...] = () # (field, old value, new value)
+    insert: Optional[Tuple[dict, str, Any]] = None # (asset dict, asset id, asset)
+    size: int = 0
+
+    def apply(self, forward: bool):
+        for field_name, old, new in self.changes:
+            setattr(self.target, field_name, new if forward else old)
+        if self.insert is not None:
+            assets, asset_id, asset = self.insert
+            if forward:
+                assets[asset_id] = asset
+            else:
+                assets.pop(asset_id, None)
+
+class History:
+    """
+    Undo and redo stacks over DataManager edits. Every edit goes through
+    set_fields() or insert_asset(); undo() and redo() apply the recorded values and
+    save, which notifies DataManager's listeners as any other save does. The undo
+    stack has no length limit, only a byte budget.
+    """
+    def __init__(self, data_manager, budget_bytes: int = DEFAULT_BUDGET_BYTES):
+        self.data_manager = data_manager
+        self.budget_bytes = budget_bytes
+        self.undo_stack: deque = deque()
+        self.redo_stack: List[Command] = []
+        self.bytes_used = 0
+        self.listeners: List[Callable[[Command], None]] = [] # Called with the command after every undo or redo
+        self.changed_listeners: List[Callable[[], None]] = [] # Called whenever either stack changes
+
+    def set_fields(self, target, changes: dict, key: SaveKey, label: str = "Edit") -> Optional[Command]:
+        """Assigns {field: new value} on target and records the old values. The caller saves as usual."""
+        recorded = tuple((field_name, getattr(target, field_name), value) for field_name, value in changes.items()
+                         if getattr(target, field_name) != value)
+        if not recorded:
+            return None
+        command = Command(label, key, target=target, changes=recorded)
+        command.size = sys.getsizeof(command) + sum(estimate_size(old) + estimate_size(new) for _, old, new in recorded)
+        command.apply(True)
+        self.push(command)
+        return command
+
+    def insert_asset(self, asset_type: str, asset_id: str, asset, label: Optional[str] = None) -> Command:
+        """Adds a new world asset and records it; undoing removes it again. The caller saves as usual."""
+        assets = getattr(self.data_manager.world_data, asset_type)
+        command = Command(label or f"Add {asset_id}", ("world", (asset_type, asset_id)), insert=(assets, asset_id, asset))
+        command.size = sys.getsizeof(command) + estimate_size(asset)
+        command.apply(True)
+        self.push(command)
+        return command
+
+    def push(self, command: Command):
+        self.undo_stack.append(command)
+        self.bytes_used += command.size
+        for dropped in self.redo_stack:
+            self.bytes_used -= dropped.size
+        self.redo_stack.clear()
+        while self.bytes_used > self.budget_bytes and len(self.undo_stack) > 1:
+            self.bytes_used -= self.undo_stack.popleft().size
+        self._notify_changed()
+
+    def can_undo(self) -> bool:
+        return bool(self.undo_stack)
+
+    def can_redo(self) -> bool:
+        return bool(self.redo_stack)
+
+    def undo_label(self) -> Optional[str]:
+        return self.undo_stack[-1].label if self.undo_stack else None
+
+    def redo_label(self) -> Optional[str]:
+        return self.redo_stack[-1].label if self.redo_stack else None
+
+    def undo(self) -> Optional[Command]:
+        if not self.undo_stack:
+            return None
+        command = self.undo_stack.pop()
+        self.redo_stack.append(command)
+        return self._apply(command, False)
+
+    def redo(self) -> Optional[Command]:
+        if not self.redo_stack:
+            return None
+        command = self.redo_stack.pop()
+        self.undo_stack.append(command)
+        return self._apply(command, True)
+
+    def clear(self):
+        self.undo_stack.clear()
+        self.redo_stack.clear()
+        self.bytes_used = 0
+        self._notify_changed()
+
+    def _apply(self, command: Command, forward: bool) -> Command:
+        command.apply(forward)
+        kind, target = command.key
+        if kind == "world":
+            self.data_manager.save_world_data([target])
+        else:
+            self.data_manager.save_case(target)
+        for listener in self.listeners:
+            listener(command)
+        self._notify_changed()
+        return command
+
+    def _notify_changed(self):
+        for listener in self.changed_listeners:
+            listener()
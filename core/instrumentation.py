@@ -0,0 +1,144 @@
+# core/instrumentation.py
+# Timing spans, counters and a frame-time histogram for the hot paths, exportable as a
+# Chrome trace (load the JSON in chrome://tracing or https://ui.perfetto.dev).
+
+import bisect
+import json
+import os
+import threading
+import time
+from collections import deque
+from contextlib import contextmanager
+from functools import wraps
+from typing import Dict, List, Optional
+
+MAX_EVENTS = 100000 # Trace events kept for export; older ones are dropped
+FRAME_WINDOW = 240 # Frames in the rolling histogram
+FRAME_BUCKETS_MS = (4, 8, 16, 33, 50, 100) # Upper bounds of the histogram buckets; the last bucket is open
+
+class SpanStats:
+    __slots__ = ("count", "total_ms", "max_ms")
+
+    def __init__(self):
+        self.count = 0
+        self.total_ms = 0.0
+        self.max_ms = 0.0
+
+    @property
+    def mean_ms(self):
+        return self.total_ms / self.count if self.count else 0.0
+
+class Profiler:
+    """
+    Collects timing spans (aggregated per name and kept as trace events), named
+    counters such as cache hits and misses, and the durations of recent frames.
+    Safe to use from worker threads. Disabled, a span costs one attribute check.
+    """
+    def __init__(self, enabled: bool = True):
+        self.enabled = enabled
+        self.origin = time.perf_counter()
+        self.events = deque(maxlen=MAX_EVENTS) # (name, category, start s, duration s, thread id)
+        self.spans: Dict[str, SpanStats] = {}
+        self.counters: Dict[str, int] = {}
+        self.frames = deque(maxlen=FRAME_WINDOW) # Frame times in ms
+        self._lock = threading.Lock()
+
+    @contextmanager
+    def span(self, name: str, category: str = "app"):
+        if not self.enabled:
+            yield
+            return
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.record(name, category, start, time.perf_counter() - start)
+
+    def timed(self, name: Optional[str] = None, category: str = "app"):
+        """Decorator form of span(), named after the function by default."""
+        def decorate(func):
+            span_name = name or func.__qualname__
+            @wraps(func)
+            def wrapper(*args, **kwargs):
+                with self.span(span_name, category):
+                    return func(*args, **kwargs)
+            return wrapper
+        return decorate
+
+    def record(self, name: str, category: str, start: float, duration: float):
+        duration_ms = duration * 1000
+        with self._lock:
+            self.events.append((name, category, start, duration, threading.get_ident()))
+            stats = self.spans.get(name)
+            if stats is None:
+                stats = self.spans[name] = SpanStats()
+            stats.count += 1
+            stats.total_ms += duration_ms
+            if duration_ms > stats.max_ms:
+                stats.max_ms = duration_ms
+
+    def count(self, name: str, n: int = 1):
+        if self.enabled:
+            with self._lock:
+                self.counters[name] = self.counters.get(name, 0) + n
+
+    def hit(self, cache: str, hit: bool):
+        """Counts a lookup of a named cache as "<cache>.hit" or "<cache>.miss"."""
+        self.count(f"{cache}.hit" if hit else f"{cache}.miss")
+
+    def frame(self, duration_ms: float):
+        if self.enabled:
+            self.frames.append(duration_ms)
+
+    # --- Reports ---
+
+    def frame_summary(self) -> Dict[str, float]:
+        frames = sorted(self.frames)
+        if not frames:
+            return {"frames": 0, "p50_ms": 0.0, "p95_ms": 0.0, "max_ms": 0.0}
+        return {
+            "frames": len(frames),
+            "p50_ms": frames[len(frames) // 2],
+            "p95_ms": frames[min(len(frames) - 1, int(len(frames) * 0.95))],
+            "max_ms": frames[-1],
+        }
+
+    def frame_histogram(self) -> List[int]:
+        """Frame counts per FRAME_BUCKETS_MS bucket, plus one for longer frames."""
+        counts = [0] * (len(FRAME_BUCKETS_MS) + 1)
+        for duration_ms in list(self.frames):
+            counts[bisect.bisect_left(FRAME_BUCKETS_MS, duration_ms)] += 1
+        return counts
+
+    def top_spans(self, limit: int = 10) -> List[tuple]:
+        """(name, stats) pairs with the most total time first."""
+        with self._lock:
+            items = list(self.spans.items())
+        return sorted(items, key=lambda item: item[1].total_ms, reverse=True)[:limit]
+
+    def reset(self):
+        with self._lock:
+            self.events.clear()
+            self.spans.clear()
+            self.counters.clear()
+            self.frames.clear()
+
+    def export_chrome_trace(self, path: str):
+        """Writes the trace events and final counter values in Chrome's trace-event format."""
+        pid = os.getpid()
+        with self._lock:
+            events = list(self.events)
+            counters = dict(self.counters)
+        trace = [{
+            "name": name, "cat": category, "ph": "X", "pid": pid, "tid": tid,
+            "ts": round((start - self.origin) * 1e6, 3), "dur": round(duration * 1e6, 3),
+        } for name, category, start, duration, tid in events]
+        now = round((time.perf_counter() - self.origin) * 1e6, 3)
+        trace.extend({"name": name, "ph": "C", "pid": pid, "tid": 0, "ts": now, "args": {"value": value}}
+                     for name, value in counters.items())
+        temp_path = f"{path}.tmp"
+        with open(temp_path, "w", encoding="utf-8") as f:
+            json.dump({"traceEvents": trace, "displayTimeUnit": "ms"}, f)
+        os.replace(temp_path, path)
+
+profiler = Profiler(enabled=os.environ.get("AGENCY_PROFILE", "1") != "0")
@@ -0,0 +1,127 @@
+# core/io.py
+# A bounded thread pool for file reads and writes. Jobs on the same file run one at a
+# time in the order they were submitted; jobs on different files run in parallel.
+
+import logging
+import os
+import threading
+import uuid
+from collections import deque
+from concurrent.futures import Future, ThreadPoolExecutor, wait
+from typing import Callable, Dict, List, Optional
+
+from core.instrumentation import profiler
+
+logger = logging.getLogger(__name__)
+
+IO_WORKERS = min(8, (os.cpu_count() or 1) + 2) # Threads mostly wait on the disk, so a few more than cores
+
+def read_text(path: str) -> str:
+    with open(path, 'r', encoding='utf-8') as f:
+        return f.read()
+
+def write_text(path: str, text: str):
+    """Writes through a temporary file and a rename, so readers never see half a file."""
+    temp_path = f"{path}.{uuid.uuid4().hex[:8]}.tmp"
+    try:
+        with open(temp_path, 'w', encoding='utf-8') as f:
+            f.write(text)
+        os.replace(temp_path, path)
+    except BaseException:
+        if os.path.exists(temp_path):
+            os.remove(temp_path)
+        raise
+
+class IOExecutor:
+    """
+    Runs file jobs on a bounded pool and hands back concurrent.futures.Future objects.
+    Each file has a queue: a job submitted while another job on the same file is queued
+    or running waits behind it, and the worker that finishes one job takes the next, so
+    no worker ever blocks on a lock.
+    """
+    def __init__(self, max_workers: int = IO_WORKERS):
+        self._pool = ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="agency-io")
+        self._lock = threading.Lock()
+        self._queues: Dict[str, deque] = {} # Path -> jobs waiting behind the running one
+        self._pending = set() # Futures not yet finished, for flush()
+
+    def submit(self, path: str, fn: Callable, *args, **kwargs) -> Future:
+        """Runs fn(*args, **kwargs) once every earlier job on path has finished."""
+        future = Future()
+        with self._lock:
+            self._pending.add(future)
+        self._enqueue(os.path.abspath(path), (future, fn, args, kwargs))
+        return future
+
+    def submit_after(self, dependencies: List[Future], path: str, fn: Callable, *args, **kwargs) -> Future:
+        """
+        Like submit, but the job is only queued once every future in dependencies has
+        finished, whatever its outcome. Nothing holds a worker in the meantime, and
+        flush() waits for the job like any other.
+        """
+        future = Future()
+        job = (future, fn, args, kwargs)
+        key = os.path.abspath(path)
+        remaining = [len(dependencies)]
+        with self._lock:
+            self._pending.add(future)
+
+        def dependency_done(_):
+            with self._lock:
+                remaining[0] -= 1
+                ready = remaining[0] == 0
+            if ready:
+                self._enqueue(key, job)
+        if not dependencies:
+            self._enqueue(key, job)
+        for dependency in dependencies:
+            dependency.add_done_callback(dependency_done)
+        return future
+
+    def _enqueue(self, key, job):
+        with self._lock:
+            queue = self._queues.get(key)
+            if queue is not None:
+                queue.append(job)
+                return
+            self._queues[key] = deque()
+        self._pool.submit(self._drain, key, job)
+
+    def read(self, path: str) -> Future:
+        return self.submit(path, read_text, path)
+
+    def write(self, path: str, text: str) -> Future:
+        return self.submit(path, write_text, path, text)
+
+    def _drain(self, key, job):
+        while job is not None:
+            future, fn, args, kwargs = job
+            if future.set_running_or_notify_cancel():
+                try:
+                    with profiler.span("io.job", "io"):
+                        future.set_result(fn(*args, **kwargs))
+                except BaseException as e:
+                    future.set_exception(e)
+            with self._lock:
+                self._pending.discard(future)
+                queue = self._queues[key]
+                if queue:
+                    job = queue.popleft()
+                else:
+                    del self._queues[key]
+                    job = None
+
+    def pending(self) -> List[Future]:
+        """The jobs submitted so far that have not finished, e.g. for a later job to wait on."""
+        with self._lock:
+            return list(self._pending)
+
+    def flush(self, timeout: Optional[float] = None) -> bool:
+        """Waits for every job submitted so far; False if timeout ran out first."""
+        with self._lock:
+            pending = list(self._pending)
+        return not wait(pending, timeout=timeout).not_done
+
+    def shutdown(self):
+        self.flush()
+        self._pool.shutdown(wait=True)
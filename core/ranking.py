@@ -0,0 +1,195 @@
+# core/ranking.py
+# Scores every character in the world as a suspect for a given victim, or as a victim
+# candidate, to help cast new cases.
+
+from collections import OrderedDict
+from dataclasses import dataclass, field
+from typing import Dict, Iterable, List, Optional
+
+import numpy as np
+
+from compact import peek
+from core.instrumentation import profiler
+
+# Weights of the suspect score components; each component is scaled to 0..1 first
+SUSPECT_WEIGHTS = {
+    "killer_likelihood": 1.0,
+    "dishonesty": 0.3, # 1 - honesty
+    "personal_enmity": 1.5, # Either names the other in Character.enemies
+    "faction_enmity": 0.8, # Their factions list each other in Faction.enemy_factions
+    "same_district": 0.5,
+    "means": 0.4, # Owns items that are possible means, up to MEANS_CAP of them
+}
+VICTIM_WEIGHTS = {
+    "victim_likelihood": 1.0,
+    "enemies": 0.6, # How many characters name them as an enemy, relative to the most hated
+    "faction_enemies": 0.3, # Their faction has enemy factions
+}
+MEANS_CAP = 3
+CACHE_SIZE = 64 # Rankings kept until the world changes
+RELEVANT_ASSETS = ("characters", "factions", "items") # Saves of these invalidate the rankings
+
+@dataclass
+class Candidate:
+    character_id: str
+    score: float
+    components: Dict[str, float] = field(default_factory=dict) # Weighted contribution per component
+
+class RankingEngine:
+    """
+    Scores characters with whole-array NumPy expressions over the ColumnStore's
+    character table plus a few arrays derived from the relationship lists (means
+    owned, enemy in-degree). The derived arrays and the rankings are cached until a
+    character, faction or item is saved.
+    """
+    def __init__(self, data_manager):
+        self.data_manager = data_manager
+        self._derived = None
+        self._cache = OrderedDict() # (kind, victim id, k, excluded) -> [Candidate]
+        data_manager.add_listener(self.on_data_saved)
+
+    def on_data_saved(self, kind, keys):
+        if kind == "world" and (keys is None or any(asset_type in RELEVANT_ASSETS for asset_type, _ in keys)):
+            self._derived = None
+            self._cache.clear()
+
+    def _table(self):
+        return self.data_manager.columns.table("characters")
+
+    @profiler.timed("ranking.derive", "ranking")
+    def _derive(self):
+        """Arrays aligned with the character table that need the relationship lists to compute."""
+        world_data = self.data_manager.world_data
+        table = self._table()
+        count = len(table.ids)
+        means_items = {item_id for item_id, item in world_data.items.items() if item.possible_means}
+        owned_means = {}
+        for item_id in means_items:
+            owner = world_data.items[item_id].default_owner
+            if owner:
+                owned_means.setdefault(owner, set()).add(item_id)
+
+        owned_counts = [0] * count # Filled as lists and converted once; per-element NumPy writes are slow
+        # Relationship lists are read with peek(), so this pass leaves empty ones shared
+        named_by = {} # Character id -> rows of the characters naming them as an enemy
+        for row, character_id in enumerate(table.ids):
+            character = world_data.characters.get(character_id)
+            if character is None:
+                continue
+            owned = owned_means.get(character_id)
+            if owned is None:
+                owned_counts[row] = sum(1 for item_id in peek(character, "items") if item_id in means_items)
+            else:
+                owned_counts[row] = len(owned.union(item_id for item_id in peek(character, "items") if item_id in means_items))
+            for enemy_id in peek(character, "enemies"):
+                named_by.setdefault(enemy_id, []).append(row)
+        means = np.minimum(np.array(owned_counts, dtype=float), MEANS_CAP) / MEANS_CAP
+        enemy_in = np.zeros(count)
+        enemy_rows = [(table.rows[enemy_id], len(rows)) for enemy_id, rows in named_by.items() if enemy_id in table.rows]
+        if enemy_rows:
+            rows, counts = zip(*enemy_rows)
+            enemy_in[list(rows)] = counts
+
+        faction_enemies = {} # Faction id -> enemy faction ids, whichever side declared it
+        for faction_id, faction in world_data.factions.items():
+            for enemy_id in peek(faction, "enemy_factions"):
+                faction_enemies.setdefault(faction_id, set()).add(enemy_id)
+                faction_enemies.setdefault(enemy_id, set()).add(faction_id)
+        self._derived = {"means": means, "enemy_in": enemy_in, "named_by": named_by, "faction_enemies": faction_enemies}
+        return self._derived
+
+    def _cached(self, key, compute):
+        result = self._cache.get(key)
+        profiler.hit("ranking.cache", result is not None)
+        if result is None:
+            result = self._cache[key] = compute()
+            while len(self._cache) > CACHE_SIZE:
+                self._cache.popitem(last=False)
+        else:
+            self._cache.move_to_end(key)
+        return result
+
+    def _top(self, components: Dict[str, np.ndarray], weights: Dict[str, float], excluded_rows, k) -> List[Candidate]:
+        table = self._table()
+        count = len(table.ids)
+        weighted = {name: weights[name] * np.nan_to_num(values, nan=0.0) for name, values in components.items()}
+        score = sum(weighted.values())
+        score = np.where(table.alive[:count], score, -np.inf)
+        score[list(excluded_rows)] = -np.inf
+        k = min(k, int(np.isfinite(score).sum()))
+        if k <= 0:
+            return []
+        top = np.argpartition(-score, k - 1)[:k]
+        top = top[np.argsort(-score[top], kind="stable")]
+        return [Candidate(table.ids[row], round(float(score[row]), 4),
+                          {name: round(float(values[row]), 4) for name, values in weighted.items()})
+                for row in top]
+
+    def rank_suspects(self, victim_id: str, k: int = 10, exclude: Iterable[str] = ()) -> List[Candidate]:
+        """The k best suspects for killing victim_id, best first; exclude skips characters already cast."""
+        exclude = frozenset(exclude)
+        return self._cached(("suspects", victim_id, k, exclude), lambda: self._rank_suspects(victim_id, k, exclude))
+
+    @profiler.timed("ranking.suspects", "ranking")
+    def _rank_suspects(self, victim_id, k, exclude):
+        victim = self.data_manager.world_data.characters.get(victim_id)
+        if victim is None:
+            return []
+        table = self._table()
+        derived = self._derived or self._derive()
+        count = len(table.ids)
+
+        personal = np.zeros(count)
+        rows = [table.rows[enemy_id] for enemy_id in victim.enemies if enemy_id in table.rows]
+        rows.extend(derived["named_by"].get(victim_id, ()))
+        personal[rows] = 1.0
+
+        faction_codes = table.codes["faction"][:count]
+        enemy_factions = derived["faction_enemies"].get(victim.faction, ())
+        enemy_codes = [code for code in (table.find_code("faction", faction_id) for faction_id in enemy_factions) if code is not None]
+        faction = np.isin(faction_codes, enemy_codes).astype(float)
+
+        district = np.zeros(count)
+        if victim.district is not None:
+            district = (table.codes["district"][:count] == table.find_code("district", victim.district)).astype(float)
+
+        components = {
+            "killer_likelihood": table.numeric["killer_likelihood"][:count],
+            "dishonesty": 1.0 - table.numeric["honesty"][:count],
+            "personal_enmity": personal,
+            "faction_enmity": faction,
+            "same_district": district,
+            "means": derived["means"],
+        }
+        excluded_rows = {table.rows[character_id] for character_id in exclude | {victim_id} if character_id in table.rows}
+        return self._top(components, SUSPECT_WEIGHTS, excluded_rows, k)
+
+    def rank_victims(self, k: int = 10, exclude: Iterable[str] = ()) -> List[Candidate]:
+        """The k most likely victims in the world, best first."""
+        exclude = frozenset(exclude)
+        return self._cached(("victims", None, k, exclude), lambda: self._rank_victims(k, exclude))
+
+    @profiler.timed("ranking.victims", "ranking")
+    def _rank_victims(self, k, exclude):
+        table = self._table()
+        derived = self._derived or self._derive()
+        count = len(table.ids)
+        enemy_in = derived["enemy_in"]
+        hated_factions = [code for code in (table.find_code("faction", faction_id) for faction_id in derived["faction_enemies"]) if code is not None]
+        components = {
+            "victim_likelihood": table.numeric["victim_likelihood"][:count],
+            "enemies": enemy_in / enemy_in.max() if count and enemy_in.max() > 0 else np.zeros(count),
+            "faction_enemies": np.isin(table.codes["faction"][:count], hated_factions).astype(float),
+        }
+        excluded_rows = {table.rows[character_id] for character_id in exclude if character_id in table.rows}
+        return self._top(components, VICTIM_WEIGHTS, excluded_rows, k)
+
+    def find_character(self, reference: Optional[str]) -> Optional[str]:
+        """Resolves a case's victim field, which may hold a character id or a full name, to a character id."""
+        if not reference:
+            return None
+        characters = self.data_manager.world_data.characters
+        if reference in characters:
+            return reference
+        wanted = reference.strip().lower()
+        return next((character_id for character_id, character in characters.items() if character.full_name.lower() == wanted), None)
@@ -0,0 +1,74 @@
+# core/validation.py
+# Quick project-wide checks of the world and case data, shown in the validator panel.
+
+from typing import Dict, List
+import schemas
+from core.instrumentation import profiler
+
+# --- World Data Validations ---
+
+# (asset type, name field, label, what the field is called) for every world asset that must be named
+NAMED_ASSETS = (
+    ("characters", "full_name", "Character", "full name"),
+    ("locations", "name", "Location", "name"),
+    ("factions", "name", "Faction", "name"),
+    ("items", "name", "Item", "name"),
+    ("districts", "district_name", "District", "name"),
+)
+
+def check_asset_names(world_data, case_files, results):
+    for asset_type, name_field, label, name_label in NAMED_ASSETS:
+        for asset_id, asset in getattr(world_data, asset_type).items():
+            if not getattr(asset, name_field):
+                results.append({'message': f"Warning: {label} with ID {asset_id} has no {name_label}. (World Data)", 'asset_type': asset_type, 'asset_id': asset_id})
+
+# --- Case Data Validations (Basic Solvability and Deception Integrity) ---
+
+def check_case_solvability(world_data, case_files, results):
+    for case_id, case_file in case_files.items():
+        if not case_file.case_meta.victim:
+            results.append({'message': f"Error: Case '{case_id}' has no victim defined.", 'asset_type': 'cases', 'asset_id': case_id})
+        if not case_file.case_meta.culprit:
+            results.append({'message': f"Error: Case '{case_id}' has no culprit defined.", 'asset_type': 'cases', 'asset_id': case_id})
+        if not case_file.case_meta.crime_scene:
+            results.append({'message': f"Warning: Case '{case_id}' has no crime scene defined.", 'asset_type': 'cases', 'asset_id': case_id})
+
+def check_means_motive_opportunity(world_data, case_files, results):
+    for case_id, case_file in case_files.items():
+        clue_ids = {c.clue_id for c in case_file.clues}
+        for clue_type in ["means_clue", "motive_clue", "opportunity_clue"]:
+            clue_id = getattr(case_file.case_meta, clue_type)
+            if clue_id and clue_id not in clue_ids:
+                results.append({'message': f"Error: Case '{case_id}' references a non-existent {clue_type} '{clue_id}'.", 'asset_type': 'clues', 'asset_id': clue_id})
+
+def check_deception_integrity(world_data, case_files, results):
+    for case_id, case_file in case_files.items():
+        clue_ids = {c.clue_id for c in case_file.clues}
+        interviewees = [("Suspect", suspect) for suspect in case_file.key_suspects]
+        interviewees.extend(("Witness", witness) for location in case_file.locations for witness in location.witnesses)
+        for role, interviewee in interviewees:
+            for interview in interviewee.interviews:
+                if not interview.answer.is_lie:
+                    continue
+                if not interview.answer.debunking_clue:
+                    results.append({'message': f"Warning: {role} '{interviewee.character_id}' has a lie without a debunking clue in case '{case_id}'.", 'asset_type': 'characters', 'asset_id': interviewee.character_id})
+                elif interview.answer.debunking_clue not in clue_ids:
+                    results.append({'message': f"Error: {role} '{interviewee.character_id}' references a non-existent debunking clue '{interview.answer.debunking_clue}' in case '{case_id}'.", 'asset_type': 'clues', 'asset_id': interview.answer.debunking_clue})
+
+RULES = (
+    ("asset_names", check_asset_names),
+    ("case_solvability", check_case_solvability),
+    ("means_motive_opportunity", check_means_motive_opportunity),
+    ("deception_integrity", check_deception_integrity),
+)
+
+def validate_project(world_data: schemas.WorldData, case_files: Dict[str, schemas.CaseFile]) -> List[dict]:
+    """
+    Returns one {'message', 'asset_type', 'asset_id'} dict per issue found, so the
+    panel can offer to jump to the offending asset. Each rule is timed separately.
+    """
+    results = []
+    for name, rule in RULES:
+        with profiler.span(f"validate.{name}", "validation"):
+            rule(world_data, case_files, results)
+    return results
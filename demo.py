@@ -3,8 +3,9 @@
 # with a procedural rainy cityscape background and refined Art Deco motifs.
 
 import sys
-import random
 import math
+import time
+import numpy as np
 from PySide6.QtWidgets import (
     QApplication, QMainWindow, QWidget, QVBoxLayout, QHBoxLayout,
     QListWidget, QListWidgetItem, QPushButton, QLabel, QLineEdit,
@@ -12,12 +13,12 @@ from PySide6.QtWidgets import (
     QGraphicsDropShadowEffect, QComboBox, QGraphicsOpacityEffect
 )
 from PySide6.QtGui import (
-    QFont, QColor, QPalette, QPixmap, QPainter, QBrush, QPen,
+    QFont, QColor, QPalette, QPixmap, QPainter, QPen,
     QPainterPath, QLinearGradient, QCursor
 )
 from PySide6.QtCore import (
     Qt, QSize, QPropertyAnimation, QEasingCurve, QEvent, Property, Signal, 
-    QTimer, QPoint, QParallelAnimationGroup, QRectF
+    QTimer, QPoint, QPointF, QLineF, QParallelAnimationGroup, QRectF
 )
 
 # --- Custom Animated Widgets ---
@@ -249,63 +250,139 @@ class DetailCard(DecoFrame):
         layout.addRow(button_layout)
 
 class RainyGlassWidget(QWidget):
-    """A widget that draws an animated, rainy cityscape background."""
+    """
+    A widget that draws an animated, rainy cityscape background.
+    Drops live in NumPy arrays that are updated in one vectorized step per frame and
+    drawn in a few batched calls; the gradient is cached per size. The timer stops
+    while the widget is hidden and slows down when frames arrive late.
+    """
+    MAX_DROPS = 600
+    MIN_INTERVAL = 16 # ~60 FPS
+    MAX_INTERVAL = 66 # ~15 FPS
+    ALPHA_LEVELS = 8 # Distinct drop opacities, one batched draw call each
+
     def __init__(self, parent=None):
         super().__init__(parent)
         self.setAttribute(Qt.WA_TransparentForMouseEvents)
+        self.setAttribute(Qt.WA_OpaquePaintEvent)
+        self.rng = np.random.default_rng()
+        self.x = np.zeros(self.MAX_DROPS, dtype=np.float32)
+        self.y = np.zeros(self.MAX_DROPS, dtype=np.float32)
+        self.radius = np.zeros(self.MAX_DROPS, dtype=np.float32)
+        self.life = np.zeros(self.MAX_DROPS, dtype=np.float32)
+        self.streak = np.zeros(self.MAX_DROPS, dtype=np.float32)
+        self.count = 0
+        self.background = QPixmap()
+        self.interval = self.MIN_INTERVAL
+        self.late_frames = 0
+        self.on_time_frames = 0
+        self.last_tick = None
         self.timer = QTimer(self)
         self.timer.timeout.connect(self.update_drops)
-        self.timer.start(16) # ~60 FPS
-        self.drops = []
+        self.timer.start(self.interval)
+
+    def showEvent(self, event):
+        super().showEvent(event)
+        self.last_tick = None
+        self.timer.start(self.interval)
+
+    def hideEvent(self, event):
+        super().hideEvent(event) # Also sent when the window is minimized
+        self.timer.stop()
+
+    def resizeEvent(self, event):
+        super().resizeEvent(event)
+        self.background = QPixmap() # Re-rendered at the new size on the next paint
+
+    def adapt_rate(self, elapsed_ms):
+        """Halves the frame rate when ticks keep arriving late, and recovers when they don't."""
+        if elapsed_ms > self.interval * 1.5:
+            self.late_frames += 1
+            self.on_time_frames = 0
+        else:
+            self.on_time_frames += 1
+            self.late_frames = 0
+        if self.late_frames >= 10 and self.interval < self.MAX_INTERVAL:
+            self.interval = min(self.MAX_INTERVAL, self.interval * 2)
+        elif self.on_time_frames >= 120 and self.interval > self.MIN_INTERVAL:
+            self.interval = max(self.MIN_INTERVAL, self.interval // 2)
+        else:
+            return
+        self.late_frames = self.on_time_frames = 0
+        self.timer.setInterval(self.interval)
 
     def update_drops(self):
+        now = time.perf_counter()
+        if self.last_tick is not None:
+            self.adapt_rate((now - self.last_tick) * 1000)
+        self.last_tick = now
+        steps = self.interval / self.MIN_INTERVAL # Motion per tick scales with the interval, so speed stays the same
+
         # Add new drops
-        if random.randint(0, 5) == 0:
-            self.drops.append({
-                'x': random.randint(0, self.width()),
-                'y': random.randint(0, self.height()),
-                'radius': random.uniform(1, 3),
-                'life': random.randint(100, 300),
-                'streak_len': 0,
-                'streaking': False
-            })
-
-        for drop in self.drops[:]:
-            drop['life'] -= 1
-            if drop['life'] <= 0 and not drop['streaking']:
-                drop['streaking'] = True
-            
-            if drop['streaking']:
-                drop['y'] += 5
-                drop['streak_len'] += 5
-                if drop['y'] - drop['streak_len'] > self.height():
-                    self.drops.remove(drop)
-            
+        n = self.count
+        if n < self.MAX_DROPS and self.rng.random() < min(1.0, steps / 6):
+            self.x[n] = self.rng.integers(0, max(1, self.width()))
+            self.y[n] = self.rng.integers(0, max(1, self.height()))
+            self.radius[n] = self.rng.uniform(1, 3)
+            self.life[n] = self.rng.integers(100, 300)
+            self.streak[n] = 0
+            n = self.count = n + 1
+
+        # Age every drop; expired ones streak down the glass
+        self.life[:n] -= steps
+        streaking = self.life[:n] <= 0
+        self.y[:n][streaking] += 5 * steps
+        self.streak[:n][streaking] += 5 * steps
+
+        # Drop the ones whose streak has left the window, compacting the arrays in one pass
+        alive = self.y[:n] - self.streak[:n] <= self.height()
+        if not alive.all():
+            kept = int(alive.sum())
+            for array in (self.x, self.y, self.radius, self.life, self.streak):
+                array[:kept] = array[:n][alive]
+            self.count = kept
+
         self.update()
 
     def paintEvent(self, event):
         painter = QPainter(self)
+
+        # Background Cityscape Gradient, rendered once per size
+        if self.background.size() != self.size():
+            self.background = QPixmap(self.size())
+            grad = QLinearGradient(0, 0, 0, self.height())
+            grad.setColorAt(0, QColor("#05080d"))
+            grad.setColorAt(0.7, QColor("#10141a"))
+            grad.setColorAt(1, QColor("#1c222b"))
+            background_painter = QPainter(self.background)
+            background_painter.fillRect(self.background.rect(), grad)
+            background_painter.end()
+        painter.drawPixmap(0, 0, self.background)
+
+        n = self.count
+        if n == 0:
+            return
+        x, y, life, streak = self.x[:n], self.y[:n], self.life[:n], self.streak[:n]
+        streaking = life <= 0
+
+        # Streaks, as one batch of lines (vertical and 1px wide, so no antialiasing needed)
+        if streaking.any():
+            painter.setPen(QPen(QColor(0, 229, 255, 40), 0)) # Cosmetic pen: the cheapest 1px line
+            painter.drawLines([QLineF(a, b - s, a, b) for a, b, s in zip(x[streaking].tolist(), y[streaking].tolist(), streak[streaking].tolist())])
+
+        # Beaded drops, as round points batched by opacity and size
         painter.setRenderHint(QPainter.Antialiasing)
-        
-        # Background Cityscape Gradient
-        grad = QLinearGradient(0, 0, 0, self.height())
-        grad.setColorAt(0, QColor("#05080d"))
-        grad.setColorAt(0.7, QColor("#10141a"))
-        grad.setColorAt(1, QColor("#1c222b"))
-        painter.fillRect(self.rect(), grad)
-
-        # Raindrops and Streaks
-        for drop in self.drops:
-            alpha = min(255, drop['life'])
-            if drop['streaking']:
-                pen = QPen(QColor(0, 229, 255, alpha // 4), 1)
-                painter.setPen(pen)
-                painter.drawLine(drop['x'], drop['y'] - drop['streak_len'], drop['x'], drop['y'])
-            else:
-                brush = QBrush(QColor(0, 229, 255, alpha // 5))
-                painter.setBrush(brush)
-                painter.setPen(Qt.NoPen)
-                painter.drawEllipse(QPoint(drop['x'], drop['y']), drop['radius'], drop['radius'])
+        beading = ~streaking
+        alpha = np.minimum(255, life[beading]) // 5
+        level = np.minimum(self.ALPHA_LEVELS - 1, (alpha * self.ALPHA_LEVELS / 52).astype(np.int32))
+        size = np.rint(self.radius[:n][beading] * 2).astype(np.int32)
+        bx, by = x[beading], y[beading]
+        for key in np.unique(level * 16 + size).tolist():
+            group = (level * 16 + size) == key
+            pen = QPen(QColor(0, 229, 255, int((key // 16 + 1) * 51 / self.ALPHA_LEVELS)), key % 16)
+            pen.setCapStyle(Qt.RoundCap)
+            painter.setPen(pen)
+            painter.drawPoints([QPointF(a, b) for a, b in zip(bx[group].tolist(), by[group].tolist())])
 
 class MainWindow(QMainWindow):
     def __init__(self):
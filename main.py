@@ -1,27 +1,38 @@
 import sys
 import logging
 import uuid
-import json
+import hashlib
+import math
 import os
-from dataclasses import asdict, is_dataclass, fields
+import time
+from collections import OrderedDict
 from typing import get_args, List, Dict, Any
 
 from PySide6.QtWidgets import (
     QApplication, QMainWindow, QWidget, QVBoxLayout, QHBoxLayout,
     QListWidget, QListWidgetItem, QPushButton, QLabel, QLineEdit,
     QTextEdit, QComboBox, QFrame, QSplitter, QStackedWidget, QFormLayout,
-    QGraphicsDropShadowEffect, QTabWidget, QCheckBox, QGraphicsView,
-    QGraphicsScene, QGraphicsProxyWidget, QGraphicsItem
+    QTabWidget, QCheckBox, QGraphicsView,
+    QGraphicsScene, QGraphicsProxyWidget, QGraphicsItem, QInputDialog, QDockWidget,
+    QListView, QCompleter, QDialog, QFileDialog, QProgressBar, QDoubleSpinBox
 )
 from PySide6.QtGui import (
-    QColor, QPixmap, QPainter, QBrush, QPen, QPainterPath
+    QColor, QPixmap, QPainter, QBrush, QPen, QPainterPath, QLinearGradient, QRadialGradient, QStandardItemModel, QStandardItem, QKeySequence,
+    QImage, QImageReader, QPixmapCache, QActionGroup
 )
 from PySide6.QtCore import (
-    Qt, QPropertyAnimation, QEasingCurve, Property, QPoint, QPointF, QThread, Signal
+    Qt, QPropertyAnimation, QEasingCurve, Property, QPoint, QPointF, QRectF, QSettings, QThread, QTimer, Signal,
+    QAbstractListModel, QIdentityProxyModel, QModelIndex, QObject, QRunnable, QSize, QThreadPool
 )
 
 # --- Schema Imports ---
 import schemas
+from case_graph import CaseEdgeIndex, RELATION_TYPES, node_key
+from name_index import NameIndex
+from text_index import FullTextIndex, source_stamp
+from core import DataManager, IOExecutor, validate_project
+from core.instrumentation import profiler, FRAME_BUCKETS_MS
+import theme
 
 # --- Logging Configuration ---
 logging.basicConfig(
@@ -32,116 +43,112 @@ logging.basicConfig(
 )
 logger = logging.getLogger(__name__)
 
-# --- Enhanced JSON Encoder for Dataclasses ---
-class DataclassJSONEncoder(json.JSONEncoder):
-    def default(self, o):
-        if is_dataclass(o):
-            return asdict(o)
-        return super().default(o)
-
-# --- Data Reconstruction Helper ---
-def from_dict_to_dataclass(cls, data):
-    if not isinstance(data, dict): return data
-    field_types = {f.name: f.type for f in fields(cls)}
-    kwargs = {}
-    for f_name, f_type in field_types.items():
-        if f_name in data:
-            val = data[f_name]
-            origin = getattr(f_type, '__origin__', None)
-            if origin is list and val is not None:
-                item_type = get_args(f_type)[0]
-                kwargs[f_name] = [from_dict_to_dataclass(item_type, i) for i in val] if is_dataclass(item_type) else val
-            elif origin is dict and val is not None:
-                key_type, value_type = get_args(f_type)
-                kwargs[f_name] = {key_type(k): from_dict_to_dataclass(value_type, v) for k, v in val.items()} if is_dataclass(value_type) else val
-            elif is_dataclass(f_type) and val is not None:
-                kwargs[f_name] = from_dict_to_dataclass(f_type, val)
-            else:
-                kwargs[f_name] = val
-    return cls(**kwargs)
+# --- Animated UI Components ---
 
-# --- Data Management ---
-class DataManager:
+class AnimationManager(QObject):
     """
-    Abstracts all file I/O. Responsible for reading/writing case files.
-    This would be replaced by a database interaction layer in a production build.
+    Runs the UI's decorative animations. Animations are created once per target and
+    property and reused, at most MAX_CONCURRENT run at a time (extra ones jump to their
+    end value), and if frames arrive slower than FRAME_BUDGET_MS the manager switches to
+    reduced motion, where every animation completes instantly.
     """
-    def __init__(self, base_path="data"):
-        self.base_path = base_path
-        self.world_data_path = os.path.join(self.base_path, "world.json")
-        self.cases_path = os.path.join(self.base_path, "cases")
-        self.world_data = self.load_world_data()
-        self.case_files = self.load_all_cases()
-
-    def load_world_data(self):
-        os.makedirs(self.base_path, exist_ok=True)
-        if os.path.exists(self.world_data_path):
-            try:
-                with open(self.world_data_path, 'r', encoding='utf-8') as f:
-                    data = json.load(f)
-                    return from_dict_to_dataclass(schemas.WorldData, data)
-            except Exception as e:
-                logger.error(f"Failed to load world data: {e}")
-        return schemas.WorldData()
-
-    def save_world_data(self):
-        try:
-            with open(self.world_data_path, 'w', encoding='utf-8') as f:
-                json.dump(self.world_data, f, indent=4, cls=DataclassJSONEncoder)
-        except Exception as e:
-            logger.error(f"Failed to save world data: {e}")
-
-    def load_all_cases(self):
-        os.makedirs(self.cases_path, exist_ok=True)
-        cases = {}
-        for filename in os.listdir(self.cases_path):
-            if filename.endswith(".json"):
-                try:
-                    path = os.path.join(self.cases_path, filename)
-                    with open(path, 'r', encoding='utf-8') as f:
-                        data = json.load(f)
-                        case_obj = from_dict_to_dataclass(schemas.CaseFile, data)
-                        cases[case_obj.case_meta.victim] = case_obj
-                except Exception as e:
-                    logger.error(f"Failed to load case file {filename}: {e}")
-        return cases
-
-    def save_case(self, case_obj):
-        case_id = case_obj.case_meta.victim or f"case_{uuid.uuid4().hex[:8]}"
-        path = os.path.join(self.cases_path, f"{case_id}.json")
-        try:
-            with open(path, 'w', encoding='utf-8') as f:
-                json.dump(case_obj, f, indent=4, cls=DataclassJSONEncoder)
-            self.case_files[case_id] = case_obj
-        except Exception as e:
-            logger.error(f"Failed to save case {case_id}: {e}")
+    MAX_CONCURRENT = 8
+    FRAME_BUDGET_MS = 50 # Sustained frame times above this (under 20 fps) mean animating costs more than it adds
+    SLOW_FRAMES = 12 # Consecutive slow frames before reduced motion kicks in
+    reduced_motion_changed = Signal(bool)
 
-# --- Animated UI Components ---
+    _instance = None
+
+    @classmethod
+    def instance(cls):
+        if cls._instance is None:
+            cls._instance = cls(QApplication.instance())
+        return cls._instance
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self.reduced_motion = False
+        self._running = []
+        self._last_tick = None
+        self._slow_frames = 0
+
+    def set_reduced_motion(self, enabled):
+        if enabled == self.reduced_motion:
+            return
+        self.reduced_motion = enabled
+        self._slow_frames = 0
+        if enabled:
+            for animation in list(self._running):
+                animation.setCurrentTime(animation.totalDuration())
+                animation.stop()
+        self.reduced_motion_changed.emit(enabled)
+
+    def animation(self, target, property_name):
+        """The reusable animation of property_name on target, created on first use."""
+        name = f"managed:{property_name}"
+        animation = target.findChild(QPropertyAnimation, name, Qt.FindDirectChildrenOnly)
+        if animation is None:
+            animation = QPropertyAnimation(target, property_name.encode(), target)
+            animation.setObjectName(name)
+            animation.valueChanged.connect(self._on_tick)
+            animation.finished.connect(lambda: self._discard(animation))
+            animation.destroyed.connect(lambda: self._discard(animation)) # Target deleted mid-animation
+        return animation
+
+    def animate(self, target, property_name, start, end, duration, easing=QEasingCurve.Linear):
+        """Animates a property from start to end, or sets it to end if motion is off or the cap is hit."""
+        animation = self.animation(target, property_name)
+        animation.stop()
+        self._discard(animation)
+        if self.reduced_motion or len(self._running) >= self.MAX_CONCURRENT:
+            target.setProperty(property_name, end)
+            return None
+        animation.setStartValue(start)
+        animation.setEndValue(end)
+        animation.setDuration(duration)
+        animation.setEasingCurve(easing)
+        self._running.append(animation)
+        animation.start()
+        return animation
+
+    def _discard(self, animation):
+        if animation in self._running:
+            self._running.remove(animation)
+        if not self._running:
+            self._last_tick = None
+
+    def _on_tick(self):
+        now = time.perf_counter()
+        if self._last_tick is not None:
+            elapsed_ms = (now - self._last_tick) * 1000
+            if elapsed_ms < 2:
+                return # Another animation updating in the same frame
+            self._slow_frames = self._slow_frames + 1 if elapsed_ms > self.FRAME_BUDGET_MS else 0
+            if self._slow_frames >= self.SLOW_FRAMES:
+                logger.info("Animations are dropping frames; switching to reduced motion.")
+                self.set_reduced_motion(True)
+        self._last_tick = now
 
 class MaterialButton(QPushButton):
     def __init__(self, *args, **kwargs):
         super().__init__(*args, **kwargs)
         self._ripple_radius = 0
+        self._ripple_end = 0
         self.ripple_pos = QPoint()
-        self.animation = QPropertyAnimation(self, b"ripple_radius", self)
-        self.animation.setDuration(400)
-        self.animation.setEasingCurve(QEasingCurve.OutCubic)
 
     def mousePressEvent(self, event):
         self.ripple_pos = event.position().toPoint()
-        self.animation.setStartValue(0)
-        self.animation.setEndValue(self.width() * 1.5)
-        self.animation.start()
+        self._ripple_end = self.width() * 1.5
+        AnimationManager.instance().animate(self, "ripple_radius", 0.0, self._ripple_end, 400, QEasingCurve.OutCubic)
         super().mousePressEvent(event)
 
     def paintEvent(self, event):
         super().paintEvent(event)
-        if self.animation.state() == QPropertyAnimation.Running:
+        if 0 < self._ripple_radius < self._ripple_end:
             painter = QPainter(self)
             painter.setRenderHint(QPainter.Antialiasing)
             painter.setPen(Qt.NoPen)
-            end_val = self.animation.endValue()
-            opacity = 1.0 - (self._ripple_radius / end_val) if end_val > 0 else 0.0
+            opacity = 1.0 - (self._ripple_radius / self._ripple_end)
             painter.setBrush(QColor(255, 255, 255, int(opacity * 60)))
             painter.drawEllipse(self.ripple_pos, self._ripple_radius, self._ripple_radius)
 
@@ -165,6 +172,29 @@ class DynamicHeightTextEdit(QTextEdit):
         self.setFixedHeight(int(doc_height) + self.contentsMargins().top() + self.contentsMargins().bottom())
 
 
+class SlideOverlay(QWidget):
+    """Paints two page snapshots side by side at an animated offset, in place of the live pages."""
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self.setAttribute(Qt.WA_OpaquePaintEvent)
+        self.now_pixmap = QPixmap()
+        self.next_pixmap = QPixmap()
+        self._offset = 0
+
+    @Property(int)
+    def offset(self):
+        return self._offset
+
+    @offset.setter
+    def offset(self, value):
+        self._offset = value
+        self.update()
+
+    def paintEvent(self, event):
+        painter = QPainter(self)
+        painter.drawPixmap(-self._offset, 0, self.now_pixmap)
+        painter.drawPixmap(self.width() - self._offset, 0, self.next_pixmap)
+
 class AnimatedStackedWidget(QStackedWidget):
     def __init__(self, parent=None):
         super().__init__(parent)
@@ -176,36 +206,38 @@ class AnimatedStackedWidget(QStackedWidget):
         self.m_wrap = False
         self.m_pnow = QPoint(0, 0)
         self.m_active = False
+        self.overlay = SlideOverlay(self)
+        self.overlay.hide()
 
     def slideInNext(self):
+        """
+        Slides from a snapshot of both pages rather than moving the live widgets, which
+        would relayout them on every frame. The real page is shown when the slide ends.
+        """
+        manager = AnimationManager.instance()
+        if manager.reduced_motion or not self.isVisible():
+            self.setCurrentIndex(self.m_next)
+            return
         now_widget = self.widget(self.m_now)
         next_widget = self.widget(self.m_next)
-        
-        anim_group = QParallelAnimationGroup(self)
-
-        # Animate current widget out
-        pos_anim_now = QPropertyAnimation(now_widget, b"pos")
-        pos_anim_now.setDuration(self.m_speed)
-        pos_anim_now.setEasingCurve(self.m_animation_type)
-        pos_anim_now.setStartValue(QPoint(0,0))
-        pos_anim_now.setEndValue(QPoint(-self.width(), 0))
-        anim_group.addAnimation(pos_anim_now)
-
-        # Animate next widget in
-        next_widget.move(self.width(), 0)
-        next_widget.show()
-        next_widget.raise_()
-        
-        pos_anim_next = QPropertyAnimation(next_widget, b"pos")
-        pos_anim_next.setDuration(self.m_speed)
-        pos_anim_next.setEasingCurve(self.m_animation_type)
-        pos_anim_next.setStartValue(QPoint(self.width(), 0))
-        pos_anim_next.setEndValue(QPoint(0, 0))
-        anim_group.addAnimation(pos_anim_next)
-
-        anim_group.finished.connect(self.animationDone)
+        next_widget.resize(self.size())
+        layout = QWidget.layout(next_widget) # Editors shadow layout() with an attribute
+        if layout is not None:
+            layout.activate()
+
+        self.overlay.now_pixmap = now_widget.grab()
+        self.overlay.next_pixmap = next_widget.grab()
+        self.overlay.setGeometry(self.rect())
+        self.overlay.offset = 0
+        self.overlay.show()
+        self.overlay.raise_()
+
         self.m_active = True
-        anim_group.start(QPropertyAnimation.DeleteWhenStopped)
+        animation = manager.animate(self.overlay, "offset", 0, self.width(), self.m_speed, self.m_animation_type)
+        if animation is None:
+            self.animationDone()
+        else:
+            animation.finished.connect(self.animationDone, Qt.SingleShotConnection)
 
     def setCurrentWidget(self, widget):
         if self.m_active: return
@@ -216,79 +248,563 @@ class AnimatedStackedWidget(QStackedWidget):
 
     def animationDone(self):
         self.setCurrentIndex(self.m_next)
-        self.widget(self.m_now).hide()
-        self.widget(self.m_now).move(self.m_pnow)
+        self.overlay.hide()
+        self.overlay.now_pixmap = self.overlay.next_pixmap = QPixmap() # Don't hold page-sized pixmaps between slides
         self.m_active = False
 
+class TypeAheadCompleter(QCompleter):
+    """
+    Pops up ranked matches from a NameIndex while the user types into a line edit.
+    The popup only ever holds the top MAX_MATCHES rows, rebuilt per keystroke, so it
+    never filters the full asset model. Emits picked(asset_id) when one is chosen.
+    """
+    MAX_MATCHES = 20
+    picked = Signal(object)
+    editing_finished = Signal() # Like the line edit's, but not sent while the popup has focus
+
+    def __init__(self, line_edit, name_index, asset_dict):
+        super().__init__(line_edit)
+        self.name_index = name_index
+        self.asset_dict = asset_dict
+        self.matches = QStandardItemModel(self)
+        self.setModel(self.matches)
+        self.setCompletionMode(QCompleter.UnfilteredPopupCompletion)
+        self.setWidget(line_edit) # Handles the popup only; picking is reported through picked
+        line_edit.textEdited.connect(self.update_matches)
+        line_edit.editingFinished.connect(self.on_editing_finished)
+        self.activated[QModelIndex].connect(lambda index: self.picked.emit(index.data(Qt.UserRole)))
+
+    def update_matches(self, text):
+        self.matches.clear()
+        with profiler.span("typeahead.search", "search"):
+            matches = self.name_index.search(text, self.MAX_MATCHES)
+        for asset_id in matches:
+            item = QStandardItem(asset_display_name(self.asset_dict[asset_id]))
+            item.setData(asset_id, Qt.UserRole)
+            self.matches.appendRow(item)
+        if self.matches.rowCount():
+            self.complete()
+        else:
+            self.popup().hide()
+
+    def on_editing_finished(self):
+        if not self.popup().isVisible():
+            self.editing_finished.emit()
+
+class CheckableProxyModel(QIdentityProxyModel):
+    """Adds per-combo check states, kept in a set of ids, on top of a shared AssetListModel."""
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self.checked_ids = set()
+
+    def data(self, index, role=Qt.DisplayRole):
+        if role == Qt.CheckStateRole:
+            return Qt.Checked if index.data(Qt.UserRole) in self.checked_ids else Qt.Unchecked
+        return super().data(index, role)
+
+    def flags(self, index):
+        return Qt.ItemIsUserCheckable | Qt.ItemIsEnabled
+
+    def id_changed(self, asset_id):
+        row = self.sourceModel().row_of(asset_id)
+        if row >= 0:
+            index = self.index(row, 0)
+            self.dataChanged.emit(index, index, [Qt.CheckStateRole])
+
 class MultiSelectComboBox(QComboBox):
     def __init__(self, parent=None):
         super().__init__(parent)
         self.view().pressed.connect(self.handle_item_pressed)
         self.setEditable(True)
+        self.setInsertPolicy(QComboBox.NoInsert)
+        self.setCompleter(None) # The default completer filters every row per keystroke
         self.lineEdit().setReadOnly(True)
-        self._selected_ids = []
+        self.setSizeAdjustPolicy(QComboBox.AdjustToMinimumContentsLengthWithIcon) # Don't measure every row
+        self._selected_ids = [] # Kept in the asset's order; membership is checked against the proxy's set
+        self._asset_model = None
+        self._check_model = CheckableProxyModel(self)
+
+    def setAssetModel(self, asset_model, name_index=None):
+        """
+        Shows a shared AssetListModel; only the check states belong to this combo.
+        With a name_index, typing into the combo offers ranked matches to add.
+        """
+        self._asset_model = asset_model
+        self._check_model.setSourceModel(asset_model)
+        self.setModel(self._check_model)
+        self.view().setUniformItemSizes(True)
+        if name_index is not None:
+            self.lineEdit().setReadOnly(False)
+            self.lineEdit().setPlaceholderText("Type to add...")
+            completer = TypeAheadCompleter(self.lineEdit(), name_index, asset_model.asset_dict)
+            completer.picked.connect(self.select_id)
+            completer.editing_finished.connect(self.update_text) # Restore the summary after a search
+
+    def focusInEvent(self, event):
+        super().focusInEvent(event)
+        if not self.lineEdit().isReadOnly():
+            QTimer.singleShot(0, self.lineEdit().selectAll) # Typing replaces the summary with a query
+
+    def select_id(self, item_id):
+        if item_id not in self._check_model.checked_ids:
+            self._check_model.checked_ids.add(item_id)
+            self._selected_ids.append(item_id)
+            self._check_model.id_changed(item_id)
+        self.update_text()
 
     def handle_item_pressed(self, index):
-        item = self.model().itemFromIndex(index)
-        if item.checkState() == Qt.Checked:
-            item.setCheckState(Qt.Unchecked)
+        item_id = index.data(Qt.UserRole)
+        if item_id in self._check_model.checked_ids:
+            self._check_model.checked_ids.discard(item_id)
+            self._selected_ids.remove(item_id)
         else:
-            item.setCheckState(Qt.Checked)
+            self._check_model.checked_ids.add(item_id)
+            self._selected_ids.append(item_id)
+        self._check_model.id_changed(item_id)
         self.update_text()
 
-    def setItems(self, item_dict, selected_ids):
-        self.clear()
-        self._selected_ids = selected_ids if selected_ids is not None else []
-        for item_id, item_obj in item_dict.items():
-            name = getattr(item_obj, "name", getattr(item_obj, "full_name", getattr(item_obj, "district_name", getattr(item_obj, "item", ""))))
-            self.addItem(name, item_id)
-            item = self.model().item(self.count() - 1)
-            item.setFlags(Qt.ItemIsUserCheckable | Qt.ItemIsEnabled)
-            item.setCheckState(Qt.Checked if item_id in self._selected_ids else Qt.Unchecked)
+    def setSelectedIds(self, selected_ids):
+        """Checks the ids of another asset, touching only the rows whose state changes."""
+        old_ids = self._check_model.checked_ids
+        new_ids = set(selected_ids or [])
+        self._check_model.checked_ids = new_ids
+        self._selected_ids = list(selected_ids or [])
+        if self._asset_model is not None:
+            for item_id in old_ids ^ new_ids:
+                self._check_model.id_changed(item_id)
         self.update_text()
 
     def update_text(self):
-        texts = []
-        for i in range(self.count()):
-            if self.model().item(i).checkState() == Qt.Checked:
-                texts.append(self.itemText(i))
+        assets = self._asset_model.asset_dict if self._asset_model is not None else {}
+        # Ids with no asset behind them stay selected and are shown as unresolved
+        texts = [asset_display_name(assets[item_id]) if item_id in assets else f"{item_id} (missing)" for item_id in self._selected_ids]
         self.lineEdit().setText(", ".join(texts))
 
     def getSelectedIds(self):
-        ids = []
-        for i in range(self.count()):
-            if self.model().item(i).checkState() == Qt.Checked:
-                ids.append(self.itemData(i))
-        return ids
+        # Keeps the asset's own order, so an untouched selection compares equal on save. Dangling
+        # references are kept too: dropping them here would delete them on a save that never touched
+        # the field, and the validator reports them instead
+        return list(self._selected_ids)
+
+class ReferenceComboBox(QComboBox):
+    """
+    Chooses one asset, or none, from a shared AssetListModel. A reference to an asset
+    that doesn't exist is shown as "<id> (missing)" and read back unchanged until the
+    user picks something else, so saving other fields never clears it.
+    """
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self._missing_id = None
+        self.activated.connect(lambda row: self.pick(self.model().id_at(row)))
+
+    def pick(self, asset_id):
+        self._missing_id = None
+        self.setCurrentIndex(max(0, self.model().row_of(asset_id)))
+        self.restore_text()
+
+    def setCurrentId(self, asset_id):
+        row = self.model().row_of(asset_id)
+        self._missing_id = asset_id if row < 0 else None
+        self.setCurrentIndex(max(0, row))
+        self.restore_text()
+
+    def currentId(self):
+        return self._missing_id if self._missing_id is not None else self.currentData()
+
+    def restore_text(self):
+        """Shows the chosen name again, e.g. after a search typed into the field."""
+        self.lineEdit().setText(f"{self._missing_id} (missing)" if self._missing_id is not None else self.itemText(self.currentIndex()))
+
+def asset_display_name(asset):
+    """Returns the name field of any world asset, whichever schema it comes from."""
+    for name_field in ("name", "full_name", "district_name", "item"):
+        name = getattr(asset, name_field, None)
+        if name is not None:
+            return name
+    return ""
+
+# Schema class -> (world_data dict, id field); the sleuth is saved as ("sleuth", "sleuth")
+WORLD_ASSET_TYPES = {
+    schemas.Character: ("characters", "character_id"),
+    schemas.Location: ("locations", "location_id"),
+    schemas.Faction: ("factions", "faction_id"),
+    schemas.Item: ("items", "item_id"),
+    schemas.District: ("districts", "district_id"),
+}
+
+def world_key(asset):
+    """The (asset_type, asset_id) pair save_world_data takes for a world asset."""
+    if isinstance(asset, schemas.Sleuth):
+        return ("sleuth", "sleuth")
+    asset_type, id_field = WORLD_ASSET_TYPES[type(asset)]
+    return (asset_type, getattr(asset, id_field))
+
+def asset_search_names(asset):
+    """The names a picker matches against: the display name plus any alias."""
+    return [asset_display_name(asset), getattr(asset, "alias", "")]
+
+class AssetListModel(QAbstractListModel):
+    """
+    Exposes one world_data dict (characters, locations, ...) to Qt views without
+    copying it. Rows follow the dict's insertion order, and an id-to-row index
+    makes lookups and single-row change notifications O(1). With a none_label,
+    row 0 is an extra entry whose id is None, for optional single references.
+    """
+    def __init__(self, asset_dict, parent=None, none_label=None):
+        super().__init__(parent)
+        self.asset_dict = asset_dict
+        self.none_label = none_label
+        self._offset = 1 if none_label is not None else 0
+        self._ids = list(asset_dict)
+        self._rows = {asset_id: row for row, asset_id in enumerate(self._ids)}
+
+    def rowCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else len(self._ids) + self._offset
+
+    def data(self, index, role=Qt.DisplayRole):
+        if not index.isValid():
+            return None
+        row = index.row() - self._offset
+        asset_id = self._ids[row] if row >= 0 else None
+        if role in (Qt.DisplayRole, Qt.EditRole): # Editable combos show the edit role
+            return asset_display_name(self.asset_dict.get(asset_id)) if row >= 0 else self.none_label
+        if role == Qt.UserRole:
+            return asset_id
+        return None
+
+    def id_at(self, row):
+        row -= self._offset
+        return self._ids[row] if row >= 0 else None
+
+    def row_of(self, asset_id):
+        if asset_id is None and self._offset:
+            return 0
+        row = self._rows.get(asset_id)
+        return row + self._offset if row is not None else -1
+
+    def index_of(self, asset_id):
+        row = self.row_of(asset_id)
+        return self.index(row) if row >= 0 else QModelIndex()
+
+    def asset_changed(self, asset_id):
+        """Notifies views that one asset was edited, or appends it if it is new."""
+        if asset_id not in self._rows:
+            self.asset_added(asset_id)
+            return
+        index = self.index_of(asset_id)
+        self.dataChanged.emit(index, index, [Qt.DisplayRole])
+
+    def asset_added(self, asset_id):
+        if asset_id in self._rows:
+            return
+        row = len(self._ids) + self._offset
+        self.beginInsertRows(QModelIndex(), row, row)
+        self._rows[asset_id] = len(self._ids)
+        self._ids.append(asset_id)
+        self.endInsertRows()
+
+    def asset_removed(self, asset_id):
+        row = self._rows.get(asset_id)
+        if row is None:
+            return
+        self.beginRemoveRows(QModelIndex(), row + self._offset, row + self._offset)
+        del self._ids[row]
+        self._rows = {asset_id: row for row, asset_id in enumerate(self._ids)}
+        self.endRemoveRows()
+
+    def reload(self, ids=None):
+        """
+        Re-reads the whole dict; only needed if it was replaced or edited behind the
+        model's back. Given ids, the model shows just those assets instead.
+        """
+        self.beginResetModel()
+        self._ids = list(self.asset_dict) if ids is None else list(ids)
+        self._rows = {asset_id: row for row, asset_id in enumerate(self._ids)}
+        self.endResetModel()
+
+class AssociationModels:
+    """
+    The shared asset models of one world, created on first use per asset type.
+    Asset lists and every association combo show these same models, so opening
+    an editor never walks the world dicts; edits are pushed in with asset_changed().
+    """
+    def __init__(self, world_data):
+        self.world_data = world_data
+        self._models = {} # Asset type -> AssetListModel
+        self._reference_models = {} # Asset type -> AssetListModel with a "None" row
+        self._name_indexes = {} # Asset type -> NameIndex
+
+    def model(self, asset_type):
+        if asset_type not in self._models:
+            self._models[asset_type] = AssetListModel(getattr(self.world_data, asset_type))
+        return self._models[asset_type]
+
+    def reference_model(self, asset_type):
+        if asset_type not in self._reference_models:
+            self._reference_models[asset_type] = AssetListModel(getattr(self.world_data, asset_type), none_label="None")
+        return self._reference_models[asset_type]
+
+    def name_index(self, asset_type):
+        if asset_type not in self._name_indexes:
+            index = NameIndex()
+            index.rebuild((asset_id, asset_search_names(asset)) for asset_id, asset in getattr(self.world_data, asset_type).items())
+            self._name_indexes[asset_type] = index
+        return self._name_indexes[asset_type]
+
+    def asset_changed(self, asset_type, asset_id):
+        """Pushes an edited, added or removed asset into the models and name index."""
+        asset = getattr(self.world_data, asset_type).get(asset_id)
+        for models in (self._models, self._reference_models):
+            if asset_type in models:
+                if asset is None:
+                    models[asset_type].asset_removed(asset_id)
+                else:
+                    models[asset_type].asset_changed(asset_id)
+        if asset_type in self._name_indexes:
+            if asset is None:
+                self._name_indexes[asset_type].remove(asset_id)
+            else:
+                self._name_indexes[asset_type].update(asset_id, asset_search_names(asset))
+
+    def reload(self):
+        for model in (*self._models.values(), *self._reference_models.values()):
+            model.reload()
+        self._name_indexes.clear() # Rebuilt on next use
+
+# --- Thumbnails ---
+
+def decode_thumbnail(source_path, size):
+    """
+    Decodes an image straight to thumbnail size, centre-cropped to fill it. Scaled
+    decoding lets the reader skip most of a large source (e.g. JPEG DCT scaling).
+    """
+    reader = QImageReader(source_path)
+    reader.setAutoTransform(True)
+    source_size = reader.size()
+    if source_size.isValid():
+        reader.setScaledSize(source_size.scaled(size, Qt.KeepAspectRatioByExpanding))
+    image = reader.read()
+    if image.isNull():
+        return image
+    if image.size() != size:
+        image = image.scaled(size, Qt.KeepAspectRatioByExpanding, Qt.SmoothTransformation)
+        image = image.copy((image.width() - size.width()) // 2, (image.height() - size.height()) // 2, size.width(), size.height())
+    return image
+
+class ThumbnailJobSignals(QObject):
+    finished = Signal(str, QImage) # Cache key, thumbnail (null if the source can't be read)
+
+class ThumbnailJob(QRunnable):
+    """Produces one thumbnail on a worker thread, from the disk cache if possible."""
+    def __init__(self, key, source_path, cache_path, size):
+        super().__init__()
+        self.key = key
+        self.source_path = source_path
+        self.cache_path = cache_path
+        self.size = size
+        self.signals = ThumbnailJobSignals()
+
+    def run(self):
+        image = QImageReader(self.cache_path).read() if os.path.exists(self.cache_path) else QImage()
+        profiler.hit("thumbnail.disk", not image.isNull())
+        if image.isNull():
+            with profiler.span("thumbnail.decode", "image"):
+                image = decode_thumbnail(self.source_path, self.size)
+            if not image.isNull():
+                try:
+                    os.makedirs(os.path.dirname(self.cache_path), exist_ok=True)
+                    temp_path = f"{self.cache_path}.{uuid.uuid4().hex[:8]}.tmp"
+                    if image.save(temp_path, "PNG"):
+                        os.replace(temp_path, self.cache_path)
+                except OSError as e:
+                    logger.error(f"Failed to cache thumbnail of {self.source_path}: {e}")
+        self.signals.finished.emit(self.key, image)
+
+class ThumbnailService(QObject):
+    """
+    Serves sized thumbnails of asset images. Sources are decoded on a thread pool and
+    written to an on-disk cache keyed by a hash of the source path, its size and mtime,
+    and the thumbnail size; in memory they live in QPixmapCache under a byte budget.
+    Callers get a placeholder until their thumbnail is ready, then a callback.
+    """
+    MEMORY_BUDGET_KB = 64 * 1024
+
+    _instance = None
+
+    @classmethod
+    def instance(cls):
+        if cls._instance is None:
+            cls._instance = cls(os.path.join("data", "thumbnails"))
+        return cls._instance
+
+    def __init__(self, cache_dir, parent=None):
+        super().__init__(parent)
+        self.cache_dir = cache_dir
+        self.pool = QThreadPool(self)
+        self.pool.setMaxThreadCount(max(1, QThread.idealThreadCount() // 2)) # Leave cores for the UI
+        self._jobs = {} # Cache key -> running ThumbnailJob
+        self._callbacks = {} # Cache key -> callbacks waiting for it
+        self._placeholders = {} # (width, height) -> placeholder pixmap
+        self._unreadable = set() # Cache keys whose source failed to decode; the key changes with the file's mtime
+        QPixmapCache.setCacheLimit(self.MEMORY_BUDGET_KB)
+
+    def cache_key(self, source_path, size):
+        try:
+            stat = os.stat(source_path)
+            signature = f"{os.path.abspath(source_path)}|{stat.st_size}|{stat.st_mtime_ns}|{size.width()}x{size.height()}"
+        except OSError:
+            return None
+        return hashlib.sha1(signature.encode("utf-8")).hexdigest()
+
+    def clear_placeholders(self):
+        """Forgets the placeholders, e.g. after a theme switch; they are filled again in the new colour."""
+        self._placeholders.clear()
+
+    def placeholder(self, size):
+        key = (size.width(), size.height())
+        if key not in self._placeholders:
+            pixmap = QPixmap(size)
+            pixmap.fill(theme.color("raised"))
+            self._placeholders[key] = pixmap
+        return self._placeholders[key]
+
+    def thumbnail(self, source_path, size, callback=None):
+        """
+        Returns the thumbnail of source_path if it is in memory, else a placeholder.
+        In the latter case callback(pixmap) is called once the thumbnail is ready.
+        """
+        key = self.cache_key(source_path, size) if source_path else None
+        if key is None or key in self._unreadable: # Missing, or known not to decode
+            return self.placeholder(size)
+        pixmap = QPixmapCache.find(key)
+        profiler.hit("thumbnail.memory", pixmap is not None and not pixmap.isNull())
+        if pixmap is not None and not pixmap.isNull():
+            return pixmap
+        if callback is not None:
+            self._callbacks.setdefault(key, []).append(callback)
+        if key not in self._jobs:
+            job = ThumbnailJob(key, source_path, os.path.join(self.cache_dir, key[:2], f"{key}.png"), QSize(size))
+            job.signals.finished.connect(self.on_job_finished)
+            self._jobs[key] = job
+            self.pool.start(job)
+        return self.placeholder(size)
+
+    def on_job_finished(self, key, image):
+        self._jobs.pop(key, None)
+        callbacks = self._callbacks.pop(key, [])
+        if image.isNull():
+            self._unreadable.add(key) # The placeholder stays, and the source isn't decoded again until it changes
+            return
+        pixmap = QPixmap.fromImage(image)
+        QPixmapCache.insert(key, pixmap)
+        for callback in callbacks:
+            try:
+                callback(pixmap)
+            except RuntimeError:
+                pass # The widget waiting for it was deleted
+
+# --- Shadows ---
+
+SHADOW_BLUR = 12 # Pixels the shadow fades over
+SHADOW_OFFSET = QPoint(0, 3)
+SHADOW_COLOR = QColor(0, 0, 0, 150)
+
+_shadow_tiles = {} # (blur, rgba, device pixel ratio) -> 9-slice source pixmap
+
+def shadow_tile(blur, color, dpr=1.0):
+    """
+    The 9-slice source of a soft shadow: blurred corners and edges around a 1px solid
+    centre, drawn with gradients once per blur radius, colour and pixel ratio.
+    """
+    key = (blur, color.rgba(), dpr)
+    tile = _shadow_tiles.get(key)
+    if tile is None:
+        side = 2 * blur + 1
+        tile = QPixmap(round(side * dpr), round(side * dpr))
+        tile.setDevicePixelRatio(dpr)
+        tile.fill(Qt.transparent)
+        faded = QColor(color)
+        faded.setAlphaF(color.alphaF() * 0.35)
+        clear = QColor(color)
+        clear.setAlpha(0)
+
+        def stops(gradient):
+            gradient.setColorAt(0, color)
+            gradient.setColorAt(0.45, faded)
+            gradient.setColorAt(1, clear)
+            return QBrush(gradient)
+
+        painter = QPainter(tile)
+        painter.setPen(Qt.NoPen)
+        centre = QPointF(blur + 0.5, blur + 0.5)
+        for x, y in ((0, 0), (blur + 1, 0), (0, blur + 1), (blur + 1, blur + 1)):
+            painter.setBrush(stops(QRadialGradient(centre, blur + 0.5)))
+            painter.drawRect(QRectF(x, y, blur, blur))
+        for start, stop, rect in (
+            (QPointF(blur + 0.5, blur), QPointF(blur + 0.5, 0), QRectF(blur, 0, 1, blur)), # Top
+            (QPointF(blur + 0.5, blur + 1), QPointF(blur + 0.5, side), QRectF(blur, blur + 1, 1, blur)), # Bottom
+            (QPointF(blur, blur + 0.5), QPointF(0, blur + 0.5), QRectF(0, blur, blur, 1)), # Left
+            (QPointF(blur + 1, blur + 0.5), QPointF(side, blur + 0.5), QRectF(blur + 1, blur, blur, 1)), # Right
+        ):
+            painter.setBrush(stops(QLinearGradient(start, stop)))
+            painter.drawRect(rect)
+        painter.fillRect(QRectF(blur, blur, 1, 1), color)
+        painter.end()
+        _shadow_tiles[key] = tile
+    return tile
+
+def shadow_pixmap(width, height, blur=SHADOW_BLUR, color=SHADOW_COLOR, dpr=1.0):
+    """
+    The shadow of a width x height rectangle, padded by blur on every side. Assembled
+    from the 9-slice tile and kept in QPixmapCache, so each card size is drawn once.
+    """
+    key = f"shadow:{width}x{height}:{blur}:{color.rgba():08x}:{dpr}"
+    pixmap = QPixmapCache.find(key)
+    profiler.hit("shadow", pixmap is not None and not pixmap.isNull())
+    if pixmap is not None and not pixmap.isNull():
+        return pixmap
+    tile = shadow_tile(blur, color, dpr)
+    full_w, full_h = width + 2 * blur, height + 2 * blur
+    pixmap = QPixmap(round(full_w * dpr), round(full_h * dpr))
+    pixmap.setDevicePixelRatio(dpr)
+    pixmap.fill(Qt.transparent)
+    painter = QPainter(pixmap)
+    # Source columns/rows of the tile (in device pixels) and where each lands (logical)
+    b, t = blur * dpr, (blur + 1) * dpr
+    columns = ((0, b, 0, blur), (b, dpr, blur, width), (t, b, blur + width, blur))
+    rows = ((0, b, 0, blur), (b, dpr, blur, height), (t, b, blur + height, blur))
+    for sx, sw, dx, dw in columns:
+        for sy, sh, dy, dh in rows:
+            painter.drawPixmap(QRectF(dx, dy, dw, dh), tile, QRectF(sx, sy, sw, sh))
+    painter.end()
+    QPixmapCache.insert(key, pixmap)
+    return pixmap
 
 # --- Reusable UI Components ---
 class CardWidget(QFrame):
     """
     A custom widget that serves as the base for all 'card' elements in the UI.
     It includes the Art Deco border, shadow, and a Material-style ripple click effect.
+    The shadow is a cached pixmap painted in a margin around the card body, instead of
+    a QGraphicsDropShadowEffect that re-blurs the whole card on every repaint.
     """
+    SHADOW_MARGIN = SHADOW_BLUR + max(abs(SHADOW_OFFSET.x()), abs(SHADOW_OFFSET.y()))
+
     def __init__(self, parent=None):
         super().__init__(parent)
+        margin = self.SHADOW_MARGIN
         self.setLayout(QVBoxLayout())
-        self.layout().setContentsMargins(20, 20, 20, 20) # Inner padding for content
-
-        # --- Shadow Effect for a "lifted" look ---
-        shadow = QGraphicsDropShadowEffect(self)
-        shadow.setBlurRadius(25)
-        shadow.setColor(QColor(0, 0, 0, 150))
-        shadow.setOffset(0, 3)
-        self.setGraphicsEffect(shadow)
+        self.layout().setContentsMargins(20 + margin, 20 + margin, 20 + margin, 20 + margin) # Inner padding for content
 
         # --- Ripple Effect Properties ---
         self._ripple_radius = 0
         self._ripple_opacity = 0
         self._ripple_pos = QPoint()
 
-        # --- Set base background color ---
-        self.setAutoFillBackground(True)
-        p = self.palette()
-        p.setColor(self.backgroundRole(), QColor("#1a1f25"))
-        self.setPalette(p)
+    def body_rect(self):
+        """The card itself, inside the margin its shadow is painted in."""
+        margin = self.SHADOW_MARGIN
+        return self.rect().adjusted(margin, margin, -margin, -margin)
 
     # --- Ripple Animation Properties (for QPropertyAnimation) ----
     @Property(float)
@@ -298,7 +814,7 @@ class CardWidget(QFrame):
     @rippleRadius.setter
     def rippleRadius(self, value):
         self._ripple_radius = value
-        self.update()  # Trigger a repaint
+        self.update(self.body_rect())  # Repaint the card only, never its shadow or neighbours
 
     @Property(float)
     def rippleOpacity(self):
@@ -307,46 +823,47 @@ class CardWidget(QFrame):
     @rippleOpacity.setter
     def rippleOpacity(self, value):
         self._ripple_opacity = value
-        self.update()  # Trigger a repaint
+        self.update(self.body_rect())
 
     def mousePressEvent(self, event):
         # Start the ripple animation on click
         self._ripple_pos = event.pos()
         
-        radius_anim = QPropertyAnimation(self, b"rippleRadius")
-        radius_anim.setStartValue(0)
-        radius_anim.setEndValue(self.width() * 0.8)
-        radius_anim.setDuration(400)
-        radius_anim.setEasingCurve(QEasingCurve.OutCubic)
-
-        opacity_anim = QPropertyAnimation(self, b"rippleOpacity")
-        opacity_anim.setStartValue(0.4)
-        opacity_anim.setEndValue(0.0)
-        opacity_anim.setDuration(450)
-        
-        radius_anim.start()
-        opacity_anim.start()
+        manager = AnimationManager.instance()
+        manager.animate(self, "rippleRadius", 0.0, self.body_rect().width() * 0.8, 400, QEasingCurve.OutCubic)
+        manager.animate(self, "rippleOpacity", 0.4, 0.0, 450)
         super().mousePressEvent(event)
 
+    @profiler.timed("card.paint", "paint")
     def paintEvent(self, event):
-        # Let the base class paint its background first
+        # Let the base class paint its frame first
         super().paintEvent(event)
         painter = QPainter(self)
+        body = self.body_rect()
+
+        # --- Draw Shadow and Body ---
+        if not body.contains(event.rect()):
+            shadow = shadow_pixmap(body.width(), body.height(), dpr=self.devicePixelRatioF())
+            painter.drawPixmap(body.topLeft() + SHADOW_OFFSET - QPoint(SHADOW_BLUR, SHADOW_BLUR), shadow)
+        painter.fillRect(body, theme.color("surface")) # Under the body only, not the shadow margin
         painter.setRenderHint(QPainter.Antialiasing)
 
         # --- Draw Ripple Effect ---
         if self._ripple_radius > 0:
+            painter.save()
+            painter.setClipRect(body)
             painter.setPen(Qt.NoPen)
-            color = QColor("#00e5ff")  # Cyan ripple
+            color = QColor(theme.color("accent"))  # Cyan ripple
             color.setAlphaF(self._ripple_opacity)
             painter.setBrush(QBrush(color))
             painter.drawEllipse(self._ripple_pos, self._ripple_radius, self._ripple_radius)
+            painter.restore()
 
         # --- Draw Art Deco Border (on top of everything else) ---
-        pen = QPen(QColor("#D4AF37"))  # Gold color
+        pen = QPen(theme.color("gold"))  # Gold color
         pen.setWidth(2)
         painter.setPen(pen)
-        rect = self.rect().adjusted(1, 1, -1, -1)
+        rect = body.adjusted(1, 1, -1, -1)
         painter.drawRect(rect)
         
         # Draw geometric corners for the Art Deco feel
@@ -365,24 +882,15 @@ class CharacterCard(CardWidget):
     def __init__(self, character_name, character_archetype, image_path, parent=None):
         super().__init__(parent)
         
-        main_layout = QHBoxLayout(self.layout()) # Get the layout from the parent
+        main_layout = QHBoxLayout()
+        self.layout().addLayout(main_layout) # Nest inside the card's own layout
         
         # --- Image Label (Left Side) ---
         self.image_label = QLabel()
         self.image_label.setFixedSize(120, 120)
-        self.image_label.setScaledContents(True)
-        pixmap = QPixmap(image_path)
-        if pixmap.isNull():
-             # Provide a fallback placeholder
-             pixmap = QPixmap(120, 120)
-             pixmap.fill(QColor("#2a2f38"))
-        self.image_label.setPixmap(pixmap)
-        self.image_label.setStyleSheet("""
-            QLabel {
-                border: 2px solid #D4AF37; /* Gold border */
-                border-radius: 60px; /* Half of the size for a circle */
-            }
-        """)
+        # Placeholder until the thumbnail has been decoded in the background
+        self.image_label.setPixmap(ThumbnailService.instance().thumbnail(image_path, QSize(120, 120), self.image_label.setPixmap))
+        self.image_label.setObjectName("cardPortrait")
         
         # --- Info Layout (Right Side) ---
         info_layout = QVBoxLayout()
@@ -390,11 +898,10 @@ class CharacterCard(CardWidget):
         info_layout.setAlignment(Qt.AlignVCenter)
         
         name_label = QLabel(character_name)
-        name_label.setObjectName("header") # Use the header style from QSS
-        name_label.setStyleSheet("font-size: 22px; padding: 0;")
+        name_label.setObjectName("cardName") # A smaller header, styled in style.qss
         
         archetype_label = QLabel(character_archetype)
-        archetype_label.setStyleSheet("color: #8a8f98; font-style: italic; border: none;")
+        archetype_label.setObjectName("cardSubtitle")
         
         info_layout.addWidget(name_label)
         info_layout.addWidget(archetype_label)
@@ -413,10 +920,20 @@ class CaseMetaCard(CardWidget):
         layout.addWidget(QLabel(f"Culprit: {case_meta_obj.culprit}"))
         layout.addWidget(QLabel(f"Crime Scene: {case_meta_obj.crime_scene}"))
 
+def add_portrait(card, image_path, size=64):
+    """Puts a character portrait thumbnail at the top of a card, if the character has an image."""
+    if not image_path:
+        return
+    portrait = QLabel()
+    portrait.setFixedSize(size, size)
+    portrait.setPixmap(ThumbnailService.instance().thumbnail(image_path, QSize(size, size), portrait.setPixmap))
+    card.layout().addWidget(portrait)
+
 class SuspectCard(CardWidget):
     def __init__(self, character_obj, parent=None):
         super().__init__(parent)
         layout = self.layout()
+        add_portrait(self, character_obj.image)
         layout.addWidget(QLabel(f"Suspect: {character_obj.full_name}"))
         layout.addWidget(QLabel(f"Archetype: {character_obj.archetype}"))
 
@@ -424,6 +941,7 @@ class WitnessCard(CardWidget):
     def __init__(self, character_obj, parent=None):
         super().__init__(parent)
         layout = self.layout()
+        add_portrait(self, character_obj.image)
         layout.addWidget(QLabel(f"Witness: {character_obj.full_name}"))
         layout.addWidget(QLabel(f"Honesty: {character_obj.honesty}"))
 
@@ -444,11 +962,21 @@ class CaseLocationCard(CardWidget):
 
 # --- The Interactive Plot Graph ---
 class ConnectionNode(QGraphicsItem):
-    """Represents a single asset card as a movable node on the graph."""
-    def __init__(self, card_widget, parent=None):
+    """
+    Represents a single asset card as a movable node on the graph. The card can be
+    given as a widget or as a zero-argument factory; a factory is only called once
+    the node is first viewed up close, and a lightweight placeholder with the
+    node's title is painted until then.
+    """
+    PLACEHOLDER_SIZE = QRectF(0, 0, 260, 80)
+
+    def __init__(self, card_widget, key=None, title="", parent=None):
         super().__init__(parent)
-        self.proxy = QGraphicsProxyWidget(self)
-        self.proxy.setWidget(card_widget)
+        self.key = key # Stable board node key used to persist the layout
+        self.title = title
+        self.proxy = None
+        self._card_factory = None
+        self._card_rect = QRectF(self.PLACEHOLDER_SIZE)
         
         self.setFlags(QGraphicsItem.ItemIsMovable |
                       QGraphicsItem.ItemIsSelectable |
@@ -456,21 +984,57 @@ class ConnectionNode(QGraphicsItem):
         
         self.sockets = []
         self.socket_radius = 6
-        self._create_sockets()
         self.lines = []
+        self.layers = set() # ConnectionLayers drawing derived edges to this node
+
+        if callable(card_widget) and not isinstance(card_widget, QWidget):
+            self._card_factory = card_widget
+            self._create_sockets()
+        else:
+            self._embed(card_widget)
+
+    @property
+    def is_realized(self):
+        return self.proxy is not None
+
+    def realize(self):
+        """Builds the real card widget in place of the placeholder."""
+        if self.proxy is None:
+            factory, self._card_factory = self._card_factory, None
+            self._embed(factory())
+
+    def _embed(self, card_widget):
+        self.prepareGeometryChange()
+        self.proxy = QGraphicsProxyWidget(self)
+        self.proxy.setWidget(card_widget)
+        self._card_rect = QRectF(self.proxy.widget().rect())
+        self._create_sockets()
+        for line in self.lines:
+            line.update_path()
+        for layer in self.layers:
+            layer.invalidate()
 
     def _create_sockets(self):
-        card_rect = self.proxy.widget().rect()
+        card_rect = self._card_rect
         # Sockets are positioned relative to the ConnectionNode's origin
-        self.sockets.append(QPointF(0, card_rect.height() / 2)) # Left
-        self.sockets.append(QPointF(card_rect.width(), card_rect.height() / 2)) # Right
+        self.sockets = [
+            QPointF(0, card_rect.height() / 2), # Left
+            QPointF(card_rect.width(), card_rect.height() / 2), # Right
+        ]
 
     def boundingRect(self):
-        return self.proxy.boundingRect().adjusted(-self.socket_radius, -self.socket_radius, self.socket_radius, self.socket_radius)
+        return self._card_rect.adjusted(-self.socket_radius, -self.socket_radius, self.socket_radius, self.socket_radius)
 
     def paint(self, painter, option, widget=None):
-        painter.setPen(QPen(QColor("#D4AF37"), 2))
-        painter.setBrush(QBrush(QColor("#10141a")))
+        if self.proxy is None:
+            # Same colours as CardWidget, without building any widgets
+            painter.setPen(QPen(theme.color("gold"), 2))
+            painter.setBrush(QBrush(theme.color("surface")))
+            painter.drawRect(self._card_rect.adjusted(1, 1, -1, -1))
+            painter.setPen(theme.color("text"))
+            painter.drawText(self._card_rect.adjusted(20, 0, -20, 0), Qt.AlignVCenter, self.title)
+        painter.setPen(QPen(theme.color("gold"), 2))
+        painter.setBrush(QBrush(theme.color("background")))
         for pos in self.sockets:
             painter.drawEllipse(pos, self.socket_radius, self.socket_radius)
             
@@ -478,6 +1042,8 @@ class ConnectionNode(QGraphicsItem):
         if change == QGraphicsItem.ItemPositionHasChanged:
             for line in self.lines:
                 line.update_path()
+            for layer in self.layers:
+                layer.invalidate()
         return super().itemChange(change, value)
 
     def get_socket_scene_pos(self, index):
@@ -494,7 +1060,7 @@ class ConnectionLine(QGraphicsItem):
         self.end_node = end_node
         self.end_socket_idx = end_socket_idx
         
-        self.pen = QPen(QColor("#00e5ff"), 2)
+        self.pen = QPen(theme.color("accent"), 2)
         self.pen.setCapStyle(Qt.RoundCap)
         
         self._path = QPainterPath()
@@ -509,14 +1075,7 @@ class ConnectionLine(QGraphicsItem):
         end_pos = self.end_node.get_socket_scene_pos(self.end_socket_idx)
         
         path = QPainterPath()
-        path.moveTo(start_pos)
-        
-        dx = end_pos.x() - start_pos.x()
-        dy = end_pos.y() - start_pos.y()
-        ctrl1 = QPointF(start_pos.x() + dx * 0.5, start_pos.y())
-        ctrl2 = QPointF(start_pos.x() + dx * 0.5, end_pos.y())
-        
-        path.cubicTo(ctrl1, ctrl2, end_pos)
+        add_connection_curve(path, start_pos, end_pos)
         self._path = path
 
     def paint(self, painter, option, widget=None):
@@ -524,37 +1083,391 @@ class ConnectionLine(QGraphicsItem):
         painter.setBrush(Qt.NoBrush)
         painter.drawPath(self._path)
 
+def add_connection_curve(path, start_pos, end_pos):
+    """Appends the Bezier curve used for all plot graph connections to a path."""
+    path.moveTo(start_pos)
+    dx = end_pos.x() - start_pos.x()
+    ctrl1 = QPointF(start_pos.x() + dx * 0.5, start_pos.y())
+    ctrl2 = QPointF(start_pos.x() + dx * 0.5, end_pos.y())
+    path.cubicTo(ctrl1, ctrl2, end_pos)
+
+class ConnectionLayer(QGraphicsItem):
+    """
+    Draws every derived edge of one relationship type from a single item, so a
+    dense board costs one item per relationship type instead of one per edge.
+    """
+    COLORS = {
+        "Dependency": "#00e5ff",
+        "Unlocks": "#D4AF37",
+        "Debunks": "#FF6B6B",
+        "Association": "#8a8f98",
+        "Testimony": "#b388ff",
+    }
+
+    def __init__(self, relation, parent=None):
+        super().__init__(parent)
+        self.relation = relation
+        self.edges = {} # (start key, end key) -> (start node, end node)
+        self._edge_counts = {} # Node -> number of this layer's edges at it
+        self.pen = QPen(QColor(self.COLORS.get(relation, "#00e5ff")), 2)
+        self.pen.setCapStyle(Qt.RoundCap)
+        self._curves = [] # (curve, control point rect) per edge
+        self._bounds = QRectF()
+        self._dirty = False
+        self.setZValue(-1) # Keep connections beneath the cards
+        self.setFlag(QGraphicsItem.ItemUsesExtendedStyleOption) # Provides option.exposedRect
+
+    def add_edge(self, start_node, end_node):
+        ends = (start_node.key, end_node.key)
+        if ends in self.edges:
+            self._release(*self.edges[ends])
+        self.edges[ends] = (start_node, end_node)
+        for node in (start_node, end_node):
+            self._edge_counts[node] = self._edge_counts.get(node, 0) + 1
+            node.layers.add(self)
+        self.invalidate()
+
+    def remove_edge(self, start_key, end_key):
+        ends = self.edges.pop((start_key, end_key), None)
+        if ends is not None:
+            self._release(*ends)
+            self.invalidate()
+
+    def _release(self, start_node, end_node):
+        """Forgets an edge's ends, detaching the layer from a node once none of its edges reach it."""
+        for node in (start_node, end_node):
+            count = self._edge_counts[node] - 1
+            if count:
+                self._edge_counts[node] = count
+            else:
+                del self._edge_counts[node]
+                node.layers.discard(self)
+
+    def invalidate(self):
+        """Marks the curves stale; they are rebuilt once on the next geometry query or paint."""
+        if not self._dirty:
+            self.prepareGeometryChange()
+            self._dirty = True
+
+    def _ensure_curves(self):
+        if self._dirty:
+            curves = []
+            bounds = QRectF()
+            for start_node, end_node in self.edges.values():
+                curve = QPainterPath()
+                add_connection_curve(curve, start_node.get_socket_scene_pos(1), end_node.get_socket_scene_pos(0))
+                curve_rect = curve.controlPointRect()
+                curves.append((curve, curve_rect))
+                bounds = bounds.united(curve_rect)
+            self._curves = curves
+            self._bounds = bounds
+            self._dirty = False
+        return self._curves
+
+    def boundingRect(self):
+        self._ensure_curves()
+        half_pen = self.pen.widthF() / 2
+        return self._bounds.adjusted(-half_pen, -half_pen, half_pen, half_pen)
+
+    def paint(self, painter, option, widget=None):
+        painter.setPen(self.pen)
+        painter.setBrush(Qt.NoBrush)
+        # Stroking one huge path is far slower than stroking the few curves in view
+        exposed = option.exposedRect
+        for curve, curve_rect in self._ensure_curves():
+            if curve_rect.intersects(exposed):
+                painter.drawPath(curve)
+
+class PlotGraphScene(QGraphicsScene):
+    """The plot graph of a single case, with its nodes indexed by board node key."""
+    def __init__(self, case_id=None, parent=None):
+        super().__init__(parent)
+        self.case_id = case_id
+        self.nodes = {} # Board node key -> ConnectionNode
+        self.nodes_by_id = {} # Entity id (clue_id, character_id, ...) -> ConnectionNode
+        self.lines = []
+        self.layers = {} # Relationship type -> ConnectionLayer
+        self.edge_index = None # case_graph.CaseEdgeIndex the layers were built from
+        self.cast = None # CaseBuilder.board_cast() of the case the cards were made for
+        self.viewport_state = None # Last BoardViewport shown for this scene
+        self.setBackgroundBrush(theme.color("background"))
+
+    def add_node(self, widget, pos=QPointF(0, 0), key=None, title=""):
+        node = ConnectionNode(widget, key, title)
+        node.setPos(pos)
+        self.addItem(node)
+        if key is not None:
+            self.nodes[key] = node
+            _, _, entity_id = key.partition(":")
+            if entity_id:
+                self.nodes_by_id.setdefault(entity_id, node)
+        return node
+
+    def remove_node(self, key):
+        """Removes a node with the manual connections and derived edges drawn to it."""
+        node = self.nodes.pop(key, None)
+        if node is None:
+            return
+        for layer in list(node.layers): # Layers detach from the node as its last edge goes
+            for start_key, end_key in [ends for ends in layer.edges if key in ends]:
+                layer.remove_edge(start_key, end_key)
+        _, _, entity_id = key.partition(":")
+        if self.nodes_by_id.get(entity_id) is node:
+            del self.nodes_by_id[entity_id]
+        for line in list(node.lines):
+            for end in (line.start_node, line.end_node):
+                if line in end.lines:
+                    end.lines.remove(line)
+            if line in self.lines:
+                self.lines.remove(line)
+            self.removeItem(line)
+        self.removeItem(node)
+
+    def begin_bulk_insert(self):
+        """Turns off the BSP index while many items are added; it is rebuilt once afterwards."""
+        self.setItemIndexMethod(QGraphicsScene.NoIndex)
+
+    def end_bulk_insert(self):
+        self.setItemIndexMethod(QGraphicsScene.BspTreeIndex)
+
 class PlotGraphView(QGraphicsView):
     """The main view for displaying and interacting with the plot graph."""
-    def __init__(self, parent=None):
+    DETAIL_ZOOM = 0.35 # Below this zoom level, cards are left as placeholders
+    scene_activated = Signal(object) # PlotGraphScene now shown
+
+    def __init__(self, parent=None, scene_cache_size=8):
         super().__init__(parent)
-        self.scene = QGraphicsScene(self)
+        # Recently viewed case scenes are kept alive so switching back is instant
+        self.scene_cache_size = scene_cache_size
+        self._scene_cache = OrderedDict() # case_id -> PlotGraphScene, most recent last
+        self._empty_scene = PlotGraphScene(parent=self)
+        self.hidden_relations = set() # Relationship types toggled off by the user
+        self.scene = self._empty_scene
         self.setScene(self.scene)
         
         self.setRenderHint(QPainter.Antialiasing)
         self.setDragMode(QGraphicsView.RubberBandDrag)
         self.setTransformationAnchor(QGraphicsView.AnchorUnderMouse)
         self.setResizeAnchor(QGraphicsView.AnchorViewCenter)
-        self.scene.setBackgroundBrush(QColor("#10141a"))
+        # Every item sets its own pen and brush, so per-item painter save/restore is wasted work
+        self.setOptimizationFlag(QGraphicsView.DontSavePainterState)
+        self.opengl_enabled = False
+
+        # Cards coming into view are built once per event loop pass, not per scroll step
+        self._realize_timer = QTimer(self)
+        self._realize_timer.setSingleShot(True)
+        self._realize_timer.timeout.connect(self.realize_visible_nodes)
+
+    def schedule_realize(self):
+        self._realize_timer.start(0)
+
+    def set_opengl_enabled(self, enabled):
+        """
+        Switches between the raster viewport and a QOpenGLWidget viewport. Returns
+        False, leaving the raster viewport in place, if no OpenGL context can be
+        created (Mesa's llvmpipe software renderer is enough).
+        """
+        if enabled == self.opengl_enabled:
+            return True
+        if enabled:
+            # Imported here so the QtOpenGL modules only load when the option is used
+            from PySide6.QtGui import QOpenGLContext, QSurfaceFormat
+            from PySide6.QtOpenGLWidgets import QOpenGLWidget
+            if not QOpenGLContext().create():
+                logger.warning("OpenGL is not available; keeping the raster plot graph viewport.")
+                return False
+            surface_format = QSurfaceFormat()
+            surface_format.setSamples(4) # Multisampling replaces the raster antialiasing pass
+            gl_widget = QOpenGLWidget()
+            gl_widget.setFormat(surface_format)
+            self.setViewport(gl_widget)
+            # A GL frame is redrawn in full anyway; tracking dirty regions only adds overhead
+            self.setViewportUpdateMode(QGraphicsView.FullViewportUpdate)
+        else:
+            self.setViewport(QWidget())
+            self.setViewportUpdateMode(QGraphicsView.MinimalViewportUpdate)
+        self.opengl_enabled = enabled
+        self.schedule_realize()
+        return True
+
+    def realize_visible_nodes(self):
+        """Builds the card widgets of lazily created nodes that are in view."""
+        if self.transform().m11() < self.DETAIL_ZOOM:
+            return
+        visible = self.mapToScene(self.viewport().rect()).boundingRect()
+        for item in self.scene.items(visible):
+            if isinstance(item, ConnectionNode) and not item.is_realized:
+                item.realize()
+
+    def jump_to_node(self, entity_id):
+        """Centres the board on the card of a clue, character or location id. Returns False if it is not on the board."""
+        node = self.scene.nodes_by_id.get(entity_id) or self.scene.nodes.get(entity_id)
+        if node is None:
+            return False
+        self.scene.clearSelection()
+        node.setSelected(True)
+        self.centerOn(node)
+        return True
+
+    def scrollContentsBy(self, dx, dy):
+        super().scrollContentsBy(dx, dy)
+        self.schedule_realize()
 
-    def add_node(self, widget, pos=QPointF(0, 0)):
-        node = ConnectionNode(widget)
-        node.setPos(pos)
-        self.scene.addItem(node)
-        return node
+    def paintEvent(self, event):
+        # Board repaints are the frames of the frame-time histogram
+        start = time.perf_counter()
+        super().paintEvent(event)
+        elapsed = time.perf_counter() - start
+        profiler.record("board.paint", "paint", start, elapsed)
+        profiler.frame(elapsed * 1000)
+
+    def resizeEvent(self, event):
+        super().resizeEvent(event)
+        self.schedule_realize()
+
+    def activate_scene(self, case_id):
+        """Shows the cached scene for a case. Returns False if it still has to be built."""
+        scene = self._scene_cache.get(case_id)
+        if scene is None:
+            return False
+        self._scene_cache.move_to_end(case_id)
+        self._set_scene(scene)
+        return True
+
+    def begin_scene(self, case_id, show=True):
+        """
+        Creates a new, empty scene for a case and caches it. Pass show=False to
+        populate it while detached from the view, then call activate_scene().
+        """
+        scene = PlotGraphScene(case_id, self)
+        self._scene_cache[case_id] = scene
+        while len(self._scene_cache) > self.scene_cache_size:
+            _, evicted = self._scene_cache.popitem(last=False)
+            if evicted is self.scene:
+                self.show_empty_scene()
+            evicted.deleteLater()
+        if show:
+            self._set_scene(scene)
+        return scene
+
+    def show_empty_scene(self):
+        self._set_scene(self._empty_scene)
+
+    def discard_scene(self, case_id):
+        """Drops a cached scene, e.g. after its case was changed elsewhere."""
+        scene = self._scene_cache.pop(case_id, None)
+        if scene is not None:
+            if scene is self.scene:
+                self.show_empty_scene()
+            scene.deleteLater()
+
+    def _set_scene(self, scene):
+        if scene is self.scene:
+            return
+        # The transform belongs to the view, so remember it per scene
+        self.scene.viewport_state = self.capture_viewport()
+        self.scene = scene
+        self.setScene(scene)
+        for relation, layer in scene.layers.items():
+            layer.setVisible(relation not in self.hidden_relations)
+        if scene.viewport_state is not None:
+            self.apply_viewport(scene.viewport_state)
+        else:
+            self.resetTransform()
+        self.schedule_realize()
+        self.scene_activated.emit(scene)
+
+    def add_node(self, widget, pos=QPointF(0, 0), key=None, title=""):
+        return self.scene.add_node(widget, pos, key, title)
 
     def connect_nodes(self, start_node, end_node):
         # Default connection: right socket of start to left socket of end
         start_socket_idx, end_socket_idx = 1, 0
         
         connection = ConnectionLine(start_node, start_socket_idx, end_node, end_socket_idx)
-        self.scene.addItem(connection)
+        scene = start_node.scene()
+        scene.addItem(connection)
+        scene.lines.append(connection)
         
         # Register the line with the nodes so they can update it on move
         start_node.lines.append(connection)
         end_node.lines.append(connection)
         
         return connection
+
+    def restore_edges(self, edges, scene=None):
+        scene = scene or self.scene
+        for edge in edges:
+            start_node = scene.nodes.get(edge.start_node)
+            end_node = scene.nodes.get(edge.end_node)
+            if start_node and end_node:
+                self.connect_nodes(start_node, end_node)
+
+    def cached_scene(self, case_id):
+        return self._scene_cache.get(case_id)
+
+    def apply_theme(self):
+        """Recolours the empty scene and every cached one after a theme switch."""
+        for scene in [self._empty_scene, *self._scene_cache.values()]:
+            scene.setBackgroundBrush(theme.color("background"))
+            for line in scene.lines:
+                line.pen.setColor(theme.color("accent"))
+                line.update()
+
+    def show_derived_edges(self, edges, scene=None):
+        """Adds derived case edges to a scene, batched into one layer per relationship type."""
+        scene = scene or self.scene
+        for edge in edges:
+            start_node = scene.nodes.get(edge.start_node)
+            end_node = scene.nodes.get(edge.end_node)
+            if not (start_node and end_node):
+                continue # The other end is not on the board
+            layer = scene.layers.get(edge.relation)
+            if layer is None:
+                layer = ConnectionLayer(edge.relation)
+                layer.setVisible(edge.relation not in self.hidden_relations)
+                scene.addItem(layer)
+                scene.layers[edge.relation] = layer
+            layer.add_edge(start_node, end_node)
+
+    def hide_derived_edges(self, edges, scene=None):
+        scene = scene or self.scene
+        for edge in edges:
+            layer = scene.layers.get(edge.relation)
+            if layer is not None:
+                layer.remove_edge(edge.start_node, edge.end_node)
+
+    def set_relation_visible(self, relation, visible):
+        if visible:
+            self.hidden_relations.discard(relation)
+        else:
+            self.hidden_relations.add(relation)
+        layer = self.scene.layers.get(relation)
+        if layer is not None:
+            layer.setVisible(visible)
+
+    def capture_viewport(self):
+        center = self.mapToScene(self.viewport().rect().center())
+        return schemas.BoardViewport(center.x(), center.y(), self.transform().m11())
+
+    def apply_viewport(self, viewport, scene=None):
+        if scene is not None and scene is not self.scene:
+            scene.viewport_state = viewport # Applied when the scene is shown
+            return
+        self.resetTransform()
+        self.scale(viewport.zoom, viewport.zoom)
+        self.centerOn(viewport.center_x, viewport.center_y)
+        self.schedule_realize()
+
+    def capture_layout(self):
+        """Returns the current arrangement of the visible scene as a BoardLayout."""
+        layout = schemas.BoardLayout(viewport=self.capture_viewport())
+        for key, node in self.scene.nodes.items():
+            layout.node_positions[key] = schemas.BoardNodePosition(node.pos().x(), node.pos().y())
+        for line in self.scene.lines:
+            if line.start_node.key is not None and line.end_node.key is not None:
+                layout.edges.append(schemas.BoardEdge(line.start_node.key, line.end_node.key))
+        return layout
         
     def wheelEvent(self, event):
         zoom_in_factor = 1.15
@@ -564,81 +1477,117 @@ class PlotGraphView(QGraphicsView):
             self.scale(zoom_in_factor, zoom_in_factor)
         else:
             self.scale(zoom_out_factor, zoom_out_factor)
+        self.schedule_realize()
 
-# --- Validator Components ---
-class ValidatorWorker(QThread):
-    validation_finished = Signal(list) # Signal to emit validation results
+class MinimapView(QWidget):
+    """
+    A small overview of the plot graph. The scene is rendered once into a cached,
+    low-resolution pixmap and afterwards only the regions reported by the scene's
+    changed() signal are re-rendered. Clicking or dragging centres the board there.
+    """
+    def __init__(self, graph_view, parent=None):
+        super().__init__(parent)
+        self.graph_view = graph_view
+        self.scene = None
+        self._pixmap = QPixmap()
+        self._scene_rect = QRectF()
+        self._scale = 1.0
+        self._origin = QPointF()
+        self._dirty_regions = []
+        self._full_redraw = True
+        self.setMinimumSize(200, 150)
+
+        # Scene changes arrive in bursts (dragging, realizing cards); render at most ~10x a second
+        self._render_timer = QTimer(self)
+        self._render_timer.setSingleShot(True)
+        self._render_timer.setInterval(100)
+        self._render_timer.timeout.connect(self.render_pending)
+
+        graph_view.scene_activated.connect(self.set_scene)
+        for scroll_bar in (graph_view.horizontalScrollBar(), graph_view.verticalScrollBar()):
+            scroll_bar.valueChanged.connect(self.update)
+            scroll_bar.rangeChanged.connect(self.update)
+        self.set_scene(graph_view.scene)
+
+    def set_scene(self, scene):
+        if self.scene is not None:
+            self.scene.changed.disconnect(self._on_scene_changed)
+            self.scene.sceneRectChanged.disconnect(self._on_scene_rect_changed)
+        self.scene = scene
+        scene.changed.connect(self._on_scene_changed)
+        scene.sceneRectChanged.connect(self._on_scene_rect_changed)
+        self._on_scene_rect_changed()
+
+    def _on_scene_changed(self, regions):
+        if not self._full_redraw:
+            self._dirty_regions.extend(regions)
+        self._render_timer.start()
+
+    def _on_scene_rect_changed(self, rect=None):
+        self._full_redraw = True
+        self._dirty_regions.clear()
+        self._render_timer.start()
+
+    def render_pending(self):
+        """Re-renders the dirty parts of the scene into the cached overview pixmap."""
+        if self.scene is None or self.width() <= 0 or self.height() <= 0:
+            return
+        if self._full_redraw or self._pixmap.size() != self.size():
+            self._scene_rect = self.scene.sceneRect()
+            if self._scene_rect.isEmpty():
+                self._scene_rect = QRectF(0, 0, 1, 1)
+            self._scale = min(self.width() / self._scene_rect.width(), self.height() / self._scene_rect.height())
+            self._origin = QPointF((self.width() - self._scene_rect.width() * self._scale) / 2,
+                                   (self.height() - self._scene_rect.height() * self._scale) / 2)
+            self._pixmap = QPixmap(self.size())
+            self._pixmap.fill(theme.color("background"))
+            regions = [self._scene_rect]
+        else:
+            regions = self._dirty_regions
+
+        painter = QPainter(self._pixmap)
+        # Grow each region by a minimap pixel so rounding does not leave seams
+        margin = 1 / self._scale
+        for region in regions:
+            source = region.adjusted(-margin, -margin, margin, margin).intersected(self._scene_rect)
+            if not source.isEmpty():
+                self.scene.render(painter, self.map_from_scene(source), source, Qt.IgnoreAspectRatio)
+        painter.end()
+
+        self._dirty_regions = []
+        self._full_redraw = False
+        self.update()
 
-    def __init__(self, data_manager):
-        super().__init__()
-        self.data_manager = data_manager
+    def map_from_scene(self, rect):
+        top_left = (rect.topLeft() - self._scene_rect.topLeft()) * self._scale + self._origin
+        return QRectF(top_left, rect.size() * self._scale)
 
-    def run(self):
-        results = []
-
-        # --- World Data Validations ---
-        # Check for characters with empty full names
-        for char_id, character in self.data_manager.world_data.characters.items():
-            if not character.full_name:
-                results.append({'message': f"Warning: Character with ID {char_id} has no full name.", 'asset_type': 'characters', 'asset_id': char_id})
-
-        # Check for locations with empty names
-        for loc_id, location in self.data_manager.world_data.locations.items():
-            if not location.name:
-                results.append({'message': f"Warning: Location with ID {loc_id} has no name.", 'asset_type': 'locations', 'asset_id': loc_id})
-
-        # Check for factions with empty names
-        for faction_id, faction in self.data_manager.world_data.factions.items():
-            if not faction.name:
-                results.append({'message': f"Warning: Faction with ID {faction_id} has no name.", 'asset_type': 'factions', 'asset_id': faction_id})
-
-        # Check for items with empty names
-        for item_id, item in self.data_manager.world_data.items.items():
-            if not item.item:
-                results.append({'message': f"Warning: Item with ID {item_id} has no name.", 'asset_type': 'items', 'asset_id': item_id})
-
-        # Check for districts with empty names
-        for district_id, district in self.data_manager.world_data.districts.items():
-            if not district.district_name:
-                results.append({'message': f"Warning: District with ID {district_id} has no name.", 'asset_type': 'districts', 'asset_id': district_id})
-
-        # --- Case Data Validations (Basic Solvability and Deception Integrity) ---
-        for case_id, case_file in self.data_manager.case_files.items():
-            if not case_file.case_meta.victim:
-                results.append({'message': f"Error: Case '{case_id}' has no victim defined.", 'asset_type': 'cases', 'asset_id': case_id})
-            if not case_file.case_meta.culprit:
-                results.append({'message': f"Error: Case '{case_id}' has no culprit defined.", 'asset_type': 'cases', 'asset_id': case_id})
-            if not case_file.case_meta.crime_scene:
-                results.append({'message': f"Warning: Case '{case_id}' has no crime scene defined.", 'asset_type': 'cases', 'asset_id': case_id})
-
-            # Check if Means, Motive, Opportunity clues exist
-            for clue_type in ["means_clue", "motive_clue", "opportunity_clue"]:
-                clue_id = getattr(case_file.case_meta, clue_type)
-                if clue_id and not any(c.clue_id == clue_id for c in case_file.clues):
-                    results.append({'message': f"Error: Case '{case_id}' references a non-existent {clue_type} '{clue_id}'.", 'asset_type': 'clues', 'asset_id': clue_id})
-
-            # Deception Integrity Check
-            for suspect in case_file.key_suspects:
-                for interview in suspect.interviews:
-                    if interview.answer.is_lie and not interview.answer.debunking_clue:
-                        results.append({'message': f"Warning: Suspect '{suspect.character_id}' has a lie without a debunking clue in case '{case_id}'.", 'asset_type': 'characters', 'asset_id': suspect.character_id})
-                    if interview.answer.is_lie and interview.answer.debunking_clue and not any(c.clue_id == interview.answer.debunking_clue for c in case_file.clues):
-                        results.append({'message': f"Error: Suspect '{suspect.character_id}' references a non-existent debunking clue '{interview.answer.debunking_clue}' in case '{case_id}'.", 'asset_type': 'clues', 'asset_id': interview.answer.debunking_clue})
-
-            for location in case_file.locations:
-                for witness in location.witnesses:
-                    for interview in witness.interviews:
-                        if interview.answer.is_lie and not interview.answer.debunking_clue:
-                            results.append({'message': f"Warning: Witness '{witness.character_id}' has a lie without a debunking clue in case '{case_id}'.", 'asset_type': 'characters', 'asset_id': witness.character_id})
-                        if interview.answer.is_lie and interview.answer.debunking_clue and not any(c.clue_id == interview.answer.debunking_clue for c in case_file.clues):
-                            results.append({'message': f"Error: Witness '{witness.character_id}' references a non-existent debunking clue '{interview.answer.debunking_clue}' in case '{case_id}'.", 'asset_type': 'clues', 'asset_id': interview.answer.debunking_clue})
-
-        # Simulate some work to show asynchronicity
-        import time
-        time.sleep(0.5)
-
-        self.validation_finished.emit(results)
+    def map_to_scene(self, point):
+        return (QPointF(point) - self._origin) / self._scale + self._scene_rect.topLeft()
 
+    def paintEvent(self, event):
+        painter = QPainter(self)
+        painter.fillRect(self.rect(), theme.color("background"))
+        painter.drawPixmap(0, 0, self._pixmap)
+        # Outline the part of the board currently shown in the graph view
+        visible = self.graph_view.mapToScene(self.graph_view.viewport().rect()).boundingRect()
+        painter.setPen(QPen(theme.color("accent"), 1))
+        painter.setBrush(Qt.NoBrush)
+        painter.drawRect(self.map_from_scene(visible))
+
+    def resizeEvent(self, event):
+        super().resizeEvent(event)
+        self._full_redraw = True
+        self._render_timer.start()
+
+    def mousePressEvent(self, event):
+        self.graph_view.centerOn(self.map_to_scene(event.position()))
+
+    def mouseMoveEvent(self, event):
+        if event.buttons() & Qt.LeftButton:
+            self.graph_view.centerOn(self.map_to_scene(event.position()))
+
+# --- Validator Components ---
 class ValidatorPanel(QWidget):
     issue_selected = Signal(str, str) # asset_type, asset_id
 
@@ -649,19 +1598,26 @@ class ValidatorPanel(QWidget):
         self.layout.setSpacing(5)
 
         self.title_label = QLabel("Validation Results")
-        self.title_label.setObjectName("header") # Use QSS header style
-        self.title_label.setStyleSheet("font-size: 18px; padding-bottom: 5px; border-bottom: 1px solid #D4AF37;")
+        self.title_label.setObjectName("panelTitle") # Styled in style.qss
         self.layout.addWidget(self.title_label)
 
         self.results_list = QListWidget()
-        self.results_list.setStyleSheet("background-color: #1a1f25; border: 1px solid #4a4f58; border-radius: 4px;")
+        self.results_list.setObjectName("validatorResults")
         self.layout.addWidget(self.results_list)
 
+    def set_status(self, status):
+        """Switches the results list between its "clear" and "issues" colours; only this widget is re-polished."""
+        if self.results_list.property("status") == status:
+            return
+        self.results_list.setProperty("status", status)
+        self.results_list.style().unpolish(self.results_list)
+        self.results_list.style().polish(self.results_list)
+
     def update_results(self, results):
         self.results_list.clear()
         if not results:
             self.results_list.addItem("No issues found. All clear!")
-            self.results_list.setStyleSheet("color: #00e5ff; background-color: #1a1f25; border: 1px solid #4a4f58; border-radius: 4px;")
+            self.set_status("clear")
         else:
             for result in results:
                 item_widget = QWidget()
@@ -669,12 +1625,11 @@ class ValidatorPanel(QWidget):
                 item_layout.setContentsMargins(0,0,0,0)
                 
                 message_label = QLabel(result['message'])
-                message_label.setStyleSheet("border: none;")
                 item_layout.addWidget(message_label)
 
                 if result.get('asset_type') and result.get('asset_id'):
                     go_to_button = QPushButton("Go to Issue")
-                    go_to_button.setStyleSheet("padding: 2px 5px; font-size: 12px; border-radius: 4px; background-color: #2a2f38; color: #00e5ff;")
+                    go_to_button.setObjectName("issueButton")
                     go_to_button.clicked.connect(lambda checked, at=result['asset_type'], aid=result['asset_id']: self.issue_selected.emit(at, aid))
                     item_layout.addWidget(go_to_button)
 
@@ -682,8 +1637,171 @@ class ValidatorPanel(QWidget):
                 list_item.setSizeHint(item_widget.sizeHint())
                 self.results_list.addItem(list_item)
                 self.results_list.setItemWidget(list_item, item_widget)
-                list_item.setForeground(QColor("#FF6B6B")) # Red color for warnings/errors
-            self.results_list.setStyleSheet("color: #FF6B6B; background-color: #1a1f25; border: 1px solid #4a4f58; border-radius: 4px;")
+            self.set_status("issues") # Red for warnings/errors
+
+# --- Global Search ---
+
+class SearchIndexWorker(QThread):
+    """Loads the saved full-text index, or rebuilds it if the data files changed since it was written."""
+    index_ready = Signal(object)
+
+    def __init__(self, data_manager, index_path):
+        super().__init__()
+        self.data_manager = data_manager
+        self.index_path = index_path
+
+    def run(self):
+        stamp = source_stamp(self.data_manager.data_file_paths())
+        with profiler.span("search.load_index", "search"):
+            index = FullTextIndex.load(self.index_path, stamp)
+        profiler.hit("search.saved_index", index is not None)
+        if index is None:
+            with profiler.span("search.build_index", "search"):
+                index = FullTextIndex.build(self.data_manager.world_data, self.data_manager.case_files)
+            try:
+                index.save(self.index_path, stamp)
+            except OSError as e:
+                logger.error(f"Failed to save search index: {e}")
+        self.index_ready.emit(index)
+
+class SearchService(QObject):
+    """
+    Owns the global full-text index. It is built off the UI thread at startup and then
+    kept current from DataManager saves; saves that arrive while it is still being
+    built are replayed once it is ready. The index is written back to disk, off the GUI
+    thread, shortly after the last change.
+    """
+    SAVE_DELAY_MS = 2000
+
+    def __init__(self, data_manager, parent=None):
+        super().__init__(parent)
+        self.data_manager = data_manager
+        self.index_path = os.path.join(data_manager.base_path, "search_index.json")
+        self.index = None
+        self._pending = [] # Saves received before the index was ready
+        self._save_timer = QTimer(self)
+        self._save_timer.setSingleShot(True)
+        self._save_timer.setInterval(self.SAVE_DELAY_MS)
+        self._save_timer.timeout.connect(self.save_index)
+        data_manager.add_listener(self.on_data_saved)
+
+        self.worker = SearchIndexWorker(data_manager, self.index_path)
+        self.worker.index_ready.connect(self.on_index_ready)
+        self.worker.start()
+
+    def on_index_ready(self, index):
+        self.index = index
+        pending, self._pending = self._pending, []
+        for kind, keys in pending:
+            self.on_data_saved(kind, keys)
+
+    def on_data_saved(self, kind, keys):
+        if self.index is None:
+            self._pending.append((kind, keys))
+            return
+        if kind == "world":
+            if keys is None:
+                self.index.update_world(self.data_manager.world_data)
+            else:
+                for asset_type, asset_id in keys:
+                    self.index.update_world_asset(self.data_manager.world_data, asset_type, asset_id)
+        elif kind == "case":
+            for case_id in keys:
+                self.index.update_case(case_id, self.data_manager.case_files.get(case_id))
+        self._save_timer.start()
+
+    def search(self, query, limit=50):
+        with profiler.span("search.query", "search"):
+            return self.index.search(query, limit) if self.index is not None else []
+
+    def save_index(self):
+        """
+        Writes the index on the IOExecutor from a snapshot of its documents, so the GUI
+        thread only copies a list. The write is queued once the data files already
+        queued are written, so the saved stamp describes the data the snapshot was taken from.
+        """
+        if self.index is None:
+            return None
+        documents = self.index.snapshot()
+
+        def write():
+            with profiler.span("search.save_index", "search"):
+                FullTextIndex.save_snapshot(self.index_path, documents, source_stamp(self.data_manager.data_file_paths()))
+
+        def log_failure(done):
+            if done.exception() is not None:
+                logger.error(f"Failed to save search index: {done.exception()}")
+        io = self.data_manager.io
+        future = io.submit_after(io.pending(), self.index_path, write)
+        future.add_done_callback(log_failure)
+        return future
+
+    def shutdown(self):
+        self.worker.wait()
+        if self._save_timer.isActive():
+            self._save_timer.stop()
+            self.save_index()
+
+class QuickOpenDialog(QDialog):
+    """Type to search everything; Enter or double-click goes to the selected result."""
+    result_chosen = Signal(object) # SearchDocument
+
+    KIND_LABELS = {
+        "characters": "Character", "locations": "Location", "factions": "Faction", "items": "Item",
+        "districts": "District", "sleuth": "Sleuth", "cases": "Case", "clues": "Clue", "interviews": "Interview",
+    }
+
+    def __init__(self, search_service, parent=None):
+        super().__init__(parent)
+        self.search_service = search_service
+        self.setWindowTitle("Quick Open")
+        self.resize(640, 420)
+
+        self.layout = QVBoxLayout(self)
+        self.query_field = QLineEdit()
+        self.query_field.setPlaceholderText("Search clues, interviews, biographies, descriptions...")
+        self.query_field.textChanged.connect(self.update_results)
+        self.query_field.returnPressed.connect(self.open_current)
+        self.layout.addWidget(self.query_field)
+
+        self.results_list = QListWidget()
+        self.results_list.itemActivated.connect(lambda item: self.open_current())
+        self.layout.addWidget(self.results_list)
+
+    def showEvent(self, event):
+        super().showEvent(event)
+        self.query_field.setFocus()
+        self.query_field.selectAll()
+        self.update_results(self.query_field.text())
+
+    def update_results(self, text):
+        self.results_list.clear()
+        if self.search_service.index is None:
+            self.results_list.addItem("Indexing... results will appear shortly.")
+            return
+        for result in self.search_service.search(text):
+            document = result.document
+            item = QListWidgetItem(f"{document.title}  ({self.KIND_LABELS.get(document.kind, document.kind)})\n{result.snippet}")
+            item.setData(Qt.UserRole, document)
+            self.results_list.addItem(item)
+        if self.results_list.count():
+            self.results_list.setCurrentRow(0)
+
+    def keyPressEvent(self, event):
+        # Arrow keys move through the results while the query field keeps focus
+        if event.key() in (Qt.Key_Up, Qt.Key_Down) and self.results_list.count():
+            step = -1 if event.key() == Qt.Key_Up else 1
+            row = max(0, min(self.results_list.count() - 1, self.results_list.currentRow() + step))
+            self.results_list.setCurrentRow(row)
+            return
+        super().keyPressEvent(event)
+
+    def open_current(self):
+        item = self.results_list.currentItem()
+        document = item.data(Qt.UserRole) if item else None
+        if document is not None:
+            self.accept()
+            self.result_chosen.emit(document)
 
 # --- World Builder ---
 
@@ -729,6 +1847,7 @@ class WorldBuilder(QWidget):
         self.detail_stack.addWidget(self.placeholder_view)
 
         self.asset_views = {}
+        self.association_models = AssociationModels(self.data_manager.world_data)
 
         self.nav_layout.itemAt(0).widget().setChecked(True)
         self.set_asset_view("characters")
@@ -737,17 +1856,17 @@ class WorldBuilder(QWidget):
         if asset_type not in self.asset_views:
             view = None
             if asset_type == "characters":
-                view = AssetListView(asset_type, self.data_manager.world_data.characters, CharacterDetailView, self.data_manager)
+                view = AssetListView(asset_type, self.data_manager.world_data.characters, CharacterDetailView, self.data_manager, self.association_models)
             elif asset_type == "locations":
-                view = AssetListView(asset_type, self.data_manager.world_data.locations, LocationDetailView, self.data_manager)
+                view = AssetListView(asset_type, self.data_manager.world_data.locations, LocationDetailView, self.data_manager, self.association_models)
             elif asset_type == "factions":
-                view = AssetListView(asset_type, self.data_manager.world_data.factions, FactionDetailView, self.data_manager)
+                view = AssetListView(asset_type, self.data_manager.world_data.factions, FactionDetailView, self.data_manager, self.association_models)
             elif asset_type == "items":
-                view = AssetListView(asset_type, self.data_manager.world_data.items, ItemDetailView, self.data_manager)
+                view = AssetListView(asset_type, self.data_manager.world_data.items, ItemDetailView, self.data_manager, self.association_models)
             elif asset_type == "districts":
-                view = AssetListView(asset_type, self.data_manager.world_data.districts, DistrictDetailView, self.data_manager)
+                view = AssetListView(asset_type, self.data_manager.world_data.districts, DistrictDetailView, self.data_manager, self.association_models)
             elif asset_type == "sleuth":
-                view = SleuthDetailView(self.data_manager.world_data.sleuth, self.data_manager.save_world_data, self.data_manager)
+                view = SleuthDetailView(self.data_manager.world_data.sleuth, lambda: self.data_manager.save_world_data([("sleuth", "sleuth")]), self.data_manager)
 
             if view:
                 self.asset_views[asset_type] = view
@@ -762,13 +1881,162 @@ class WorldBuilder(QWidget):
         else:
             self.detail_stack.setCurrentWidget(self.placeholder_view)
 
+    def asset_restored(self, asset_type, asset_id):
+        """Refreshes the models and any open editor after an undo or redo changed an asset."""
+        if asset_type != "sleuth":
+            self.association_models.asset_changed(asset_type, asset_id)
+        view = self.asset_views.get(asset_type)
+        if isinstance(view, AssetListView):
+            view.asset_restored(asset_id)
+        elif isinstance(view, AssetEditor):
+            view.load(view.asset)
+
+# --- Faceted Filtering ---
+
+# Filters offered above the asset lists, computed on the world's ColumnStore. Categories
+# are (column, label, asset type its values are ids of or None); minimums are
+# (column, label, maximum, step).
+ASSET_FACETS = {
+    "characters": {
+        "categories": (("district", "District", "districts"), ("faction", "Faction", "factions"), ("gender", "Gender", None)),
+        "minimums": (("killer_likelihood", "Killer \u2265", 1.0, 0.05), ("victim_likelihood", "Victim \u2265", 1.0, 0.05)),
+    },
+    "locations": {
+        "categories": (("district", "District", "districts"), ("owning_faction", "Faction", "factions"), ("accessibility", "Access", None)),
+        "minimums": (("danger_level", "Danger \u2265", 5, 1),),
+    },
+    "items": {
+        "categories": (("type", "Type", None), ("condition", "Condition", None), ("clue_potential", "Clue Potential", None)),
+        "minimums": (),
+    },
+}
+
+class FacetBar(QWidget):
+    """
+    Category combos and minimum spin boxes over one asset type. Each combo lists the
+    values left by the other facets with their counts. The column table is only built
+    when the filters are first opened.
+    """
+    filter_changed = Signal(object) # Matching ids in list order, or None when no facet is set
+
+    def __init__(self, asset_type, data_manager, parent=None):
+        super().__init__(parent)
+        self.asset_type = asset_type
+        self.data_manager = data_manager
+        self.facets = ASSET_FACETS[asset_type]
+        layout = QVBoxLayout(self)
+        layout.setContentsMargins(0, 0, 0, 0)
+
+        header = QHBoxLayout()
+        self.toggle = QPushButton("Filters")
+        self.toggle.setCheckable(True)
+        self.toggle.toggled.connect(self.set_open)
+        self.summary = QLabel()
+        header.addWidget(self.toggle)
+        header.addWidget(self.summary, 1)
+        layout.addLayout(header)
+
+        self.panel = QWidget()
+        form = QFormLayout(self.panel)
+        form.setContentsMargins(0, 0, 0, 0)
+        self.combos = {}
+        for column, label, _ in self.facets["categories"]:
+            combo = QComboBox()
+            combo.setSizeAdjustPolicy(QComboBox.AdjustToMinimumContentsLengthWithIcon)
+            combo.activated.connect(lambda _: self.refresh())
+            self.combos[column] = combo
+            form.addRow(label, combo)
+        self.spins = {}
+        for column, label, maximum, step in self.facets["minimums"]:
+            spin = QDoubleSpinBox()
+            spin.setRange(0, maximum)
+            spin.setSingleStep(step)
+            spin.setDecimals(2 if step < 1 else 0)
+            spin.setSpecialValueText("Any")
+            spin.valueChanged.connect(lambda _: self.refresh())
+            self.spins[column] = spin
+            form.addRow(label, spin)
+        clear_button = QPushButton("Clear Filters")
+        clear_button.clicked.connect(self.clear)
+        form.addRow(clear_button)
+        self.panel.setVisible(False)
+        layout.addWidget(self.panel)
+
+    def table(self):
+        return self.data_manager.columns.table(self.asset_type)
+
+    def set_open(self, open_):
+        self.panel.setVisible(open_)
+        if open_:
+            self.refresh()
+
+    def criteria(self, skip=None):
+        criteria = {}
+        for column, combo in self.combos.items():
+            if column != skip and combo.currentIndex() > 0:
+                criteria[column] = combo.currentData()
+        for column, spin in self.spins.items():
+            if column != skip and spin.value() > spin.minimum():
+                criteria[column] = (spin.value(), None)
+        return criteria
+
+    def is_active(self):
+        return bool(self.criteria())
+
+    def clear(self):
+        for combo in self.combos.values():
+            combo.setCurrentIndex(0)
+        for spin in self.spins.values():
+            spin.blockSignals(True)
+            spin.setValue(spin.minimum())
+            spin.blockSignals(False)
+        self.refresh()
+
+    @profiler.timed("facets.refresh")
+    def refresh(self):
+        """Re-runs the filter, e.g. after a facet changed or an asset was saved, and updates the counts shown."""
+        criteria = self.criteria()
+        if not criteria:
+            self.summary.setText("")
+            self.filter_changed.emit(None)
+            if not self.panel.isVisible():
+                return
+        table = self.table()
+        if criteria:
+            ids = table.filter(**criteria)
+            self.summary.setText(f"{len(ids)} of {len(table)}")
+            self.filter_changed.emit(ids)
+        if not self.panel.isVisible():
+            return
+        world_data = self.data_manager.world_data
+        for column, label, reference_type in self.facets["categories"]:
+            combo = self.combos[column]
+            selected = combo.currentData() if combo.currentIndex() > 0 else None
+            counts = table.facet_counts(column, table.mask(**self.criteria(skip=column)))
+            names = getattr(world_data, reference_type) if reference_type else {}
+            combo.blockSignals(True)
+            combo.clear()
+            combo.addItem(f"Any {label.lower()}", None)
+            for value, count in sorted(counts.items(), key=lambda item: -item[1]):
+                if value is not None:
+                    name = asset_display_name(names[value]) if value in names else str(value)
+                    combo.addItem(f"{name} ({count})", value)
+            if selected is not None:
+                row = combo.findData(selected)
+                if row < 0: # Keep a choice that no longer matches anything
+                    combo.addItem(f"{selected} (0)", selected)
+                    row = combo.count() - 1
+                combo.setCurrentIndex(row)
+            combo.blockSignals(False)
+
 class AssetListView(QWidget):
-    def __init__(self, asset_type, asset_dict, detail_view_class, data_manager):
+    def __init__(self, asset_type, asset_dict, detail_view_class, data_manager, association_models):
         super().__init__()
         self.asset_type = asset_type
         self.asset_dict = asset_dict
         self.detail_view_class = detail_view_class
         self.data_manager = data_manager
+        self.association_models = association_models
 
         self.main_layout = QHBoxLayout(self)
         self.splitter = QSplitter(Qt.Horizontal)
@@ -780,9 +2048,18 @@ class AssetListView(QWidget):
         self.add_button = MaterialButton(f"+ Add {self.asset_type.capitalize()[:-1]}")
         self.add_button.clicked.connect(self.add_new_asset)
         self.list_layout.addWidget(self.add_button)
-        self.asset_list_widget = QListWidget()
-        self.asset_list_widget.itemClicked.connect(self.on_asset_selected)
-        self.list_layout.addWidget(self.asset_list_widget)
+        self.asset_model = self.association_models.model(self.asset_type)
+        self.filtered_model = None # Shows the facet matches; one model reset per change instead of a filter call per row
+        self.facet_bar = None
+        if self.asset_type in ASSET_FACETS:
+            self.filtered_model = AssetListModel(self.asset_dict, self)
+            self.facet_bar = FacetBar(self.asset_type, self.data_manager)
+            self.facet_bar.filter_changed.connect(self.apply_filter)
+            self.list_layout.addWidget(self.facet_bar)
+        self.asset_list_view = QListView()
+        self.asset_list_view.setUniformItemSizes(True) # Lets the view lay out only the visible rows
+        self.set_list_model(self.asset_model)
+        self.list_layout.addWidget(self.asset_list_view)
         self.splitter.addWidget(self.list_pane)
 
         # --- Detail Pane ---
@@ -793,23 +2070,43 @@ class AssetListView(QWidget):
         self.splitter.addWidget(self.detail_stack)
 
         self.splitter.setSizes([300, 700])
-        self.populate_asset_list()
+        self.current_asset_id = None
+        self.editor = None
 
     def populate_asset_list(self):
-        self.asset_list_widget.clear()
-        for asset_id, asset in self.asset_dict.items():
-            name = getattr(asset, "name", getattr(asset, "full_name", getattr(asset, "district_name", getattr(asset, "item", ""))))
-            item = QListWidgetItem(name)
-            item.setData(Qt.UserRole, asset_id)
-            self.asset_list_widget.addItem(item)
+        self.asset_model.reload()
+
+    def set_list_model(self, model):
+        if self.asset_list_view.model() is model:
+            return
+        self.asset_list_view.setModel(model)
+        self.asset_list_view.selectionModel().currentChanged.connect(self.on_asset_selected)
+
+    def apply_filter(self, ids):
+        """Shows only the given asset ids, or every asset for None, keeping the current asset selected."""
+        if ids is None:
+            self.set_list_model(self.asset_model)
+        else:
+            self.filtered_model.reload(ids)
+            self.set_list_model(self.filtered_model)
+        model = self.asset_list_view.model()
+        index = model.index_of(self.current_asset_id)
+        if index.isValid():
+            self.asset_list_view.selectionModel().blockSignals(True)
+            self.asset_list_view.setCurrentIndex(index)
+            self.asset_list_view.selectionModel().blockSignals(False)
 
     def select_asset_by_id(self, asset_id):
-        for i in range(self.asset_list_widget.count()):
-            item = self.asset_list_widget.item(i)
-            if item.data(Qt.UserRole) == asset_id:
-                self.asset_list_widget.setCurrentItem(item)
-                self.on_asset_selected(item)
-                break
+        if self.facet_bar is not None and not self.asset_list_view.model().index_of(asset_id).isValid():
+            self.facet_bar.clear() # The facets hide it
+        index = self.asset_list_view.model().index_of(asset_id)
+        if not index.isValid():
+            return
+        if index == self.asset_list_view.currentIndex():
+            self.on_asset_selected(index) # Re-open the editor, e.g. when jumping from the validator
+        else:
+            self.asset_list_view.setCurrentIndex(index)
+        self.asset_list_view.scrollTo(index)
 
     def add_new_asset(self):
         singular_asset_type = self.asset_type[:-1]
@@ -839,74 +2136,191 @@ class AssetListView(QWidget):
             elif hasattr(new_asset, "item"):
                 new_asset.item = f"New {singular_asset_type.capitalize()}"
 
-            self.asset_dict[new_id] = new_asset
-            self.data_manager.save_world_data()
-            self.populate_asset_list()
+            self.data_manager.history.insert_asset(self.asset_type, new_id, new_asset, f"Add {singular_asset_type}")
+            self.data_manager.save_world_data([(self.asset_type, new_id)])
+            self.association_models.asset_changed(self.asset_type, new_id)
+            if self.facet_bar is not None:
+                self.facet_bar.refresh()
 
 
-    def on_asset_selected(self, item):
-        asset_id = item.data(Qt.UserRole)
+    def on_asset_selected(self, index, previous=None):
+        asset_id = index.data(Qt.UserRole)
         asset = self.asset_dict.get(asset_id)
         if asset:
-            # Remove old editor if it exists
-            if self.detail_stack.count() > 1:
-                old_editor = self.detail_stack.widget(1)
-                if old_editor is not self.placeholder_view:
-                    self.detail_stack.removeWidget(old_editor)
-                    old_editor.setParent(None)
-
-            editor = self.detail_view_class(asset, self.on_asset_save, self.data_manager)
-            self.detail_stack.addWidget(editor)
-            self.detail_stack.setCurrentWidget(editor)
+            self.current_asset_id = asset_id
+            # One editor per asset type, built on first use and rebound afterwards
+            if self.editor is None:
+                self.editor = self.detail_view_class(None, self.on_asset_save, self.data_manager, self.association_models)
+                self.detail_stack.addWidget(self.editor)
+            self.editor.load(asset)
+            self.detail_stack.setCurrentWidget(self.editor)
+
+    def asset_restored(self, asset_id):
+        """Shows an asset's state after an undo or redo, closing its editor if it no longer exists."""
+        if self.facet_bar is not None:
+            self.facet_bar.refresh()
+        if asset_id != self.current_asset_id or self.editor is None:
+            return
+        asset = self.asset_dict.get(asset_id)
+        if asset is None:
+            self.current_asset_id = None
+            self.detail_stack.setCurrentWidget(self.placeholder_view)
+        else:
+            self.editor.load(asset)
 
     def on_asset_save(self):
-        self.data_manager.save_world_data()
-        self.populate_asset_list()
+        self.data_manager.save_world_data([(self.asset_type, self.current_asset_id)])
+        self.association_models.asset_changed(self.asset_type, self.current_asset_id)
+        if self.facet_bar is not None:
+            self.facet_bar.refresh()
 
-class CharacterDetailView(QFrame):
-    def __init__(self, character_obj, on_save, data_manager):
+class AssetEditor(QFrame):
+    """
+    Base class of the world-builder detail views. An editor builds its widgets once
+    and is rebound to another asset with load(), so moving through a list does not
+    rebuild the whole form per selection. Each bound widget has a writer (asset
+    value -> widget) and a reader (widget -> asset value), which lets save() write
+    back only the fields that actually changed.
+    """
+    def __init__(self, asset_obj, on_save, data_manager, association_models=None):
         super().__init__()
-        self.character = character_obj
+        self.asset = None
         self.on_save = on_save
         self.data_manager = data_manager
+        self.association_models = association_models or AssociationModels(data_manager.world_data)
+        self.bindings = [] # (field name, writer, reader)
 
         self.layout = QVBoxLayout(self)
         self.layout.setContentsMargins(20, 20, 20, 20)
 
+    def bind(self, field_name, widget, kind="text"):
+        writer, reader = FIELD_BINDERS[kind](widget)
+        self.bindings.append((field_name, writer, reader))
+        return widget
+
+    def load(self, asset):
+        """Shows another asset in the existing widgets."""
+        self.asset = asset
+        for field_name, writer, _ in self.bindings:
+            writer(getattr(asset, field_name))
+
+    def reference_combo(self, asset_type):
+        """A combo choosing one asset (or none) from the shared model of asset_type."""
+        combo = ReferenceComboBox()
+        combo.setSizeAdjustPolicy(QComboBox.AdjustToMinimumContentsLengthWithIcon) # Don't measure every row
+        model = self.association_models.reference_model(asset_type)
+        combo.setModel(model)
+        combo.view().setUniformItemSizes(True)
+
+        # Searchable: typing shows ranked matches, leaving the field restores the chosen name
+        combo.setEditable(True)
+        combo.setInsertPolicy(QComboBox.NoInsert)
+        combo.setCompleter(None)
+        completer = TypeAheadCompleter(combo.lineEdit(), self.association_models.name_index(asset_type), model.asset_dict)
+        completer.picked.connect(combo.pick)
+        completer.editing_finished.connect(combo.restore_text)
+        return combo
+
+    def image_picker(self, line_edit):
+        """Wraps an image field with a button importing a file into the image store."""
+        container = QWidget()
+        row = QHBoxLayout(container)
+        row.setContentsMargins(0, 0, 0, 0)
+        import_button = QPushButton("Import...")
+        import_button.clicked.connect(lambda: self.import_image(line_edit))
+        row.addWidget(line_edit)
+        row.addWidget(import_button)
+        return container
+
+    def import_image(self, line_edit):
+        path, _ = QFileDialog.getOpenFileName(self, "Import Image", "", "Images (*.png *.jpg *.jpeg *.webp *.gif *.bmp)")
+        if not path:
+            return
+        try:
+            line_edit.setText(self.data_manager.image_store.import_file(path, transcode_images=True))
+        except OSError as e:
+            logger.error(f"Failed to import image {path}: {e}")
+
+    def references_combo(self, asset_type):
+        """A combo choosing any number of assets from the shared model of asset_type."""
+        combo = MultiSelectComboBox()
+        combo.setAssetModel(self.association_models.model(asset_type), self.association_models.name_index(asset_type))
+        return combo
+
+    def changed_fields(self):
+        """Returns {field name: new value} for every bound field the user edited."""
+        changes = {}
+        for field_name, _, reader in self.bindings:
+            value = reader()
+            if value != getattr(self.asset, field_name):
+                changes[field_name] = value
+        return changes
+
+    def save(self):
+        if self.asset is None:
+            return
+        changes = self.changed_fields()
+        if not changes:
+            return
+        self.data_manager.history.set_fields(self.asset, changes, ("world", world_key(self.asset)), f"Edit {asset_display_name(self.asset) or 'asset'}")
+        self.on_save()
+
+def _parse_float(text, default):
+    try: return float(text)
+    except (ValueError, TypeError): return default
+
+# Writer/reader pairs for the widget kinds the detail views use
+FIELD_BINDERS = {
+    "text": lambda w: (lambda v: w.setText(v or ""), w.text),
+    "optional_text": lambda w: (lambda v: w.setText(v or ""), lambda: w.text() or None),
+    "int": lambda w: (lambda v: w.setText(str(v) if v is not None else ""), lambda: int(w.text()) if w.text().isdigit() else None),
+    "likelihood": lambda w: (lambda v: w.setText(str(v)), lambda: _parse_float(w.text(), 0.5)),
+    "plain_text": lambda w: (lambda v: w.setPlainText(v or ""), w.toPlainText),
+    "lines": lambda w: (lambda v: w.setPlainText("\n".join(v or [])), lambda: [line for line in w.toPlainText().splitlines() if line]),
+    "choice": lambda w: (lambda v: w.setCurrentText(str(v) if v is not None else "_"), lambda: w.currentText() if w.currentText() != "_" else None),
+    "int_choice": lambda w: (lambda v: w.setCurrentText(str(v) if v is not None else "_"), lambda: int(w.currentText()) if w.currentText().isdigit() else None),
+    "reference": lambda w: (w.setCurrentId, w.currentId),
+    "references": lambda w: (w.setSelectedIds, w.getSelectedIds),
+    "flag": lambda w: (lambda v: w.setChecked(bool(v)), w.isChecked),
+}
+
+class CharacterDetailView(AssetEditor):
+    def __init__(self, character_obj, on_save, data_manager, association_models=None):
+        super().__init__(character_obj, on_save, data_manager, association_models)
+
         self.tabs = QTabWidget()
         self.layout.addWidget(self.tabs)
 
         # --- Core Info Tab ---
         self.core_tab = QWidget()
         self.core_layout = QFormLayout(self.core_tab)
-        self.full_name_field = QLineEdit(self.character.full_name)
-        self.alias_field = QLineEdit(self.character.alias)
-        self.age_field = QLineEdit(str(self.character.age) if self.character.age is not None else "")
-        self.gender_combo = QComboBox()
+        self.full_name_field = self.bind("full_name", QLineEdit())
+        self.alias_field = self.bind("alias", QLineEdit())
+        self.age_field = self.bind("age", QLineEdit(), "int")
+        self.gender_combo = self.bind("gender", QComboBox(), "choice")
         self.gender_combo.addItems(["_"] + list(get_args(schemas.Gender)))
-        self.gender_combo.setCurrentText(self.character.gender or "_")
-        self.employment_field = QLineEdit(self.character.employment)
-        self.biography_field = DynamicHeightTextEdit(self.character.biography)
-        self.image_field = QLineEdit(self.character.image)
+        self.employment_field = self.bind("employment", QLineEdit())
+        self.biography_field = self.bind("biography", DynamicHeightTextEdit(), "plain_text")
+        self.image_field = self.bind("image", QLineEdit(), "optional_text")
         self.core_layout.addRow("Full Name:", self.full_name_field)
         self.core_layout.addRow("Alias:", self.alias_field)
         self.core_layout.addRow("Age:", self.age_field)
         self.core_layout.addRow("Gender:", self.gender_combo)
         self.core_layout.addRow("Employment:", self.employment_field)
         self.core_layout.addRow("Biography:", self.biography_field)
-        self.core_layout.addRow("Image URL:", self.image_field)
+        self.core_layout.addRow("Image:", self.image_picker(self.image_field))
         self.tabs.addTab(self.core_tab, "Core Info")
 
         # --- Associations Tab ---
         self.assoc_tab = QWidget()
         self.assoc_layout = QFormLayout(self.assoc_tab)
-        self.faction_combo = QComboBox()
-        self.wealth_combo = QComboBox()
-        self.district_combo = QComboBox()
-        self.allies_combo = MultiSelectComboBox()
-        self.enemies_combo = MultiSelectComboBox()
-        self.items_combo = MultiSelectComboBox()
-        self.populate_association_combos()
+        self.faction_combo = self.bind("faction", self.reference_combo("factions"), "reference")
+        self.wealth_combo = self.bind("wealth_class", QComboBox(), "choice")
+        self.wealth_combo.addItems(["_"] + list(get_args(schemas.WealthClass)))
+        self.district_combo = self.bind("district", self.reference_combo("districts"), "reference")
+        self.allies_combo = self.bind("allies", self.references_combo("characters"), "references")
+        self.enemies_combo = self.bind("enemies", self.references_combo("characters"), "references")
+        self.items_combo = self.bind("items", self.references_combo("items"), "references")
         self.assoc_layout.addRow("Faction:", self.faction_combo)
         self.assoc_layout.addRow("Wealth Class:", self.wealth_combo)
         self.assoc_layout.addRow("District:", self.district_combo)
@@ -918,18 +2332,17 @@ class CharacterDetailView(QFrame):
         # --- Profile Tab ---
         self.profile_tab = QWidget()
         self.profile_layout = QFormLayout(self.profile_tab)
-        self.archetype_field = QLineEdit(self.character.archetype)
-        self.personality_field = DynamicHeightTextEdit(self.character.personality)
-        self.values_field = DynamicHeightTextEdit("\n".join(self.character.values or []))
-        self.flaws_field = DynamicHeightTextEdit("\n".join(self.character.flaws_handicaps_limitations or []))
-        self.quirks_field = DynamicHeightTextEdit("\n".join(self.character.quirks or []))
-        self.characteristics_field = DynamicHeightTextEdit("\n".join(self.character.characteristics or []))
-        self.alignment_combo = QComboBox()
+        self.archetype_field = self.bind("archetype", QLineEdit())
+        self.personality_field = self.bind("personality", DynamicHeightTextEdit(), "plain_text")
+        self.values_field = self.bind("values", DynamicHeightTextEdit(), "lines")
+        self.flaws_field = self.bind("flaws_handicaps_limitations", DynamicHeightTextEdit(), "lines")
+        self.quirks_field = self.bind("quirks", DynamicHeightTextEdit(), "lines")
+        self.characteristics_field = self.bind("characteristics", DynamicHeightTextEdit(), "lines")
+        self.alignment_combo = self.bind("alignment", QComboBox(), "choice")
         self.alignment_combo.addItems(["_"] + list(get_args(schemas.Alignment)))
-        self.alignment_combo.setCurrentText(self.character.alignment or "_")
-        self.motivations_field = DynamicHeightTextEdit("\n".join(self.character.motivations or []))
-        self.secrets_field = DynamicHeightTextEdit("\n".join(self.character.secrets or []))
-        self.vulnerabilities_field = DynamicHeightTextEdit("\n".join(self.character.vulnerabilities or []))
+        self.motivations_field = self.bind("motivations", DynamicHeightTextEdit(), "lines")
+        self.secrets_field = self.bind("secrets", DynamicHeightTextEdit(), "lines")
+        self.vulnerabilities_field = self.bind("vulnerabilities", DynamicHeightTextEdit(), "lines")
         self.profile_layout.addRow("Archetype:", self.archetype_field)
         self.profile_layout.addRow("Personality:", self.personality_field)
         self.profile_layout.addRow("Values:", self.values_field)
@@ -945,9 +2358,9 @@ class CharacterDetailView(QFrame):
         # --- Dialogue Tab ---
         self.dialogue_tab = QWidget()
         self.dialogue_layout = QFormLayout(self.dialogue_tab)
-        self.voice_model_field = QLineEdit(self.character.voice_model)
-        self.dialogue_style_field = DynamicHeightTextEdit(self.character.dialogue_style)
-        self.expertise_field = DynamicHeightTextEdit("\n".join(self.character.expertise or []))
+        self.voice_model_field = self.bind("voice_model", QLineEdit())
+        self.dialogue_style_field = self.bind("dialogue_style", DynamicHeightTextEdit(), "plain_text")
+        self.expertise_field = self.bind("expertise", DynamicHeightTextEdit(), "lines")
         self.dialogue_layout.addRow("Voice Model:", self.voice_model_field)
         self.dialogue_layout.addRow("Dialogue Style:", self.dialogue_style_field)
         self.dialogue_layout.addRow("Expertise:", self.expertise_field)
@@ -956,10 +2369,10 @@ class CharacterDetailView(QFrame):
         # --- Meta Tab ---
         self.meta_tab = QWidget()
         self.meta_layout = QFormLayout(self.meta_tab)
-        self.honesty_field = QLineEdit(str(self.character.honesty))
-        self.victim_likelihood_field = QLineEdit(str(self.character.victim_likelihood))
-        self.killer_likelihood_field = QLineEdit(str(self.character.killer_likelihood))
-        self.portrayal_notes_field = DynamicHeightTextEdit(self.character.portrayal_notes)
+        self.honesty_field = self.bind("honesty", QLineEdit(), "likelihood")
+        self.victim_likelihood_field = self.bind("victim_likelihood", QLineEdit(), "likelihood")
+        self.killer_likelihood_field = self.bind("killer_likelihood", QLineEdit(), "likelihood")
+        self.portrayal_notes_field = self.bind("portrayal_notes", DynamicHeightTextEdit(), "plain_text")
         self.meta_layout.addRow("Honesty (0-1):", self.honesty_field)
         self.meta_layout.addRow("Victim Likelihood (0-1):", self.victim_likelihood_field)
         self.meta_layout.addRow("Killer Likelihood (0-1):", self.killer_likelihood_field)
@@ -970,85 +2383,13 @@ class CharacterDetailView(QFrame):
         self.save_button.clicked.connect(self.save)
         self.layout.addWidget(self.save_button, alignment=Qt.AlignRight)
 
-    def populate_association_combos(self):
-        # Faction
-        self.faction_combo.addItem("None", None)
-        for faction_id, faction in self.data_manager.world_data.factions.items():
-            self.faction_combo.addItem(faction.name, faction_id)
-        if self.character.faction:
-            self.faction_combo.setCurrentIndex(self.faction_combo.findData(self.character.faction))
-
-        # Wealth Class
-        self.wealth_combo.addItems(["_"] + list(get_args(schemas.WealthClass)))
-        self.wealth_combo.setCurrentText(self.character.wealth_class or "_")
-
-        # District
-        self.district_combo.addItem("None", None)
-        for district_id, district in self.data_manager.world_data.districts.items():
-            self.district_combo.addItem(district.district_name, district_id)
-        if self.character.district:
-            self.district_combo.setCurrentIndex(self.district_combo.findData(self.character.district))
+        if character_obj is not None:
+            self.load(character_obj)
 
-        # Allies, Enemies, Items
-        self.allies_combo.setItems(self.data_manager.world_data.characters, self.character.allies)
-        self.enemies_combo.setItems(self.data_manager.world_data.characters, self.character.enemies)
-        self.items_combo.setItems(self.data_manager.world_data.items, self.character.items)
 
-    def save(self):
-        # Core Info
-        self.character.full_name = self.full_name_field.text()
-        self.character.alias = self.alias_field.text()
-        self.character.age = int(self.age_field.text()) if self.age_field.text().isdigit() else None
-        self.character.gender = self.gender_combo.currentText() if self.gender_combo.currentText() != "_" else None
-        self.character.employment = self.employment_field.text()
-        self.character.biography = self.biography_field.toPlainText()
-        self.character.image = self.image_field.text()
-
-        # Associations
-        self.character.faction = self.faction_combo.currentData()
-        self.character.wealth_class = self.wealth_combo.currentText() if self.wealth_combo.currentText() != "_" else None
-        self.character.district = self.district_combo.currentData()
-        self.character.allies = self.allies_combo.getSelectedIds()
-        self.character.enemies = self.enemies_combo.getSelectedIds()
-        self.character.items = self.items_combo.getSelectedIds()
-
-        # Profile
-        self.character.archetype = self.archetype_field.text()
-        self.character.personality = self.personality_field.toPlainText()
-        self.character.values = [v for v in self.values_field.toPlainText().splitlines() if v]
-        self.character.flaws_handicaps_limitations = [v for v in self.flaws_field.toPlainText().splitlines() if v]
-        self.character.quirks = [v for v in self.quirks_field.toPlainText().splitlines() if v]
-        self.character.characteristics = [v for v in self.characteristics_field.toPlainText().splitlines() if v]
-        self.character.alignment = self.alignment_combo.currentText() if self.alignment_combo.currentText() != "_" else None
-        self.character.motivations = [v for v in self.motivations_field.toPlainText().splitlines() if v]
-        self.character.secrets = [v for v in self.secrets_field.toPlainText().splitlines() if v]
-        self.character.vulnerabilities = [v for v in self.vulnerabilities_field.toPlainText().splitlines() if v]
-
-        # Dialogue
-        self.character.voice_model = self.voice_model_field.text()
-        self.character.dialogue_style = self.dialogue_style_field.toPlainText()
-        self.character.expertise = [v for v in self.expertise_field.toPlainText().splitlines() if v]
-
-        # Meta
-        try: self.character.honesty = float(self.honesty_field.text())
-        except (ValueError, TypeError): self.character.honesty = 0.5
-        try: self.character.victim_likelihood = float(self.victim_likelihood_field.text())
-        except (ValueError, TypeError): self.character.victim_likelihood = 0.5
-        try: self.character.killer_likelihood = float(self.killer_likelihood_field.text())
-        except (ValueError, TypeError): self.character.killer_likelihood = 0.5
-        self.character.portrayal_notes = self.portrayal_notes_field.toPlainText()
-
-        self.on_save()
-
-class LocationDetailView(QFrame):
-    def __init__(self, location_obj, on_save, data_manager):
-        super().__init__()
-        self.location = location_obj
-        self.on_save = on_save
-        self.data_manager = data_manager
-
-        self.layout = QVBoxLayout(self)
-        self.layout.setContentsMargins(20, 20, 20, 20)
+class LocationDetailView(AssetEditor):
+    def __init__(self, location_obj, on_save, data_manager, association_models=None):
+        super().__init__(location_obj, on_save, data_manager, association_models)
 
         self.tabs = QTabWidget()
         self.layout.addWidget(self.tabs)
@@ -1056,25 +2397,24 @@ class LocationDetailView(QFrame):
         # --- Core Info Tab ---
         self.core_tab = QWidget()
         self.core_layout = QFormLayout(self.core_tab)
-        self.name_field = QLineEdit(self.location.name)
-        self.type_field = QLineEdit(self.location.type)
-        self.description_field = DynamicHeightTextEdit(self.location.description)
-        self.image_field = QLineEdit(self.location.image)
+        self.name_field = self.bind("name", QLineEdit())
+        self.type_field = self.bind("type", QLineEdit())
+        self.description_field = self.bind("description", DynamicHeightTextEdit(), "plain_text")
+        self.image_field = self.bind("image", QLineEdit(), "optional_text")
         self.core_layout.addRow("Name:", self.name_field)
         self.core_layout.addRow("Type:", self.type_field)
         self.core_layout.addRow("Description:", self.description_field)
-        self.core_layout.addRow("Image URL:", self.image_field)
+        self.core_layout.addRow("Image:", self.image_picker(self.image_field))
         self.tabs.addTab(self.core_tab, "Core Info")
 
         # --- Associations Tab ---
         self.assoc_tab = QWidget()
         self.assoc_layout = QFormLayout(self.assoc_tab)
-        self.district_combo = QComboBox()
-        self.owning_faction_combo = QComboBox()
-        self.key_characters_combo = MultiSelectComboBox()
-        self.associated_items_combo = MultiSelectComboBox()
-        self.clues_combo = MultiSelectComboBox()
-        self.populate_association_combos()
+        self.district_combo = self.bind("district", self.reference_combo("districts"), "reference")
+        self.owning_faction_combo = self.bind("owning_faction", self.reference_combo("factions"), "reference")
+        self.key_characters_combo = self.bind("key_characters", self.references_combo("characters"), "references")
+        self.associated_items_combo = self.bind("associated_items", self.references_combo("items"), "references")
+        self.clues_combo = MultiSelectComboBox() # Will be bound once case files are handled
         self.assoc_layout.addRow("District:", self.district_combo)
         self.assoc_layout.addRow("Owning Faction:", self.owning_faction_combo)
         self.assoc_layout.addRow("Key Characters:", self.key_characters_combo)
@@ -1085,16 +2425,13 @@ class LocationDetailView(QFrame):
         # --- Details Tab ---
         self.details_tab = QWidget()
         self.details_layout = QFormLayout(self.details_tab)
-        self.danger_level_combo = QComboBox()
+        self.danger_level_combo = self.bind("danger_level", QComboBox(), "int_choice")
         self.danger_level_combo.addItems(["_"] + [str(i) for i in range(1, 11)])
-        self.danger_level_combo.setCurrentText(str(self.location.danger_level) if self.location.danger_level is not None else "_")
-        self.population_field = QLineEdit(str(self.location.population) if self.location.population is not None else "")
-        self.accessibility_combo = QComboBox()
+        self.population_field = self.bind("population", QLineEdit(), "int")
+        self.accessibility_combo = self.bind("accessibility", QComboBox(), "choice")
         self.accessibility_combo.addItems(["_"] + list(get_args(schemas.AccessibilityLevel)))
-        self.accessibility_combo.setCurrentText(self.location.accessibility or "_")
-        self.hidden_checkbox = QCheckBox("Hidden")
-        self.hidden_checkbox.setChecked(self.location.hidden or False)
-        self.internal_logic_notes_field = DynamicHeightTextEdit(self.location.internal_logic_notes)
+        self.hidden_checkbox = self.bind("hidden", QCheckBox("Hidden"), "flag")
+        self.internal_logic_notes_field = self.bind("internal_logic_notes", DynamicHeightTextEdit(), "plain_text")
         self.details_layout.addRow("Danger Level:", self.danger_level_combo)
         self.details_layout.addRow("Population:", self.population_field)
         self.details_layout.addRow("Accessibility:", self.accessibility_combo)
@@ -1106,74 +2443,30 @@ class LocationDetailView(QFrame):
         self.save_button.clicked.connect(self.save)
         self.layout.addWidget(self.save_button, alignment=Qt.AlignRight)
 
-    def populate_association_combos(self):
-        # District
-        self.district_combo.addItem("None", None)
-        for district_id, district in self.data_manager.world_data.districts.items():
-            self.district_combo.addItem(district.district_name, district_id)
-        if self.location.district:
-            self.district_combo.setCurrentIndex(self.district_combo.findData(self.location.district))
-
-        # Owning Faction
-        self.owning_faction_combo.addItem("None", None)
-        for faction_id, faction in self.data_manager.world_data.factions.items():
-            self.owning_faction_combo.addItem(faction.name, faction_id)
-        if self.location.owning_faction:
-            self.owning_faction_combo.setCurrentIndex(self.owning_faction_combo.findData(self.location.owning_faction))
-
-        # Key Characters, Associated Items, Clues
-        self.key_characters_combo.setItems(self.data_manager.world_data.characters, self.location.key_characters)
-        self.associated_items_combo.setItems(self.data_manager.world_data.items, self.location.associated_items)
-        # self.clues_combo.setItems(self.data_manager.case_files, self.location.clues) # This will need to be updated when case files are handled
+        if location_obj is not None:
+            self.load(location_obj)
 
-    def save(self):
-        # Core Info
-        self.location.name = self.name_field.text()
-        self.location.type = self.type_field.text()
-        self.location.description = self.description_field.toPlainText()
-        self.location.image = self.image_field.text()
-
-        # Associations
-        self.location.district = self.district_combo.currentData()
-        self.location.owning_faction = self.owning_faction_combo.currentData()
-        self.location.key_characters = self.key_characters_combo.getSelectedIds()
-        self.location.associated_items = self.associated_items_combo.getSelectedIds()
-        # self.location.clues = self.clues_combo.getSelectedIds()
-
-        # Details
-        self.location.danger_level = int(self.danger_level_combo.currentText()) if self.danger_level_combo.currentText().isdigit() else None
-        self.location.population = int(self.population_field.text()) if self.population_field.text().isdigit() else None
-        self.location.accessibility = self.accessibility_combo.currentText() if self.accessibility_combo.currentText() != "_" else None
-        self.location.hidden = self.hidden_checkbox.isChecked()
-        self.location.internal_logic_notes = self.internal_logic_notes_field.toPlainText()
 
-        self.on_save()
+class FactionDetailView(AssetEditor):
+    def __init__(self, faction_obj, on_save, data_manager, association_models=None):
+        super().__init__(faction_obj, on_save, data_manager, association_models)
 
-class FactionDetailView(QFrame):
-    def __init__(self, faction_obj, on_save, data_manager):
-        super().__init__()
-        self.faction = faction_obj
-        self.on_save = on_save
-        self.data_manager = data_manager
-
-        self.layout = QVBoxLayout(self)
-        self.layout.setContentsMargins(20, 20, 20, 20)
-        
         self.form_layout = QFormLayout()
         self.layout.addLayout(self.form_layout)
 
-        self.name_field = QLineEdit(self.faction.name)
-        self.archetype_field = QLineEdit(self.faction.archetype)
-        self.description_field = DynamicHeightTextEdit(self.faction.description)
-        self.ideology_field = QLineEdit(self.faction.ideology)
-        self.headquarters_combo = QComboBox()
-        self.resources_field = DynamicHeightTextEdit("\n".join(self.faction.resources or []))
-        self.image_field = QLineEdit(self.faction.image)
-        self.ally_factions_combo = MultiSelectComboBox()
-        self.enemy_factions_combo = MultiSelectComboBox()
-        self.members_combo = MultiSelectComboBox()
-        self.influence_combo = QComboBox()
-        self.public_perception_field = QLineEdit(self.faction.public_perception)
+        self.name_field = self.bind("name", QLineEdit())
+        self.archetype_field = self.bind("archetype", QLineEdit())
+        self.description_field = self.bind("description", DynamicHeightTextEdit(), "plain_text")
+        self.ideology_field = self.bind("ideology", QLineEdit())
+        self.headquarters_combo = self.bind("headquarters", self.reference_combo("locations"), "reference")
+        self.resources_field = self.bind("resources", DynamicHeightTextEdit(), "lines")
+        self.image_field = self.bind("image", QLineEdit(), "optional_text")
+        self.ally_factions_combo = self.bind("ally_factions", self.references_combo("factions"), "references")
+        self.enemy_factions_combo = self.bind("enemy_factions", self.references_combo("factions"), "references")
+        self.members_combo = self.bind("members", self.references_combo("characters"), "references")
+        self.influence_combo = self.bind("influence", QComboBox(), "choice")
+        self.influence_combo.addItems(["_"] + list(get_args(schemas.FactionInfluence)))
+        self.public_perception_field = self.bind("public_perception", QLineEdit())
 
         self.form_layout.addRow("Name:", self.name_field)
         self.form_layout.addRow("Archetype:", self.archetype_field)
@@ -1181,87 +2474,48 @@ class FactionDetailView(QFrame):
         self.form_layout.addRow("Ideology:", self.ideology_field)
         self.form_layout.addRow("Headquarters:", self.headquarters_combo)
         self.form_layout.addRow("Resources:", self.resources_field)
-        self.form_layout.addRow("Image URL:", self.image_field)
+        self.form_layout.addRow("Image:", self.image_picker(self.image_field))
         self.form_layout.addRow("Ally Factions:", self.ally_factions_combo)
         self.form_layout.addRow("Enemy Factions:", self.enemy_factions_combo)
         self.form_layout.addRow("Members:", self.members_combo)
         self.form_layout.addRow("Influence:", self.influence_combo)
         self.form_layout.addRow("Public Perception:", self.public_perception_field)
 
-        self.populate_combos()
-
         self.save_button = MaterialButton("Save Faction")
         self.save_button.clicked.connect(self.save)
         self.layout.addWidget(self.save_button, alignment=Qt.AlignRight)
 
-    def populate_combos(self):
-        # Headquarters
-        self.headquarters_combo.addItem("None", None)
-        for loc_id, loc in self.data_manager.world_data.locations.items():
-            self.headquarters_combo.addItem(loc.name, loc_id)
-        if self.faction.headquarters:
-            self.headquarters_combo.setCurrentIndex(self.headquarters_combo.findData(self.faction.headquarters))
-        
-        # Ally/Enemy Factions
-        self.ally_factions_combo.setItems(self.data_manager.world_data.factions, self.faction.ally_factions)
-        self.enemy_factions_combo.setItems(self.data_manager.world_data.factions, self.faction.enemy_factions)
-
-        # Members
-        self.members_combo.setItems(self.data_manager.world_data.characters, self.faction.members)
+        if faction_obj is not None:
+            self.load(faction_obj)
 
-        # Influence
-        self.influence_combo.addItems(["_"] + list(get_args(schemas.InfluenceScope)))
-        self.influence_combo.setCurrentText(self.faction.influence or "_")
 
-    def save(self):
-        self.faction.name = self.name_field.text()
-        self.faction.archetype = self.archetype_field.text()
-        self.faction.description = self.description_field.toPlainText()
-        self.faction.ideology = self.ideology_field.text()
-        self.faction.headquarters = self.headquarters_combo.currentData()
-        self.faction.resources = [r for r in self.resources_field.toPlainText().splitlines() if r]
-        self.faction.image = self.image_field.text()
-        self.faction.ally_factions = self.ally_factions_combo.getSelectedIds()
-        self.faction.enemy_factions = self.enemy_factions_combo.getSelectedIds()
-        self.faction.members = self.members_combo.getSelectedIds()
-        self.faction.influence = self.influence_combo.currentText() if self.influence_combo.currentText() != "_" else None
-        self.faction.public_perception = self.public_perception_field.text()
-        self.on_save()
+class ItemDetailView(AssetEditor):
+    def __init__(self, item_obj, on_save, data_manager, association_models=None):
+        super().__init__(item_obj, on_save, data_manager, association_models)
 
-class ItemDetailView(QFrame):
-    def __init__(self, item_obj, on_save, data_manager):
-        super().__init__()
-        self.item = item_obj
-        self.on_save = on_save
-        self.data_manager = data_manager
-
-        self.layout = QVBoxLayout(self)
-        self.layout.setContentsMargins(20, 20, 20, 20)
-        
         self.form_layout = QFormLayout()
         self.layout.addLayout(self.form_layout)
 
-        self.item_name_field = QLineEdit(self.item.item)
-        self.image_field = QLineEdit(self.item.image)
-        self.type_field = QLineEdit(self.item.type)
-        self.description_field = DynamicHeightTextEdit(self.item.description)
-        self.use_field = DynamicHeightTextEdit("\n".join(self.item.use or []))
-        self.possible_means_check = QCheckBox("Possible Means")
-        self.possible_means_check.setChecked(self.item.possible_means or False)
-        self.possible_motive_check = QCheckBox("Possible Motive")
-        self.possible_motive_check.setChecked(self.item.possible_motive or False)
-        self.possible_opportunity_check = QCheckBox("Possible Opportunity")
-        self.possible_opportunity_check.setChecked(self.item.possible_opportunity or False)
-        self.default_location_combo = QComboBox()
-        self.default_owner_combo = QComboBox()
-        self.significance_field = QLineEdit(self.item.significance)
-        self.clue_potential_combo = QComboBox()
-        self.value_field = QLineEdit(self.item.value)
-        self.condition_combo = QComboBox()
-        self.unique_properties_field = DynamicHeightTextEdit("\n".join(self.item.unique_properties or []))
+        self.item_name_field = self.bind("name", QLineEdit())
+        self.image_field = self.bind("image", QLineEdit(), "optional_text")
+        self.type_field = self.bind("type", QLineEdit())
+        self.description_field = self.bind("description", DynamicHeightTextEdit(), "plain_text")
+        self.use_field = self.bind("use", DynamicHeightTextEdit(), "lines")
+        self.possible_means_check = self.bind("possible_means", QCheckBox("Possible Means"), "flag")
+        self.possible_motive_check = self.bind("possible_motive", QCheckBox("Possible Motive"), "flag")
+        self.possible_opportunity_check = self.bind("possible_opportunity", QCheckBox("Possible Opportunity"), "flag")
+        self.default_location_combo = self.bind("default_location", self.reference_combo("locations"), "reference")
+        self.default_owner_combo = self.bind("default_owner", self.reference_combo("characters"), "reference")
+        self.significance_field = self.bind("significance", QLineEdit(), "optional_text")
+        self.clue_potential_combo = self.bind("clue_potential", QComboBox(), "choice")
+        self.clue_potential_combo.addItems(["_"] + list(get_args(schemas.CluePotential)))
+        self.value_field = self.bind("value", QLineEdit())
+        self.condition_combo = self.bind("condition", QComboBox(), "choice")
+        self.condition_combo.addItems(["_"] + list(get_args(schemas.ItemCondition)))
+        self.unique_properties_field = self.bind("unique_properties", DynamicHeightTextEdit(), "lines")
 
         self.form_layout.addRow("Item Name:", self.item_name_field)
-        self.form_layout.addRow("Image URL:", self.image_field)
+        self.form_layout.addRow("Image:", self.image_picker(self.image_field))
         self.form_layout.addRow("Type:", self.type_field)
         self.form_layout.addRow("Description:", self.description_field)
         self.form_layout.addRow("Use:", self.use_field)
@@ -1276,74 +2530,31 @@ class ItemDetailView(QFrame):
         self.form_layout.addRow("Condition:", self.condition_combo)
         self.form_layout.addRow("Unique Properties:", self.unique_properties_field)
 
-        self.populate_combos()
-
         self.save_button = MaterialButton("Save Item")
         self.save_button.clicked.connect(self.save)
         self.layout.addWidget(self.save_button, alignment=Qt.AlignRight)
 
-    def populate_combos(self):
-        # Default Location
-        self.default_location_combo.addItem("None", None)
-        for loc_id, loc in self.data_manager.world_data.locations.items():
-            self.default_location_combo.addItem(loc.name, loc_id)
-        if self.item.default_location:
-            self.default_location_combo.setCurrentIndex(self.default_location_combo.findData(self.item.default_location))
-
-        # Default Owner
-        self.default_owner_combo.addItem("None", None)
-        for char_id, char in self.data_manager.world_data.characters.items():
-            self.default_owner_combo.addItem(char.full_name, char_id)
-        if self.item.default_owner:
-            self.default_owner_combo.setCurrentIndex(self.default_owner_combo.findData(self.item.default_owner))
-
-        # Clue Potential
-        self.clue_potential_combo.addItems(["_"] + list(get_args(schemas.CluePotential)))
-        self.clue_potential_combo.setCurrentText(self.item.clue_potential or "_")
-
-        # Condition
-        self.condition_combo.addItems(["_"] + list(get_args(schemas.ItemCondition)))
-        self.condition_combo.setCurrentText(self.item.condition or "_")
+        if item_obj is not None:
+            self.load(item_obj)
 
-    def save(self):
-        self.item.item = self.item_name_field.text()
-        self.item.image = self.image_field.text()
-        self.item.type = self.type_field.text()
-        self.item.description = self.description_field.toPlainText()
-        self.item.use = [u for u in self.use_field.toPlainText().splitlines() if u]
-        self.item.possible_means = self.possible_means_check.isChecked()
-        self.item.possible_motive = self.possible_motive_check.isChecked()
-        self.item.possible_opportunity = self.possible_opportunity_check.isChecked()
-        self.item.default_location = self.default_location_combo.currentData()
-        self.item.default_owner = self.default_owner_combo.currentData()
-        self.item.significance = self.significance_field.text()
-        self.item.clue_potential = self.clue_potential_combo.currentText() if self.clue_potential_combo.currentText() != "_" else None
-        self.item.value = self.value_field.text()
-        self.item.condition = self.condition_combo.currentText() if self.condition_combo.currentText() != "_" else None
-        self.item.unique_properties = [p for p in self.unique_properties_field.toPlainText().splitlines() if p]
-        self.on_save()
 
-class DistrictDetailView(QFrame):
-    def __init__(self, district_obj, on_save, data_manager):
-        super().__init__()
-        self.district = district_obj
-        self.on_save = on_save
-        self.data_manager = data_manager
+class DistrictDetailView(AssetEditor):
+    def __init__(self, district_obj, on_save, data_manager, association_models=None):
+        super().__init__(district_obj, on_save, data_manager, association_models)
 
-        self.layout = QVBoxLayout(self)
-        self.layout.setContentsMargins(20, 20, 20, 20)
-        
         self.form_layout = QFormLayout()
         self.layout.addLayout(self.form_layout)
 
-        self.district_name_field = QLineEdit(self.district.district_name)
-        self.description_field = DynamicHeightTextEdit(self.district.description)
-        self.wealth_class_combo = QComboBox()
-        self.atmosphere_field = QLineEdit(self.district.atmosphere)
-        self.key_locations_combo = MultiSelectComboBox()
-        self.population_density_combo = QComboBox()
-        self.notable_features_field = DynamicHeightTextEdit("\n".join(self.district.notable_features or []))
-        self.dominant_faction_combo = QComboBox()
+        self.district_name_field = self.bind("district_name", QLineEdit())
+        self.description_field = self.bind("description", DynamicHeightTextEdit(), "plain_text")
+        self.wealth_class_combo = self.bind("wealth_class", QComboBox(), "choice")
+        self.wealth_class_combo.addItems(["_"] + list(get_args(schemas.WealthClass)))
+        self.atmosphere_field = self.bind("atmosphere", QLineEdit())
+        self.key_locations_combo = self.bind("key_locations", self.references_combo("locations"), "references")
+        self.population_density_combo = self.bind("population_density", QComboBox(), "choice")
+        self.population_density_combo.addItems(["_"] + list(get_args(schemas.PopulationDensity)))
+        self.notable_features_field = self.bind("notable_features", DynamicHeightTextEdit(), "lines")
+        self.dominant_faction_combo = self.bind("dominant_faction", self.reference_combo("factions"), "reference")
 
         self.form_layout.addRow("District Name:", self.district_name_field)
         self.form_layout.addRow("Description:", self.description_field)
@@ -1354,58 +2565,24 @@ class DistrictDetailView(QFrame):
         self.form_layout.addRow("Notable Features:", self.notable_features_field)
         self.form_layout.addRow("Dominant Faction:", self.dominant_faction_combo)
 
-        self.populate_combos()
-
         self.save_button = MaterialButton("Save District")
         self.save_button.clicked.connect(self.save)
         self.layout.addWidget(self.save_button, alignment=Qt.AlignRight)
 
-    def populate_combos(self):
-        # Wealth Class
-        self.wealth_class_combo.addItems(["_"] + list(get_args(schemas.WealthClass)))
-        self.wealth_class_combo.setCurrentText(self.district.wealth_class or "_")
-
-        # Key Locations
-        self.key_locations_combo.setItems(self.data_manager.world_data.locations, self.district.key_locations)
+        if district_obj is not None:
+            self.load(district_obj)
 
-        # Population Density
-        self.population_density_combo.addItems(["_"] + list(get_args(schemas.PopulationDensity)))
-        self.population_density_combo.setCurrentText(self.district.population_density or "_")
-
-        # Dominant Faction
-        self.dominant_faction_combo.addItem("None", None)
-        for faction_id, faction in self.data_manager.world_data.factions.items():
-            self.dominant_faction_combo.addItem(faction.name, faction_id)
-        if self.district.dominant_faction:
-            self.dominant_faction_combo.setCurrentIndex(self.dominant_faction_combo.findData(self.district.dominant_faction))
 
-    def save(self):
-        self.district.district_name = self.district_name_field.text()
-        self.district.description = self.description_field.toPlainText()
-        self.district.wealth_class = self.wealth_class_combo.currentText() if self.wealth_class_combo.currentText() != "_" else None
-        self.district.atmosphere = self.atmosphere_field.text()
-        self.district.key_locations = self.key_locations_combo.getSelectedIds()
-        self.district.population_density = self.population_density_combo.currentText() if self.population_density_combo.currentText() != "_" else None
-        self.district.notable_features = [f for f in self.notable_features_field.toPlainText().splitlines() if f]
-        self.district.dominant_faction = self.dominant_faction_combo.currentData()
-        self.on_save()
+class SleuthDetailView(AssetEditor):
+    def __init__(self, sleuth_obj, on_save, data_manager, association_models=None):
+        super().__init__(sleuth_obj, on_save, data_manager, association_models)
 
-class SleuthDetailView(QFrame):
-    def __init__(self, sleuth_obj, on_save, data_manager):
-        super().__init__()
-        self.sleuth = sleuth_obj
-        self.on_save = on_save
-        self.data_manager = data_manager
-
-        self.layout = QVBoxLayout(self)
-        self.layout.setContentsMargins(20, 20, 20, 20)
-        
         self.form_layout = QFormLayout()
         self.layout.addLayout(self.form_layout)
 
-        self.full_name_field = QLineEdit(self.sleuth.full_name)
-        self.city_field = QLineEdit(self.sleuth.city)
-        self.primary_arc_field = DynamicHeightTextEdit(self.sleuth.primary_arc)
+        self.full_name_field = self.bind("full_name", QLineEdit())
+        self.city_field = self.bind("city", QLineEdit())
+        self.primary_arc_field = self.bind("primary_arc", DynamicHeightTextEdit(), "plain_text")
 
         self.form_layout.addRow("Full Name:", self.full_name_field)
         self.form_layout.addRow("City:", self.city_field)
@@ -1415,11 +2592,51 @@ class SleuthDetailView(QFrame):
         self.save_button.clicked.connect(self.save)
         self.layout.addWidget(self.save_button, alignment=Qt.AlignRight)
 
-    def save(self):
-        self.sleuth.full_name = self.full_name_field.text()
-        self.sleuth.city = self.city_field.text()
-        self.sleuth.primary_arc = self.primary_arc_field.toPlainText()
-        self.on_save()
+        if sleuth_obj is not None:
+            self.load(sleuth_obj)
+
+class CastingDialog(QDialog):
+    """The best-ranked suspects for a case's victim; the checked ones are added as key suspects."""
+    SUGGESTIONS = 25
+
+    def __init__(self, data_manager, case_file, parent=None):
+        super().__init__(parent)
+        self.setWindowTitle("Suggest Suspects")
+        self.resize(520, 480)
+        layout = QVBoxLayout(self)
+        ranking = data_manager.ranking
+        characters = data_manager.world_data.characters
+        victim_id = ranking.find_character(case_file.case_meta.victim)
+        cast = {suspect.character_id for suspect in case_file.key_suspects}
+
+        self.list = QListWidget()
+        if victim_id is None:
+            layout.addWidget(QLabel("Set the case's victim to a character in the world to get suggestions."))
+        else:
+            layout.addWidget(QLabel(f"Likeliest suspects for the murder of {characters[victim_id].full_name}:"))
+            for candidate in ranking.rank_suspects(victim_id, self.SUGGESTIONS, exclude=cast):
+                reasons = ", ".join(f"{name.replace('_', ' ')} {value:+.2f}" for name, value in candidate.components.items() if value)
+                item = QListWidgetItem(f"{characters[candidate.character_id].full_name}  \u2014  {candidate.score:.2f}")
+                item.setToolTip(reasons)
+                item.setData(Qt.UserRole, candidate.character_id)
+                item.setFlags(item.flags() | Qt.ItemIsUserCheckable)
+                item.setCheckState(Qt.Unchecked)
+                self.list.addItem(item)
+        layout.addWidget(self.list)
+
+        buttons = QHBoxLayout()
+        buttons.addStretch()
+        add_button = QPushButton("Add Checked")
+        add_button.clicked.connect(self.accept)
+        close_button = QPushButton("Close")
+        close_button.clicked.connect(self.reject)
+        buttons.addWidget(add_button)
+        buttons.addWidget(close_button)
+        layout.addLayout(buttons)
+
+    def selected_ids(self):
+        return [self.list.item(row).data(Qt.UserRole) for row in range(self.list.count())
+                if self.list.item(row).checkState() == Qt.Checked]
 
 class CaseBuilder(QWidget):
     def __init__(self, data_manager):
@@ -1436,13 +2653,36 @@ class CaseBuilder(QWidget):
         self.new_case_button.clicked.connect(self.create_new_case)
         self.main_layout.addWidget(self.new_case_button)
 
+        self.suggest_button = MaterialButton("Suggest Suspects")
+        self.suggest_button.clicked.connect(self.suggest_suspects)
+        self.main_layout.addWidget(self.suggest_button)
+
+        self.jump_field = QLineEdit()
+        self.jump_field.setPlaceholderText("Jump to clue, character or location id...")
+        self.jump_field.returnPressed.connect(self.jump_to_node)
+        self.main_layout.addWidget(self.jump_field)
+
+        # One toggle per derived relationship type
+        self.relation_toggles = QHBoxLayout()
+        for relation in RELATION_TYPES:
+            toggle = QCheckBox(relation)
+            toggle.setChecked(True)
+            toggle.toggled.connect(lambda checked, r=relation: self.plot_graph_view.set_relation_visible(r, checked))
+            self.relation_toggles.addWidget(toggle)
+        self.relation_toggles.addStretch()
+        self.main_layout.addLayout(self.relation_toggles)
+
         self.plot_graph_view = PlotGraphView()
         self.main_layout.addWidget(self.plot_graph_view)
 
         self.populate_case_selector()
+        # Saved cases update their cached boards, including saves made by undo and redo
+        self.data_manager.add_listener(self.on_data_saved)
 
     def create_new_case(self):
-        case_name, ok = QInputDialog.getText(self, "New Case", "Enter a name for the new case (e.g., Victim's Name):")
+        # Offer the likeliest victims in the world, but any name can still be typed
+        victims = [self.data_manager.world_data.characters[c.character_id].full_name for c in self.data_manager.ranking.rank_victims(20)]
+        case_name, ok = QInputDialog.getItem(self, "New Case", "Enter a name for the new case (e.g., Victim's Name):", [""] + victims, 0, True)
         if ok and case_name:
             new_case = schemas.CaseFile()
             new_case.case_meta.victim = case_name # Use victim as the case ID for now
@@ -1453,6 +2693,59 @@ class CaseBuilder(QWidget):
             if index != -1:
                 self.case_selector.setCurrentIndex(index)
 
+    def suggest_suspects(self):
+        case_id = self.case_selector.currentData()
+        case_file = self.data_manager.case_files.get(case_id) if case_id else None
+        if case_file is None:
+            return
+        dialog = CastingDialog(self.data_manager, case_file, self)
+        if dialog.exec() != QDialog.Accepted or not dialog.selected_ids():
+            return
+        suspects = case_file.key_suspects + [schemas.CaseSuspect(character_id=character_id) for character_id in dialog.selected_ids()]
+        self.data_manager.history.set_fields(case_file, {"key_suspects": suspects}, ("case", case_file), "Add suspects")
+        self.data_manager.save_case(case_file) # The board is rebuilt by on_data_saved
+
+    def on_data_saved(self, kind, keys):
+        if kind == "case":
+            for case_id in keys:
+                self.refresh_case(case_id)
+
+    @staticmethod
+    def board_cast(case_file):
+        """The suspects, locations and witnesses a board has cards for; clue cards are kept up to date one by one."""
+        return (tuple(suspect.character_id for suspect in case_file.key_suspects),
+                tuple((location.location_id, tuple(witness.character_id for witness in location.witnesses)) for location in case_file.locations))
+
+    @profiler.timed("board.refresh")
+    def refresh_case(self, case_id):
+        """
+        Brings the cached board of a saved case up to date. Only the clues that were
+        added, removed or relinked are touched; a change of cast rebuilds the board.
+        """
+        scene = self.plot_graph_view.cached_scene(case_id)
+        if scene is None or scene.edge_index is None:
+            return # Built from the case data on next visit
+        case_file = self.data_manager.case_files.get(case_id)
+        if case_file is None or self.board_cast(case_file) != scene.cast:
+            self.rebuild_case(case_id)
+            return
+        changed, removed_ids = scene.edge_index.stale_clues(case_file)
+        for clue_id in removed_ids:
+            self.remove_clue(case_id, clue_id)
+        if changed:
+            positions = {clue.clue_id: position for position, clue in enumerate(case_file.clues)}
+            for clue in changed:
+                self.refresh_clue(case_id, clue, positions[clue.clue_id])
+        added, removed = scene.edge_index.sync_interviews(case_file)
+        self.plot_graph_view.hide_derived_edges(removed, scene)
+        self.plot_graph_view.show_derived_edges(added, scene)
+
+    def rebuild_case(self, case_id):
+        """Drops a case's board, building it again straight away if it is the one shown."""
+        self.plot_graph_view.discard_scene(case_id)
+        if self.case_selector.currentData() == case_id:
+            self.load_selected_case(self.case_selector.currentIndex())
+
     def populate_case_selector(self):
         self.case_selector.blockSignals(True) # Block signals to prevent load_selected_case from firing during population
         self.case_selector.clear()
@@ -1461,54 +2754,148 @@ class CaseBuilder(QWidget):
             self.case_selector.addItem(case_obj.case_meta.victim or case_id, case_id)
         self.case_selector.blockSignals(False)
 
+    def store_current_layout(self):
+        """Writes the arrangement of the visible board back to its case file."""
+        case_id = self.plot_graph_view.scene.case_id
+        case_file = self.data_manager.case_files.get(case_id) if case_id is not None else None
+        if case_file is None:
+            return
+        layout = self.plot_graph_view.capture_layout()
+        if layout != case_file.board_layout:
+            case_file.board_layout = layout
+            self.data_manager.save_case(case_file)
+
+    @profiler.timed("case.load")
     def load_selected_case(self, index):
+        self.store_current_layout()
         case_id = self.case_selector.itemData(index)
-        self.plot_graph_view.scene.clear() # Clear existing nodes
-
-        if case_id:
-            case_file = self.data_manager.case_files.get(case_id)
-            if case_file:
-                # Add Case Meta Node
-                case_meta_card = CaseMetaCard(case_file.case_meta)
-                self.plot_graph_view.add_node(case_meta_card, QPointF(0, 0))
-
-                # Add Suspects
-                x_offset = -300
-                y_offset = 100
-                for suspect_id in case_file.key_suspects:
-                    character = self.data_manager.world_data.characters.get(suspect_id)
-                    if character:
-                        suspect_card = SuspectCard(character)
-                        self.plot_graph_view.add_node(suspect_card, QPointF(x_offset, y_offset))
-                        y_offset += 150
-
-                # Add Witnesses
-                x_offset = 300
-                y_offset = 100
-                for witness_id in case_file.key_witnesses:
-                    character = self.data_manager.world_data.characters.get(witness_id)
-                    if character:
-                        witness_card = WitnessCard(character)
-                        self.plot_graph_view.add_node(witness_card, QPointF(x_offset, y_offset))
-                        y_offset += 150
-
-                # Add Clues
-                x_offset = 0
-                y_offset = -200
-                for clue_obj in case_file.clues:
-                    clue_card = ClueCard(clue_obj)
-                    self.plot_graph_view.add_node(clue_card, QPointF(x_offset, y_offset))
-                    x_offset += 200
-
-                # Add Case Locations
-                x_offset = -200
-                y_offset = -300
-                for loc_id in case_file.case_locations:
-                    location = self.data_manager.world_data.locations.get(loc_id)
-                    if location:
-                        loc_card = CaseLocationCard(location)
-                        self.plot_graph_view.add_node(loc_card, QPointF(x_offset, y_offset))
-                        x_offset += 200
+        case_file = self.data_manager.case_files.get(case_id) if case_id else None
+        if case_file is None:
+            self.plot_graph_view.show_empty_scene()
+            return
+
+        # Recently viewed boards are restored as they were left
+        cached = self.plot_graph_view.activate_scene(case_id)
+        profiler.hit("board.scene_cache", cached)
+        if cached:
+            return
+
+        # Populate the scene while it is detached from the view, so no repaints
+        # or index updates happen per card, then show it in one go
+        scene = self.plot_graph_view.begin_scene(case_id, show=False)
+        scene.begin_bulk_insert()
+        self.populate_board(scene, case_file)
+        scene.end_bulk_insert()
+        self.plot_graph_view.viewport().setUpdatesEnabled(False)
+        self.plot_graph_view.activate_scene(case_id)
+        self.plot_graph_view.viewport().setUpdatesEnabled(True)
+
+    @profiler.timed("board.populate")
+    def populate_board(self, scene, case_file):
+        """Adds a card for every part of the case, at its saved position or a default grid slot."""
+        characters = self.data_manager.world_data.characters
+        locations = self.data_manager.world_data.locations
+        saved_positions = case_file.board_layout.node_positions
+
+        def node_pos(key, default_x, default_y):
+            saved = saved_positions.get(key)
+            return QPointF(saved.x, saved.y) if saved else QPointF(default_x, default_y)
+
+        # Add Case Meta Node
+        scene.add_node(CaseMetaCard(case_file.case_meta), node_pos("case_meta", 0, 0), "case_meta")
+
+        # Cards are passed as factories, so only the ones scrolled into view get built
+
+        # Add Suspects (column to the left of the case meta)
+        for row, suspect in enumerate(case_file.key_suspects):
+            key = node_key("character", suspect.character_id)
+            character = characters.get(suspect.character_id)
+            if character and key not in scene.nodes:
+                scene.add_node(lambda c=character: SuspectCard(c), node_pos(key, -400, 150 * row), key, f"Suspect: {character.full_name}")
+
+        # Add Case Locations (row above) and their Witnesses (column to the right)
+        witness_row = 0
+        for column, case_location in enumerate(case_file.locations):
+            key = node_key("location", case_location.location_id)
+            location = locations.get(case_location.location_id)
+            if location and key not in scene.nodes:
+                scene.add_node(lambda l=location: CaseLocationCard(l), node_pos(key, 300 * column, -300), key, f"Location: {location.name}")
+            for witness in case_location.witnesses:
+                key = node_key("character", witness.character_id)
+                character = characters.get(witness.character_id)
+                if character and key not in scene.nodes:
+                    scene.add_node(lambda c=character: WitnessCard(c), node_pos(key, 400, 150 * witness_row), key, f"Witness: {character.full_name}")
+                    witness_row += 1
+
+        # Add Clues (grid below, roughly square so large cases stay navigable)
+        for position, clue_obj in enumerate(case_file.clues):
+            self.add_clue_node(scene, case_file, clue_obj, position)
+
+        self.plot_graph_view.restore_edges(case_file.board_layout.edges, scene)
+        scene.cast = self.board_cast(case_file)
+        scene.edge_index = CaseEdgeIndex(case_file, self.data_manager.world_data)
+        self.plot_graph_view.show_derived_edges(scene.edge_index.edges(), scene)
+        self.plot_graph_view.apply_viewport(case_file.board_layout.viewport, scene)
+
+    def show_case_node(self, asset_type, asset_id, case_id=None):
+        """Opens the board of a case and centres it on a clue or interviewee, e.g. from search."""
+        if case_id is None and asset_type == "cases":
+            case_id = asset_id
+        if case_id is None and asset_type == "clues":
+            case_id = next((cid for cid, case_file in self.data_manager.case_files.items()
+                            if any(clue.clue_id == asset_id for clue in case_file.clues)), None)
+        index = self.case_selector.findData(case_id) if case_id is not None else -1
+        if index == -1:
+            return
+        self.case_selector.setCurrentIndex(index)
+        if asset_type != "cases":
+            self.plot_graph_view.jump_to_node(asset_id)
+
+    def jump_to_node(self):
+        if not self.plot_graph_view.jump_to_node(self.jump_field.text().strip()):
+            self.jump_field.selectAll() # Not on this board; leave the text ready to retype
+
+    def add_clue_node(self, scene, case_file, clue_obj, position):
+        """Adds a clue's card at its saved position, or at the grid slot of its position in case_file.clues."""
+        key = node_key("clue", clue_obj.clue_id)
+        saved = case_file.board_layout.node_positions.get(key)
+        if saved:
+            pos = QPointF(saved.x, saved.y)
+        else:
+            columns = max(1, math.ceil(math.sqrt(len(case_file.clues))))
+            row, column = divmod(position, columns)
+            pos = QPointF(300 * column, 300 + 150 * row)
+        scene.add_node(lambda c=clue_obj: ClueCard(c), pos, key, f"Clue: {clue_obj.clue_summary}")
+
+    def refresh_clue(self, case_id, clue, position=None):
+        """
+        Re-derives the board edges of one added or edited clue without rebuilding the
+        board. position is the clue's index in the case's clues; None means it was appended.
+        """
+        scene = self.plot_graph_view.cached_scene(case_id)
+        if scene is None or scene.edge_index is None:
+            return # Built from the case data on next visit
+        key = node_key("clue", clue.clue_id)
+        is_new = key not in scene.nodes
+        if is_new:
+            case_file = self.data_manager.case_files[case_id]
+            self.add_clue_node(scene, case_file, clue, len(case_file.clues) - 1 if position is None else position)
+        added, removed = scene.edge_index.update_clue(clue)
+        self.plot_graph_view.hide_derived_edges(removed, scene)
+        if is_new:
+            # Edges of other records that name this clue could not be drawn until its card existed
+            added = [edge for edge in scene.edge_index.edges() if key in (edge.start_node, edge.end_node)]
+        self.plot_graph_view.show_derived_edges(added, scene)
+
+    def remove_clue(self, case_id, clue_id):
+        """Takes a deleted clue's card and edges off the board."""
+        scene = self.plot_graph_view.cached_scene(case_id)
+        if scene is None or scene.edge_index is None:
+            return
+        added, removed = scene.edge_index.remove_clue(clue_id)
+        self.plot_graph_view.hide_derived_edges(removed, scene)
+        self.plot_graph_view.show_derived_edges(added, scene)
+        scene.remove_node(node_key("clue", clue_id))
 
 class CaseLocationCard(CardWidget):
     def __init__(self, location_obj, parent=None):
@@ -1590,261 +2977,390 @@ class CaseMetaDetailView(QFrame):
         self.on_save()
 
 
-# --- The Interactive Plot Graph ---
-class ConnectionNode(QGraphicsItem):
-    """Represents a single asset card as a movable node on the graph."""
-    def __init__(self, card_widget, parent=None):
-        super().__init__(parent)
-        self.proxy = QGraphicsProxyWidget(self)
-        self.proxy.setWidget(card_widget)
-        
-        self.setFlags(QGraphicsItem.ItemIsMovable |
-                      QGraphicsItem.ItemIsSelectable |
-                      QGraphicsItem.ItemSendsGeometryChanges)
-        
-        self.sockets = []
-        self.socket_radius = 6
-        self._create_sockets()
-        self.lines = []
-
-    def _create_sockets(self):
-        card_rect = self.proxy.widget().rect()
-        # Sockets are positioned relative to the ConnectionNode's origin
-        self.sockets.append(QPointF(0, card_rect.height() / 2)) # Left
-        self.sockets.append(QPointF(card_rect.width(), card_rect.height() / 2)) # Right
-
-    def boundingRect(self):
-        return self.proxy.boundingRect().adjusted(-self.socket_radius, -self.socket_radius, self.socket_radius, self.socket_radius)
+# --- Validator Components ---
+class ValidatorWorker(QThread):
+    validation_finished = Signal(list) # Signal to emit validation results
 
-    def paint(self, painter, option, widget=None):
-        painter.setPen(QPen(QColor("#D4AF37"), 2))
-        painter.setBrush(QBrush(QColor("#10141a")))
-        for pos in self.sockets:
-            painter.drawEllipse(pos, self.socket_radius, self.socket_radius)
-            
-    def itemChange(self, change, value):
-        if change == QGraphicsItem.ItemPositionHasChanged:
-            for line in self.lines:
-                line.update_path()
-        return super().itemChange(change, value)
+    def __init__(self, data_manager):
+        super().__init__()
+        self.data_manager = data_manager
 
-    def get_socket_scene_pos(self, index):
-        if 0 <= index < len(self.sockets):
-            return self.mapToScene(self.sockets[index])
-        return QPointF()
+    def run(self):
+        self.validation_finished.emit(validate_project(self.data_manager.world_data, self.data_manager.case_files))
 
-class ConnectionLine(QGraphicsItem):
-    """A curved Bezier line to connect two nodes."""
-    def __init__(self, start_node, start_socket_idx, end_node, end_socket_idx, parent=None):
+# --- Performance HUD ---
+class PerformanceHUD(QLabel):
+    """
+    A translucent overlay listing the slowest spans, the cache counters and the
+    board's frame-time histogram from the profiler. Refreshes twice a second while shown.
+    """
+    def __init__(self, parent=None):
         super().__init__(parent)
-        self.start_node = start_node
-        self.start_socket_idx = start_socket_idx
-        self.end_node = end_node
-        self.end_socket_idx = end_socket_idx
-        
-        self.pen = QPen(QColor("#00e5ff"), 2)
-        self.pen.setCapStyle(Qt.RoundCap)
-        
-        self._path = QPainterPath()
-        self.update_path()
+        self.setObjectName("performanceHud")
+        self.setAttribute(Qt.WA_TransparentForMouseEvents)
+        self.setTextFormat(Qt.PlainText)
+        self.setAlignment(Qt.AlignTop | Qt.AlignLeft)
+        self.refresh_timer = QTimer(self)
+        self.refresh_timer.setInterval(500)
+        self.refresh_timer.timeout.connect(self.refresh)
+        self.hide()
+
+    def showEvent(self, event):
+        super().showEvent(event)
+        self.refresh()
+        self.refresh_timer.start()
+
+    def hideEvent(self, event):
+        super().hideEvent(event)
+        self.refresh_timer.stop()
+
+    def refresh(self):
+        lines = [f"{'span':<34}{'n':>7}{'avg ms':>9}{'max ms':>9}"]
+        for name, stats in profiler.top_spans(12):
+            lines.append(f"{name[:33]:<34}{stats.count:>7}{stats.mean_ms:>9.2f}{stats.max_ms:>9.2f}")
+        frames = profiler.frame_summary()
+        lines.append("")
+        lines.append(f"frames {frames['frames']}  p50 {frames['p50_ms']:.1f}  p95 {frames['p95_ms']:.1f}  max {frames['max_ms']:.1f} ms")
+        histogram = profiler.frame_histogram()
+        peak = max(histogram) or 1
+        labels = [f"<{bound}" for bound in FRAME_BUCKETS_MS] + [f">{FRAME_BUCKETS_MS[-1]}"]
+        for label, count in zip(labels, histogram):
+            lines.append(f"{label:>5} ms {'#' * round(20 * count / peak):<20} {count}")
+        counters = dict(profiler.counters)
+        if counters:
+            lines.append("")
+            for name in sorted(counters):
+                lines.append(f"{name:<34}{counters[name]:>7}")
+        self.setText("\n".join(lines))
+        self.adjustSize()
+        self.move(self.parentWidget().width() - self.width() - 12, 12)
+        self.raise_()
+
+# --- Background I/O ---
+class FutureBridge(QObject):
+    """Calls back on the GUI thread when a core.io Future finishes, whichever thread finished it."""
+    finished = Signal(object, object) # Future, (callback, error callback)
 
-    def boundingRect(self):
-        return self._path.boundingRect()
-
-    def update_path(self):
-        self.prepareGeometryChange()
-        start_pos = self.start_node.get_socket_scene_pos(self.start_socket_idx)
-        end_pos = self.end_node.get_socket_scene_pos(self.end_socket_idx)
-        
-        path = QPainterPath()
-        path.moveTo(start_pos)
-        
-        dx = end_pos.x() - start_pos.x()
-        dy = end_pos.y() - start_pos.y()
-        ctrl1 = QPointF(start_pos.x() + dx * 0.5, start_pos.y())
-        ctrl2 = QPointF(start_pos.x() + dx * 0.5, end_pos.y())
-        
-        path.cubicTo(ctrl1, ctrl2, end_pos)
-        self._path = path
-
-    def paint(self, painter, option, widget=None):
-        painter.setPen(self.pen)
-        painter.setBrush(Qt.NoBrush)
-        painter.drawPath(self._path)
-
-class PlotGraphView(QGraphicsView):
-    """The main view for displaying and interacting with the plot graph."""
     def __init__(self, parent=None):
         super().__init__(parent)
-        self.scene = QGraphicsScene(self)
-        self.setScene(self.scene)
-        
-        self.setRenderHint(QPainter.Antialiasing)
-        self.setDragMode(QGraphicsView.RubberBandDrag)
-        self.setTransformationAnchor(QGraphicsView.AnchorUnderMouse)
-        self.setResizeAnchor(QGraphicsView.AnchorViewCenter)
-        self.scene.setBackgroundBrush(QColor("#10141a"))
+        self.finished.connect(self._deliver, Qt.QueuedConnection) # Queued even if the Future is already done
 
-    def add_node(self, widget, pos=QPointF(0, 0)):
-        node = ConnectionNode(widget)
-        node.setPos(pos)
-        self.scene.addItem(node)
-        return node
+    def then(self, future, callback=None, error_callback=None):
+        """callback(result) or error_callback(exception) runs on the GUI thread once future is done."""
+        future.add_done_callback(lambda done: self.finished.emit(done, (callback, error_callback)))
 
-    def connect_nodes(self, start_node, end_node):
-        # Default connection: right socket of start to left socket of end
-        start_socket_idx, end_socket_idx = 1, 0
-        
-        connection = ConnectionLine(start_node, start_socket_idx, end_node, end_socket_idx)
-        self.scene.addItem(connection)
-        
-        # Register the line with the nodes so they can update it on move
-        start_node.lines.append(connection)
-        end_node.lines.append(connection)
-        
-        return connection
-        
-    def wheelEvent(self, event):
-        zoom_in_factor = 1.15
-        zoom_out_factor = 1 / zoom_in_factor
-        
-        if event.angleDelta().y() > 0:
-            self.scale(zoom_in_factor, zoom_in_factor)
-        else:
-            self.scale(zoom_out_factor, zoom_out_factor)
+    def _deliver(self, future, callbacks):
+        callback, error_callback = callbacks
+        error = future.exception()
+        if error is None:
+            if callback is not None:
+                callback(future.result())
+        elif error_callback is not None:
+            error_callback(error)
 
-# --- Validator Components ---
-class ValidatorWorker(QThread):
-    validation_finished = Signal(list) # Signal to emit validation results
+# --- Main Window ---
+class DataLoadWorker(QThread):
+    """
+    Builds the DataManager off the GUI thread; the world and the case files are read
+    on the IOExecutor, several cases at a time.
+    """
+    progress = Signal(int, int) # Case files loaded, total case files
+    loaded = Signal(object) # The DataManager
 
-    def __init__(self, data_manager):
-        super().__init__()
-        self.data_manager = data_manager
+    def __init__(self, io, parent=None):
+        super().__init__(parent)
+        self.io = io
 
     def run(self):
-        results = []
-
-        # --- World Data Validations ---
-        # Check for characters with empty full names
-        for char_id, character in self.data_manager.world_data.characters.items():
-            if not character.full_name:
-                results.append({'message': f"Warning: Character with ID {char_id} has no full name. (World Data)", 'asset_type': 'characters', 'asset_id': char_id})
-
-        # Check for locations with empty names
-        for loc_id, location in self.data_manager.world_data.locations.items():
-            if not location.name:
-                results.append({'message': f"Warning: Location with ID {loc_id} has no name. (World Data)", 'asset_type': 'locations', 'asset_id': loc_id})
-
-        # Check for factions with empty names
-        for faction_id, faction in self.data_manager.world_data.factions.items():
-            if not faction.name:
-                results.append({'message': f"Warning: Faction with ID {faction_id} has no name. (World Data)", 'asset_type': 'factions', 'asset_id': faction_id})
-
-        # Check for items with empty names
-        for item_id, item in self.data_manager.world_data.items.items():
-            if not item.item:
-                results.append({'message': f"Warning: Item with ID {item_id} has no name. (World Data)", 'asset_type': 'items', 'asset_id': item_id})
-
-        # Check for districts with empty names
-        for district_id, district in self.data_manager.world_data.districts.items():
-            if not district.district_name:
-                results.append({'message': f"Warning: District with ID {district_id} has no name. (World Data)", 'asset_type': 'districts', 'asset_id': district_id})
-
-        # --- Case Data Validations (Basic Solvability and Deception Integrity) ---
-        for case_id, case_file in self.data_manager.case_files.items():
-            # Core Solvability Check
-            if not case_file.case_meta.victim:
-                results.append({'message': f"Error: Case '{case_id}' has no victim defined.", 'asset_type': 'cases', 'asset_id': case_id})
-            if not case_file.case_meta.culprit:
-                results.append({'message': f"Error: Case '{case_id}' has no culprit defined.", 'asset_type': 'cases', 'asset_id': case_id})
-            if not case_file.case_meta.crime_scene:
-                results.append({'message': f"Warning: Case '{case_id}' has no crime scene defined.", 'asset_type': 'cases', 'asset_id': case_id})
-
-            # Check if Means, Motive, Opportunity clues exist
-            for clue_type in ["means_clue", "motive_clue", "opportunity_clue"]:
-                clue_id = getattr(case_file.case_meta, clue_type)
-                if clue_id and not any(c.clue_id == clue_id for c in case_file.clues):
-                    results.append({'message': f"Error: Case '{case_id}' references a non-existent {clue_type} '{clue_id}'.", 'asset_type': 'clues', 'asset_id': clue_id})
-
-            # Deception Integrity Check
-            for suspect in case_file.key_suspects:
-                for interview in suspect.interviews:
-                    if interview.answer.is_lie and not interview.answer.debunking_clue:
-                        results.append({'message': f"Warning: Suspect '{suspect.character_id}' has a lie without a debunking clue in case '{case_id}'.", 'asset_type': 'characters', 'asset_id': suspect.character_id})
-                    if interview.answer.is_lie and interview.answer.debunking_clue and not any(c.clue_id == interview.answer.debunking_clue for c in case_file.clues):
-                        results.append({'message': f"Error: Suspect '{suspect.character_id}' references a non-existent debunking clue '{interview.answer.debunking_clue}' in case '{case_id}'.", 'asset_type': 'clues', 'asset_id': interview.answer.debunking_clue})
-
-            for location in case_file.locations:
-                for witness in location.witnesses:
-                    for interview in witness.interviews:
-                        if interview.answer.is_lie and not interview.answer.debunking_clue:
-                            results.append({'message': f"Warning: Witness '{witness.character_id}' has a lie without a debunking clue in case '{case_id}'.", 'asset_type': 'characters', 'asset_id': witness.character_id})
-                        if interview.answer.is_lie and interview.answer.debunking_clue and not any(c.clue_id == interview.answer.debunking_clue for c in case_file.clues):
-                            results.append({'message': f"Error: Witness '{witness.character_id}' references a non-existent debunking clue '{interview.answer.debunking_clue}' in case '{case_id}'.", 'asset_type': 'clues', 'asset_id': interview.answer.debunking_clue})
-
-        # Simulate some work to show asynchronicity
-        import time
-        time.sleep(0.5)
-
-        self.validation_finished.emit(results)
+        data_manager = DataManager(progress=self.progress.emit, io=self.io)
+        self.loaded.emit(data_manager)
 
-# --- Main Window ---
 class MainWindow(QMainWindow):
-    def __init__(self):
+    """
+    Boots in stages so the window paints before any data is read: the shell (tabs,
+    menus and a loading bar) is built first, the data loads on a worker thread, each
+    tab's real page is built the first time it is shown, and validation starts only
+    after the first frame.
+    """
+    def __init__(self, launch_time=None):
         super().__init__()
         self.setWindowTitle("The Agency Case Builder")
-        self.data_manager = DataManager()
+        self.launch_time = launch_time if launch_time is not None else time.perf_counter()
+        self.first_frame_shown = False
+        self.data_manager = None
+        self.world_builder = None
+        self.case_builder = None
+        self.search_service = None
+        self.quick_open_dialog = None
 
         self.central_widget = QWidget()
         self.setCentralWidget(self.central_widget)
         self.main_layout = QVBoxLayout(self.central_widget)
 
+        # Placeholder pages, swapped for the real builders on first visit
         self.main_tabs = QTabWidget()
         self.main_layout.addWidget(self.main_tabs)
-
-        self.world_builder = WorldBuilder(self.data_manager)
-        self.case_builder = CaseBuilder(self.data_manager)
-
-        self.main_tabs.addTab(self.world_builder, "World Builder")
-        self.main_tabs.addTab(self.case_builder, "Case Builder")
+        self.tab_builders = {"World Builder": self.ensure_world_builder, "Case Builder": self.ensure_case_builder}
+        for title in self.tab_builders:
+            placeholder = QLabel("Loading...")
+            placeholder.setAlignment(Qt.AlignCenter)
+            self.main_tabs.addTab(placeholder, title)
+        self.main_tabs.currentChanged.connect(self.on_tab_changed)
+
+        # Data loading progress
+        self.load_progress = QProgressBar()
+        self.load_progress.setRange(0, 0) # Busy until the number of case files is known
+        self.load_progress.setFormat("Loading cases... %v/%m")
+        self.statusBar().addPermanentWidget(self.load_progress)
+        self.statusBar().showMessage("Loading world data...")
+
+        # Board overview, shown alongside the Case Builder
+        self.minimap_dock = QDockWidget("Board Overview", self)
+        self.minimap_dock.setObjectName("minimapDock")
+        self.addDockWidget(Qt.RightDockWidgetArea, self.minimap_dock)
+        self.minimap_dock.hide()
+
+        # Settings
+        self.settings = QSettings("TheAgency", "CaseBuilder")
+        view_menu = self.menuBar().addMenu("View")
+        self.opengl_action = view_menu.addAction("OpenGL Board Rendering")
+        self.opengl_action.setCheckable(True)
+        self.opengl_action.setChecked(self.settings.value("plot_graph/opengl", False, type=bool))
+        self.opengl_action.toggled.connect(self.set_opengl_board_rendering) # Applied when the board is built
+        self.reduced_motion_action = view_menu.addAction("Reduced Motion")
+        self.reduced_motion_action.setCheckable(True)
+        animations = AnimationManager.instance()
+        animations.set_reduced_motion(self.settings.value("ui/reduced_motion", False, type=bool))
+        self.reduced_motion_action.setChecked(animations.reduced_motion)
+        # Only a user's choice is remembered; an automatic switch lasts for the session
+        self.reduced_motion_action.triggered.connect(self.set_reduced_motion)
+        animations.reduced_motion_changed.connect(self.reduced_motion_action.setChecked)
+        theme_menu = view_menu.addMenu("Theme")
+        theme_group = QActionGroup(self)
+        for theme_name in theme.THEMES:
+            theme_action = theme_menu.addAction(theme_name.capitalize())
+            theme_action.setCheckable(True)
+            theme_action.setChecked(theme_name == theme.current())
+            theme_action.triggered.connect(lambda checked, name=theme_name: self.set_theme(name))
+            theme_group.addAction(theme_action)
+        view_menu.addSeparator()
+        self.performance_hud = PerformanceHUD(self)
+        hud_action = view_menu.addAction("Performance HUD")
+        hud_action.setCheckable(True)
+        hud_action.setShortcut(QKeySequence("Ctrl+Shift+P"))
+        hud_action.toggled.connect(self.performance_hud.setVisible)
+        export_trace_action = view_menu.addAction("Export Performance Trace...")
+        export_trace_action.triggered.connect(self.export_performance_trace)
+
+        # Undo and redo, usable once the data has loaded
+        edit_menu = self.menuBar().addMenu("Edit")
+        self.undo_action = edit_menu.addAction("Undo")
+        self.undo_action.setShortcut(QKeySequence.Undo)
+        self.undo_action.setEnabled(False)
+        self.redo_action = edit_menu.addAction("Redo")
+        self.redo_action.setShortcut(QKeySequence.Redo)
+        self.redo_action.setEnabled(False)
+
+        # Global search, usable once the data has loaded
+        search_menu = self.menuBar().addMenu("Search")
+        self.quick_open_action = search_menu.addAction("Quick Open...")
+        self.quick_open_action.setShortcut(QKeySequence("Ctrl+K"))
+        self.quick_open_action.setEnabled(False)
 
         # Validator Panel
         self.validator_panel = ValidatorPanel()
         self.main_layout.addWidget(self.validator_panel)
+        self.validator_panel.issue_selected.connect(self.go_to_asset)
+        self.validator_worker = None
+
+        # Data, off the GUI thread. Saves are written in the background too; failures show in the status bar
+        self.io = IOExecutor()
+        self.io_bridge = FutureBridge(self)
+        self.writes_in_flight = 0 # Saves whose write hasn't finished, for the status bar
+        self.data_loader = DataLoadWorker(self.io, self)
+        self.data_loader.progress.connect(self.on_load_progress)
+        self.data_loader.loaded.connect(self.on_data_loaded)
+        self.data_loader.start()
+
+    def paintEvent(self, event):
+        super().paintEvent(event)
+        if not self.first_frame_shown:
+            self.first_frame_shown = True
+            logger.info(f"Time to first frame: {(time.perf_counter() - self.launch_time) * 1000:.0f} ms")
+            QTimer.singleShot(0, self.start_validation)
+
+    def on_load_progress(self, done, total):
+        self.load_progress.setRange(0, total)
+        self.load_progress.setValue(done)
+        self.statusBar().showMessage("Loading cases...")
 
-        # Validator Worker
+    def on_data_loaded(self, data_manager):
+        self.data_manager = data_manager
+        self.load_progress.hide()
+        self.statusBar().clearMessage()
+        logger.info(f"Data loaded after {(time.perf_counter() - self.launch_time) * 1000:.0f} ms")
+
+        self.search_service = SearchService(self.data_manager, self)
+        self.quick_open_dialog = QuickOpenDialog(self.search_service, self)
+        self.quick_open_dialog.result_chosen.connect(lambda document: self.go_to_asset(document.kind, document.target_id, document.case_id))
+        self.quick_open_action.triggered.connect(self.quick_open_dialog.show)
+        self.quick_open_action.setEnabled(True)
+
+        self.data_manager.write_listeners.append(self.on_write_started)
+
+        history = self.data_manager.history
+        self.undo_action.triggered.connect(history.undo)
+        self.redo_action.triggered.connect(history.redo)
+        history.listeners.append(self.on_history_applied)
+        history.changed_listeners.append(self.update_undo_actions)
+
+        self.on_tab_changed(self.main_tabs.currentIndex())
+        self.start_validation()
+
+    def on_write_started(self, future):
+        self.writes_in_flight += 1
+        self.io_bridge.then(future, self.on_write_finished, self.on_write_failed)
+
+    def on_write_finished(self, result=None):
+        self.writes_in_flight -= 1
+        if self.writes_in_flight == 0:
+            self.statusBar().showMessage("All changes saved", 3000)
+
+    def on_write_failed(self, error):
+        self.writes_in_flight -= 1
+        self.statusBar().showMessage(f"Save failed: {error}", 10000)
+
+    def on_tab_changed(self, index):
+        if self.data_manager is not None:
+            self.tab_builders[self.main_tabs.tabText(index)]()
+        self.minimap_dock.setVisible(self.case_builder is not None and self.main_tabs.widget(index) is self.case_builder)
+
+    def replace_tab(self, title, page):
+        index = next(i for i in range(self.main_tabs.count()) if self.main_tabs.tabText(i) == title)
+        current = self.main_tabs.currentIndex()
+        self.main_tabs.blockSignals(True)
+        placeholder = self.main_tabs.widget(index)
+        self.main_tabs.removeTab(index)
+        self.main_tabs.insertTab(index, page, title)
+        self.main_tabs.setCurrentIndex(current)
+        self.main_tabs.blockSignals(False)
+        placeholder.deleteLater()
+
+    def ensure_world_builder(self):
+        if self.world_builder is None:
+            start = time.perf_counter()
+            self.world_builder = WorldBuilder(self.data_manager)
+            self.replace_tab("World Builder", self.world_builder)
+            logger.info(f"World Builder built in {(time.perf_counter() - start) * 1000:.0f} ms")
+        return self.world_builder
+
+    def ensure_case_builder(self):
+        if self.case_builder is None:
+            start = time.perf_counter()
+            self.case_builder = CaseBuilder(self.data_manager)
+            self.replace_tab("Case Builder", self.case_builder)
+            self.minimap_dock.setWidget(MinimapView(self.case_builder.plot_graph_view))
+            if self.opengl_action.isChecked():
+                self.set_opengl_board_rendering(True)
+            logger.info(f"Case Builder built in {(time.perf_counter() - start) * 1000:.0f} ms")
+        return self.case_builder
+
+    def update_undo_actions(self):
+        history = self.data_manager.history
+        self.undo_action.setEnabled(history.can_undo())
+        self.undo_action.setText(f"Undo {history.undo_label()}" if history.can_undo() else "Undo")
+        self.redo_action.setEnabled(history.can_redo())
+        self.redo_action.setText(f"Redo {history.redo_label()}" if history.can_redo() else "Redo")
+
+    def on_history_applied(self, command):
+        kind, target = command.key
+        if kind == "world" and self.world_builder is not None:
+            self.world_builder.asset_restored(*target)
+
+    def start_validation(self):
+        """Runs once both the first frame has been shown and the data has loaded."""
+        if self.validator_worker is not None or not self.first_frame_shown or self.data_manager is None:
+            return
         self.validator_worker = ValidatorWorker(self.data_manager)
         self.validator_worker.validation_finished.connect(self.validator_panel.update_results)
-        self.validator_panel.issue_selected.connect(self.go_to_asset)
-        self.validator_worker.start() # Start validation on app launch
+        self.validator_worker.start()
+
+    def export_performance_trace(self):
+        path, _ = QFileDialog.getSaveFileName(self, "Export Performance Trace", "agency_trace.json", "Chrome Trace (*.json)")
+        if not path:
+            return
+        try:
+            profiler.export_chrome_trace(path)
+            self.statusBar().showMessage(f"Trace written to {path}", 5000)
+        except OSError as e:
+            logger.error(f"Failed to export performance trace: {e}")
+
+    def set_reduced_motion(self, enabled):
+        AnimationManager.instance().set_reduced_motion(enabled)
+        self.settings.setValue("ui/reduced_motion", enabled)
+
+    def set_theme(self, name):
+        theme.apply_theme(QApplication.instance(), name)
+        self.settings.setValue("ui/theme", name)
+        # Colours set once rather than painted from the theme
+        ThumbnailService.instance().clear_placeholders()
+        if self.case_builder is not None:
+            self.case_builder.plot_graph_view.apply_theme()
+
+    def set_opengl_board_rendering(self, enabled):
+        if self.case_builder is None:
+            return
+        if not self.case_builder.plot_graph_view.set_opengl_enabled(enabled):
+            self.opengl_action.setChecked(False)
+            return
+        self.settings.setValue("plot_graph/opengl", enabled)
+
+    def closeEvent(self, event):
+        self.data_loader.wait()
+        if self.case_builder is not None:
+            self.case_builder.store_current_layout()
+        # The last saves reach the disk before the search index stamps the data files
+        self.io.flush()
+        if self.search_service is not None:
+            self.search_service.shutdown()
+        self.io.shutdown()
+        for name, stats in profiler.top_spans(20):
+            logger.info(f"Span {name}: {stats.count} calls, {stats.mean_ms:.2f} ms avg, {stats.max_ms:.2f} ms max")
+        super().closeEvent(event)
+
+    def go_to_asset(self, asset_type, asset_id, case_id=None):
+        # Case data lives on the Case Builder board
+        if self.data_manager is None:
+            return
+        if asset_type in ("cases", "clues", "interviews"):
+            self.main_tabs.setCurrentWidget(self.ensure_case_builder())
+            self.case_builder.show_case_node(asset_type, asset_id, case_id)
+            return
 
-    def go_to_asset(self, asset_type, asset_id):
         # Switch to World Builder tab
-        self.main_tabs.setCurrentWidget(self.world_builder)
+        self.main_tabs.setCurrentWidget(self.ensure_world_builder())
 
         # Set the correct asset view in WorldBuilder
         self.world_builder.set_asset_view(asset_type)
 
         # Select the specific asset in the AssetListView
-        if asset_type in self.world_builder.asset_views:
-            asset_list_view = self.world_builder.asset_views[asset_type]
+        asset_list_view = self.world_builder.asset_views.get(asset_type)
+        if isinstance(asset_list_view, AssetListView):
             asset_list_view.select_asset_by_id(asset_id)
 
 def main():
     """
     Initializes the Qt Application and the main window.
     """
+    launch_time = time.perf_counter()
+    # Lets the OpenGL board viewport survive being moved between windows
+    QApplication.setAttribute(Qt.AA_ShareOpenGLContexts)
     app = QApplication(sys.argv)
 
-    # Load the global stylesheet
-    try:
-        with open("style.qss", "r") as f:
-            app.setStyleSheet(f.read())
-        print("Stylesheet 'style.qss' loaded successfully.")
-    except FileNotFoundError:
-        print("Warning: style.qss not found. Using default styles.")
+    # Compile and apply the saved theme, once for the whole application
+    theme.apply_theme(app, QSettings("TheAgency", "CaseBuilder").value("ui/theme", theme.DEFAULT_THEME))
 
-    main_window = MainWindow()
+    main_window = MainWindow(launch_time)
     main_window.resize(1200, 800)
     main_window.show()
 
@@ -1857,17 +3373,15 @@ def main():
     """
     Initializes the Qt Application and the main window.
     """
+    launch_time = time.perf_counter()
+    # Lets the OpenGL board viewport survive being moved between windows
+    QApplication.setAttribute(Qt.AA_ShareOpenGLContexts)
     app = QApplication(sys.argv)
 
-    # Load the global stylesheet
-    try:
-        with open("style.qss", "r") as f:
-            app.setStyleSheet(f.read())
-        print("Stylesheet 'style.qss' loaded successfully.")
-    except FileNotFoundError:
-        print("Warning: style.qss not found. Using default styles.")
+    # Compile and apply the saved theme, once for the whole application
+    theme.apply_theme(app, QSettings("TheAgency", "CaseBuilder").value("ui/theme", theme.DEFAULT_THEME))
 
-    main_window = MainWindow()
+    main_window = MainWindow(launch_time)
     main_window.resize(1200, 800)
     main_window.show()
 
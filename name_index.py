@@ -0,0 +1,158 @@
+# name_index.py
+# An in-memory prefix and trigram index over entity names, used by the type-ahead pickers.
+
+import bisect
+import heapq
+from typing import Dict, Iterable, List, Set, Tuple
+
+# --- Ranking ---
+# Lower is better. Within a rank, shorter names come first.
+
+EXACT_MATCH = 0
+NAME_PREFIX = 1
+WORD_PREFIX = 2
+SUBSTRING = 3
+FUZZY = 4
+
+PREFIX_SCAN_LIMIT = 256 # Keys inspected per query for very short prefixes such as "a"
+TRIGRAM_SCAN_BUDGET = 400 # Candidates inspected per query by each trigram fallback
+FUZZY_TRIGRAMS = 6 # Rarest query trigrams compared when scoring misspellings
+
+def normalize(text: str) -> str:
+    """Case-folds and collapses whitespace, so "  Jane   DOE" matches "jane doe"."""
+    return " ".join(text.casefold().split())
+
+def trigrams(text: str) -> Set[str]:
+    return {text[i:i + 3] for i in range(len(text) - 2)}
+
+# --- Index ---
+
+class NameIndex:
+    """
+    Maps entity ids to their names (e.g. full name and alias) for ranked type-ahead search.
+    Every name is stored under its full text and under each later word in one sorted key
+    list, so a prefix query is a binary search; substring and misspelt queries fall back to
+    a trigram index. Entities can be updated one at a time as they are saved.
+    """
+    def __init__(self):
+        self._names: Dict[str, Tuple[str, ...]] = {} # Entity id -> normalized names
+        self._keys: List[Tuple[str, int, str]] = [] # Sorted (key, rank, entity id)
+        self._trigrams: Dict[str, Set[str]] = {} # Trigram -> entity ids
+
+    def __len__(self):
+        return len(self._names)
+
+    def __contains__(self, entity_id):
+        return entity_id in self._names
+
+    def rebuild(self, entries: Iterable[Tuple[str, Iterable[str]]]):
+        """Indexes many (entity id, names) pairs at once, sorting the keys a single time."""
+        self._names.clear()
+        self._trigrams.clear()
+        keys = []
+        for entity_id, names in entries:
+            normalized = self._normalize_names(names)
+            if not normalized:
+                continue
+            self._names[entity_id] = normalized
+            keys.extend(self._keys_of(entity_id, normalized))
+            for gram in set().union(*(trigrams(name) for name in normalized)):
+                self._trigrams.setdefault(gram, set()).add(entity_id)
+        keys.sort()
+        self._keys = keys
+
+    def update(self, entity_id: str, names: Iterable[str]):
+        """Adds an entity, or replaces the names of one already indexed."""
+        normalized = self._normalize_names(names)
+        if self._names.get(entity_id) == normalized:
+            return
+        self.remove(entity_id)
+        if not normalized:
+            return
+        self._names[entity_id] = normalized
+        for key in self._keys_of(entity_id, normalized):
+            bisect.insort(self._keys, key)
+        for gram in set().union(*(trigrams(name) for name in normalized)):
+            self._trigrams.setdefault(gram, set()).add(entity_id)
+
+    def remove(self, entity_id: str):
+        normalized = self._names.pop(entity_id, None)
+        if normalized is None:
+            return
+        for key in self._keys_of(entity_id, normalized):
+            i = bisect.bisect_left(self._keys, key)
+            if i < len(self._keys) and self._keys[i] == key:
+                del self._keys[i]
+        for gram in set().union(*(trigrams(name) for name in normalized)):
+            ids = self._trigrams.get(gram)
+            if ids is not None:
+                ids.discard(entity_id)
+                if not ids:
+                    del self._trigrams[gram]
+
+    def search(self, query: str, limit: int = 20) -> List[str]:
+        """Returns up to limit entity ids, best match first."""
+        query = normalize(query)
+        if not query or limit <= 0:
+            return []
+        ranks: Dict[str, float] = {}
+
+        # Prefix matches, straight from the sorted key list
+        i = bisect.bisect_left(self._keys, (query,))
+        end = min(len(self._keys), i + PREFIX_SCAN_LIMIT)
+        while i < end:
+            key, rank, entity_id = self._keys[i]
+            if not key.startswith(query):
+                break
+            if rank == NAME_PREFIX and key == query:
+                rank = EXACT_MATCH
+            if rank < ranks.get(entity_id, FUZZY + 1):
+                ranks[entity_id] = rank
+            i += 1
+
+        # Substring and fuzzy matches from the trigram index, rarest trigram first
+        query_grams = trigrams(query)
+        if query_grams and len(ranks) < limit:
+            postings = sorted((self._trigrams.get(gram, set()) for gram in query_grams), key=len)
+            found = 0
+            for checked, entity_id in enumerate(postings[0]):
+                if checked >= TRIGRAM_SCAN_BUDGET:
+                    break
+                if entity_id not in ranks and all(entity_id in ids for ids in postings[1:]) \
+                        and any(query in name for name in self._names[entity_id]):
+                    ranks[entity_id] = SUBSTRING
+                    found += 1
+                    if found >= limit:
+                        break
+            if len(ranks) < limit:
+                # Misspellings: score entities from the two rarest postings by how many of
+                # the rarest trigrams they share
+                scored = postings[:FUZZY_TRIGRAMS]
+                needed = max(1, len(scored) // 2)
+                checked = 0
+                for ids in postings[:2]:
+                    for entity_id in ids:
+                        if checked >= TRIGRAM_SCAN_BUDGET:
+                            break
+                        checked += 1
+                        if entity_id in ranks:
+                            continue
+                        count = sum(1 for other in scored if entity_id in other)
+                        if count >= needed:
+                            ranks[entity_id] = FUZZY + 1 - count / len(scored)
+
+        return heapq.nsmallest(limit, ranks, key=lambda entity_id: (ranks[entity_id], len(self._names[entity_id][0]), self._names[entity_id][0]))
+
+    @staticmethod
+    def _normalize_names(names: Iterable[str]) -> Tuple[str, ...]:
+        return tuple(dict.fromkeys(normalize(name) for name in names if name and name.strip()))
+
+    @staticmethod
+    def _keys_of(entity_id: str, names: Tuple[str, ...]) -> List[Tuple[str, int, str]]:
+        keys = set()
+        for name in names:
+            keys.add((name, NAME_PREFIX, entity_id))
+            words = name.split(" ")
+            for w in range(1, len(words)):
+                keys.add((" ".join(words[w:]), WORD_PREFIX, entity_id))
+        return sorted(keys)
@@ -2,7 +2,8 @@
 # This file is the single source of truth for all data structures,
 # meticulously updated to match the 'Case builder fields.pdf' document.
 
-from dataclasses import dataclass, field
+from dataclasses import field
+from compact import entity
 from typing import Literal, Optional, List, Dict
 
 # --- Type Definitions for Constrained Values ---
@@ -24,7 +25,7 @@ KnowledgeLevel = Literal["Sleuth Only", "Reader Only", "Both", "Neither (Off-Pag
 
 # --- World Builder Schemas ---
 
-@dataclass
+@entity
 class District:
     """Defines a district in the game world."""
     district_id: str = field(default_factory=str) # Auto-generated unique identifier
@@ -37,7 +38,7 @@ class District:
     notable_features: List[str] = field(default_factory=list)
     dominant_faction: Optional[str] = None # faction_id
 
-@dataclass
+@entity
 class Faction:
     """Defines a faction in the game world."""
     faction_id: str = field(default_factory=str) # Auto-generated unique identifier
@@ -54,7 +55,7 @@ class Faction:
     influence: Optional[FactionInfluence] = None
     public_perception: str = ""
 
-@dataclass
+@entity
 class Item:
     """Defines a tangible item in the game world."""
     item_id: str = field(default_factory=str) # Auto-generated unique identifier
@@ -74,7 +75,7 @@ class Item:
     condition: Optional[ItemCondition] = None
     unique_properties: List[str] = field(default_factory=list)
 
-@dataclass
+@entity
 class Character:
     """Defines a character in the game world."""
     character_id: str = field(default_factory=str) # Auto-generated unique identifier
@@ -109,7 +110,7 @@ class Character:
     killer_likelihood: float = 0.5 # 0.0 to 1.0
     portrayal_notes: str = ""
 
-@dataclass
+@entity
 class Sleuth(Character):
     """Extends Character schema for the main sleuth."""
     city: str = ""
@@ -117,7 +118,7 @@ class Sleuth(Character):
     nemesis: List[str] = field(default_factory=list) # List of character_id
     primary_arc: str = ""
 
-@dataclass
+@entity
 class Location:
     """Defines a location in the game world."""
     location_id: str = field(default_factory=str) # Auto-generated unique identifier
@@ -139,7 +140,7 @@ class Location:
 
 # --- Case Builder Schemas ---
 
-@dataclass
+@entity
 class Clue:
     """Defines a clue within a case."""
     clue_id: str = field(default_factory=str) # Auto-generated unique identifier
@@ -161,7 +162,7 @@ class Clue:
     associated_location: Optional[str] = None # location_id
     associated_character: Optional[str] = None # character_id
 
-@dataclass
+@entity
 class InterviewAnswer:
     """Defines a single answer in an interview."""
     answer_id: str = field(default_factory=str) # Auto-generated unique identifier
@@ -172,32 +173,32 @@ class InterviewAnswer:
     clue_id: Optional[str] = None # clue_id (mandatory if is_clue)
     has_item: Optional[str] = None # item_id
 
-@dataclass
+@entity
 class InterviewQuestion:
     """Defines a single question and its answer in an interview."""
     question_id: str = field(default_factory=str) # Auto-generated unique identifier
     question: str = ""
     answer: InterviewAnswer = field(default_factory=InterviewAnswer)
 
-@dataclass
+@entity
 class CaseSuspect:
     """Defines a key suspect in the case."""
     character_id: str
     interviews: List[InterviewQuestion] = field(default_factory=list) # Up to 6
 
-@dataclass
+@entity
 class CaseWitness(CaseSuspect):
     """Defines a witness at a location, who can also be interviewed."""
     pass # Inherits from CaseSuspect, structure is identical for interviews
 
-@dataclass
+@entity
 class CaseLocation:
     """Defines a relevant location in the case."""
     location_id: str
     location_clues: List[str] = field(default_factory=list) # List of clue_id
     witnesses: List[CaseWitness] = field(default_factory=list)
 
-@dataclass
+@entity
 class CaseMeta:
     """Defines the core metadata and solution for the case."""
     victim: Optional[str] = None # character_id
@@ -217,17 +218,46 @@ class CaseMeta:
     successful_denouement: str = ""
     failed_denouement: str = ""
 
+# --- Plot Graph Board Schemas ---
+
+@entity
+class BoardNodePosition:
+    """The scene position of a single card on the case board."""
+    x: float = 0.0
+    y: float = 0.0
+
+@entity
+class BoardEdge:
+    """A connection drawn between two cards on the case board."""
+    start_node: str = "" # Board node key, e.g. "clue:<clue_id>"
+    end_node: str = "" # Board node key
+
+@entity
+class BoardViewport:
+    """The zoom level and visible centre of the case board."""
+    center_x: float = 0.0
+    center_y: float = 0.0
+    zoom: float = 1.0
+
+@entity
+class BoardLayout:
+    """The saved arrangement of a case's plot graph."""
+    node_positions: Dict[str, BoardNodePosition] = field(default_factory=dict) # Board node key -> position
+    edges: List[BoardEdge] = field(default_factory=list)
+    viewport: BoardViewport = field(default_factory=BoardViewport)
+
 # --- Top-Level Container ---
 
-@dataclass
+@entity
 class CaseFile:
     """A schema for a single, self-contained case file, combining world and case data."""
     case_meta: CaseMeta = field(default_factory=CaseMeta)
     key_suspects: List[CaseSuspect] = field(default_factory=list) # Up to 10
     locations: List[CaseLocation] = field(default_factory=list) # Up to 10
     clues: List[Clue] = field(default_factory=list)
+    board_layout: BoardLayout = field(default_factory=BoardLayout)
 
-@dataclass
+@entity
 class WorldData:
     """A container for all the foundational world-building elements."""
     districts: Dict[str, District] = field(default_factory=dict)
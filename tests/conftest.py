@@ -0,0 +1,7 @@
+# tests/conftest.py
+# Lets the tests import the top-level modules however pytest is started.
+
+import os
+import sys
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
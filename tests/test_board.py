@@ -0,0 +1,63 @@
+# tests/test_board.py
+
+import os
+import time
+
+import pytest
+
+pytest.importorskip("PySide6")
+os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+
+from PySide6.QtCore import QPointF
+from PySide6.QtWidgets import QApplication, QLabel
+
+import schemas
+from case_graph import node_key
+from core import DataManager
+
+@pytest.fixture(scope="module")
+def app():
+    return QApplication.instance() or QApplication([])
+
+@pytest.fixture
+def data_manager(tmp_path):
+    with DataManager(str(tmp_path / "data")) as data_manager:
+        yield data_manager
+
+def test_populating_a_thousand_clue_board_stays_fast(app, data_manager):
+    from main import CaseBuilder, PlotGraphScene
+
+    case_file = schemas.CaseFile()
+    case_file.clues = [schemas.Clue(clue_id=f"clue_{i}", dependencies=[f"clue_{i - 1}"] if i else [])
+                       for i in range(1000)]
+    builder = CaseBuilder(data_manager)
+    scene = PlotGraphScene("case")
+
+    start = time.perf_counter()
+    scene.begin_bulk_insert()
+    builder.populate_board(scene, case_file)
+    scene.end_bulk_insert()
+    elapsed = time.perf_counter() - start
+
+    # The user-028 target: a 1,000-node case opens well under a second
+    assert elapsed < 1.0
+    # Clues without a saved position fill a 32-column grid in case order
+    assert scene.nodes[node_key("clue", "clue_0")].pos() == QPointF(0, 300)
+    assert scene.nodes[node_key("clue", "clue_33")].pos() == QPointF(300, 450)
+    assert len(scene.layers["Dependency"].edges) == 999
+
+def test_removing_a_nodes_last_edge_detaches_the_layer(app):
+    from main import ConnectionLayer, PlotGraphScene
+
+    scene = PlotGraphScene("case")
+    a, b, c = (scene.add_node(QLabel(key), key=key) for key in ("a", "b", "c"))
+    layer = ConnectionLayer("Dependency")
+    layer.add_edge(a, b)
+    layer.add_edge(a, c)
+
+    layer.remove_edge("a", "b")
+    assert layer not in b.layers
+    assert layer in a.layers and layer in c.layers
+
+    layer.remove_edge("a", "c")
+    assert layer not in a.layers and layer not in c.layers
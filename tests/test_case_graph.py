@@ -0,0 +1,71 @@
+# tests/test_case_graph.py
+
+import schemas
+from case_graph import CaseEdge, CaseEdgeIndex, node_key
+
+def make_case():
+    case_file = schemas.CaseFile()
+    case_file.clues = [
+        schemas.Clue(clue_id="c1", reveals_unlocks=["c2", "c9"]),
+        schemas.Clue(clue_id="c2", dependencies=["c1"], associated_location="loc1"),
+        schemas.Clue(clue_id="c3", debunking_clue="c2"),
+    ]
+    return case_file
+
+def rebuilt_edges(case_file):
+    return set(CaseEdgeIndex(case_file, schemas.WorldData()).edges())
+
+def test_editing_one_clue_changes_only_its_edges():
+    case_file = make_case()
+    index = CaseEdgeIndex(case_file, schemas.WorldData())
+    before = set(index.edges())
+
+    case_file.clues[1].associated_location = "loc2"
+    added, removed = index.sync(case_file)
+
+    clue = node_key("clue", "c2")
+    assert added == {CaseEdge("Association", clue, node_key("location", "loc2"))}
+    assert removed == {CaseEdge("Association", clue, node_key("location", "loc1"))}
+    assert set(index.edges()) == (before - removed) | added == rebuilt_edges(case_file)
+
+def test_unchanged_save_changes_nothing():
+    case_file = make_case()
+    index = CaseEdgeIndex(case_file, schemas.WorldData())
+    assert index.sync(case_file) == (set(), set())
+
+def test_edited_clue_drops_its_old_unresolved_ids():
+    case_file = make_case()
+    index = CaseEdgeIndex(case_file, schemas.WorldData())
+
+    # c1 no longer reveals c9, so a clue added later as c9 must not gain an edge from it
+    case_file.clues[0].reveals_unlocks = ["c2"]
+    index.sync(case_file)
+    case_file.clues.append(schemas.Clue(clue_id="c9"))
+    added, removed = index.sync(case_file)
+
+    assert added == set() and removed == set()
+    assert set(index.edges()) == rebuilt_edges(case_file)
+
+def test_unresolved_id_resolves_when_its_clue_is_added():
+    case_file = make_case()
+    index = CaseEdgeIndex(case_file, schemas.WorldData())
+    case_file.clues.append(schemas.Clue(clue_id="c9"))
+    added, removed = index.sync(case_file)
+
+    assert added == {CaseEdge("Unlocks", node_key("clue", "c1"), node_key("clue", "c9"))}
+    assert removed == set()
+
+def test_removed_clue_takes_its_edges_and_the_unlocks_to_it():
+    case_file = make_case()
+    index = CaseEdgeIndex(case_file, schemas.WorldData())
+    case_file.clues.pop(1) # c2
+    added, removed = index.sync(case_file)
+
+    assert added == set()
+    assert CaseEdge("Unlocks", node_key("clue", "c1"), node_key("clue", "c2")) in removed
+    assert set(index.edges()) == rebuilt_edges(case_file)
+
+    # Adding it back resolves c1's reveal again
+    case_file.clues.append(schemas.Clue(clue_id="c2"))
+    added, _ = index.sync(case_file)
+    assert CaseEdge("Unlocks", node_key("clue", "c1"), node_key("clue", "c2")) in added
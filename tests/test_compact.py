@@ -0,0 +1,51 @@
+# tests/test_compact.py
+
+import copy
+import json
+import pickle
+
+import compact
+import schemas
+from core.codec import DataclassJSONEncoder, from_dict_to_dataclass
+
+def loaded_character():
+    """A character as the decoder builds it, with its empty lists shared when compaction is enabled."""
+    return from_dict_to_dataclass(schemas.Character, {"character_id": "c1", "full_name": "Ann", "allies": [], "enemies": []})
+
+def test_reads_of_an_empty_field_alias_one_list():
+    character = loaded_character()
+    first = character.allies
+    second = character.allies
+    first.append("x")
+    second.append("y")
+    assert character.allies == ["x", "y"]
+    assert first is second is character.allies
+
+def test_assigned_list_is_kept_as_is():
+    character = loaded_character()
+    enemies = []
+    character.enemies = enemies
+    enemies.append("z")
+    assert character.enemies == ["z"]
+    assert character.enemies is enemies
+
+def test_loaded_empty_lists_stay_shared_until_read():
+    character = loaded_character()
+    if compact.ENABLED:
+        assert compact.peek(character, "allies") is compact.EMPTY
+    json.dumps(character, cls=DataclassJSONEncoder) # Encoding reads every field
+    if compact.ENABLED:
+        assert compact.peek(character, "allies") is compact.EMPTY
+    assert character.allies == []
+    assert compact.peek(character, "allies") == []
+
+def test_round_trip_and_copies():
+    character = loaded_character()
+    character.items.append("i1")
+    data = json.loads(json.dumps(character, cls=DataclassJSONEncoder))
+    assert data["items"] == ["i1"] and data["allies"] == []
+    assert from_dict_to_dataclass(schemas.Character, data) == character
+    for clone in (copy.deepcopy(character), pickle.loads(pickle.dumps(character))):
+        assert clone == character
+        clone.allies.append("x")
+        assert character.allies == []
@@ -0,0 +1,77 @@
+# tests/test_history.py
+
+import schemas
+from core.history import History
+
+class RecordingDataManager:
+    """Stands in for DataManager: holds the world and records what History saves."""
+    def __init__(self):
+        self.world_data = schemas.WorldData()
+        self.saves = []
+
+    def save_world_data(self, changed=None):
+        self.saves.append(("world", changed))
+
+    def save_case(self, case_obj):
+        self.saves.append(("case", case_obj))
+
+def make_history(budget_bytes=2**20):
+    data_manager = RecordingDataManager()
+    return data_manager, History(data_manager, budget_bytes)
+
+def test_undo_and_redo_restore_only_the_changed_fields():
+    data_manager, history = make_history()
+    character = schemas.Character(character_id="c1", full_name="Ann", alias="Red")
+    key = ("world", ("characters", "c1"))
+
+    command = history.set_fields(character, {"full_name": "Anna", "alias": "Red"}, key)
+    assert command.changes == (("full_name", "Ann", "Anna"),)
+
+    history.undo()
+    assert (character.full_name, character.alias) == ("Ann", "Red")
+    history.redo()
+    assert character.full_name == "Anna"
+    assert data_manager.saves == [("world", [("characters", "c1")])] * 2
+
+def test_an_edit_that_changes_nothing_is_not_recorded():
+    _, history = make_history()
+    character = schemas.Character(character_id="c1", full_name="Ann")
+    assert history.set_fields(character, {"full_name": "Ann"}, ("world", ("characters", "c1"))) is None
+    assert not history.can_undo()
+
+def test_a_new_edit_drops_the_redo_stack():
+    _, history = make_history()
+    character = schemas.Character(character_id="c1", full_name="Ann")
+    key = ("world", ("characters", "c1"))
+    history.set_fields(character, {"full_name": "Anna"}, key)
+    history.undo()
+
+    command = history.set_fields(character, {"alias": "Red"}, key)
+    assert not history.can_redo()
+    assert history.bytes_used == command.size
+
+def test_the_oldest_edits_are_forgotten_beyond_the_budget():
+    _, history = make_history(budget_bytes=1)
+    character = schemas.Character(character_id="c1")
+    key = ("world", ("characters", "c1"))
+    for name in ("A", "B", "C"):
+        history.set_fields(character, {"full_name": name}, key, f"Name {name}")
+
+    # The newest edit is kept even when it alone is over the budget
+    assert [command.label for command in history.undo_stack] == ["Name C"]
+    assert history.bytes_used == history.undo_stack[0].size
+    history.undo()
+    assert character.full_name == "B"
+    assert history.undo() is None
+
+def test_undoing_an_insert_removes_the_asset_and_redo_adds_it_back():
+    data_manager, history = make_history()
+    faction = schemas.Faction(faction_id="f1", name="Syndicate")
+    history.insert_asset("factions", "f1", faction)
+    assert data_manager.world_data.factions["f1"] is faction
+
+    history.undo()
+    assert "f1" not in data_manager.world_data.factions
+    history.redo()
+    assert data_manager.world_data.factions["f1"] is faction
+    assert data_manager.saves == [("world", [("factions", "f1")])] * 2
@@ -0,0 +1,63 @@
+# tests/test_io.py
+
+import os
+import threading
+
+import pytest
+
+from core.io import IOExecutor, write_text
+
+@pytest.fixture
+def io():
+    io = IOExecutor(max_workers=4)
+    yield io
+    io.shutdown()
+
+def test_jobs_on_one_file_run_in_submission_order(io, tmp_path):
+    path = str(tmp_path / "a.json")
+    gate = threading.Event()
+    order = []
+    io.submit(path, gate.wait)
+    for i in range(20):
+        io.submit(path, order.append, i)
+    gate.set()
+    assert io.flush(timeout=5)
+    assert order == list(range(20))
+
+def test_jobs_on_different_files_run_in_parallel(io, tmp_path):
+    # Each job waits for the other, so this only finishes if both run at once
+    barrier = threading.Barrier(2, timeout=5)
+    futures = [io.submit(str(tmp_path / name), barrier.wait) for name in ("a.json", "b.json")]
+    assert {future.result(timeout=5) for future in futures} == {0, 1}
+
+def test_flush_waits_for_the_pending_jobs(io, tmp_path):
+    gate = threading.Event()
+    future = io.submit(str(tmp_path / "a.json"), gate.wait)
+    assert not io.flush(timeout=0.05)
+    gate.set()
+    assert io.flush(timeout=5)
+    assert future.done() and not io.pending()
+
+def test_a_failed_job_reports_its_error_and_the_next_job_still_runs(io, tmp_path):
+    path = str(tmp_path / "a.json")
+    failed = io.submit(path, write_text, str(tmp_path), "not a file") # The path is a directory
+    written = io.write(path, "text")
+    assert written.result(timeout=5) is None
+    assert isinstance(failed.exception(timeout=5), OSError)
+    assert io.read(path).result(timeout=5) == "text"
+    assert os.listdir(tmp_path) == ["a.json"] # No temporary file left behind
+
+def test_submit_after_queues_the_job_once_its_dependencies_finish(tmp_path):
+    io = IOExecutor(max_workers=1)
+    gate = threading.Event()
+    order = []
+    first = io.submit(str(tmp_path / "a.json"), lambda: (gate.wait(), order.append("a")))
+    after = io.submit_after([first], str(tmp_path / "b.json"), order.append, "b")
+    # Jobs that don't wait on it are not held up, even with the only worker busy
+    io.submit(str(tmp_path / "c.json"), order.append, "c")
+    assert not after.done()
+    gate.set()
+    assert io.flush(timeout=5)
+    assert order == ["a", "c", "b"]
+    assert io.submit_after([], str(tmp_path / "d.json"), lambda: "d").result(timeout=5) == "d"
+    io.shutdown()
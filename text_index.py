@@ -0,0 +1,279 @@
+# text_index.py
+# A persistent inverted index over the prose fields of the world and case data, for global search.
+
+import json
+import math
+import os
+import re
+from dataclasses import dataclass, fields, is_dataclass
+from typing import Dict, Iterator, List, Optional
+import compact
+import schemas
+
+TOKEN_PATTERN = re.compile(r"[0-9a-z]+")
+
+# Fields that hold ids, references or file paths rather than prose
+NON_TEXT_FIELDS = frozenset({
+    "district_id", "faction_id", "item_id", "character_id", "location_id", "clue_id", "answer_id", "question_id",
+    "key_locations", "dominant_faction", "headquarters", "ally_factions", "enemy_factions", "members",
+    "default_location", "default_owner", "faction", "district", "allies", "enemies", "items", "relationships",
+    "nemesis", "owning_faction", "key_characters", "associated_items", "clues", "character_implicated",
+    "debunking_clue", "dependencies", "reveals_unlocks", "associated_item", "associated_location",
+    "associated_character", "has_item", "location_clues", "victim", "culprit", "crime_scene", "murder_weapon",
+    "means_clue", "motive_clue", "opportunity_clue", "red_herring_clues", "image", "board_layout",
+})
+
+WORLD_ASSET_TYPES = ("characters", "locations", "factions", "items", "districts")
+
+# BM25 parameters
+K1 = 1.2
+B = 0.75
+PHRASE_BOOST = 2.0 # Multiplier for documents containing the query verbatim
+
+def tokenize(text: str) -> List[str]:
+    return TOKEN_PATTERN.findall(text.casefold())
+
+def text_fields(obj) -> List[str]:
+    """Collects the prose of a schema object, descending into nested dataclasses."""
+    texts = []
+    for f in fields(obj):
+        if f.name in NON_TEXT_FIELDS:
+            continue
+        value = compact.peek(obj, f.name) # Indexing every entity must not give each empty list field its own list
+        if isinstance(value, str):
+            if value:
+                texts.append(value)
+        elif isinstance(value, list):
+            texts.extend(v for v in value if isinstance(v, str) and v)
+            for v in value:
+                if is_dataclass(v):
+                    texts.extend(text_fields(v))
+        elif is_dataclass(value):
+            texts.extend(text_fields(value))
+    return texts
+
+# --- Documents ---
+
+@dataclass
+class SearchDocument:
+    """One searchable record, and where to navigate to when it is opened."""
+    doc_id: str
+    kind: str # Asset type for go-to navigation: "characters", ..., "sleuth", "cases", "clues" or "interviews"
+    target_id: str
+    case_id: Optional[str]
+    title: str
+    text: str
+
+@dataclass
+class SearchResult:
+    document: SearchDocument
+    score: float
+    snippet: str
+
+def world_asset_document(asset_type: str, asset_id: str, asset) -> SearchDocument:
+    title = getattr(asset, "name", None) or getattr(asset, "full_name", None) or getattr(asset, "district_name", None) or asset_id
+    return SearchDocument(f"{asset_type}:{asset_id}", asset_type, asset_id, None, title, "\n".join(text_fields(asset)))
+
+def world_documents(world_data: schemas.WorldData) -> Iterator[SearchDocument]:
+    for asset_type in WORLD_ASSET_TYPES:
+        for asset_id, asset in list(getattr(world_data, asset_type).items()):
+            yield world_asset_document(asset_type, asset_id, asset)
+    yield world_asset_document("sleuth", "sleuth", world_data.sleuth)
+
+def case_documents(case_id: str, case_file: schemas.CaseFile) -> Iterator[SearchDocument]:
+    prefix = f"case:{case_id}"
+    yield SearchDocument(prefix, "cases", case_id, case_id, f"Case: {case_id}", "\n".join(text_fields(case_file.case_meta)))
+    for clue in list(case_file.clues):
+        yield SearchDocument(f"{prefix}:clue:{clue.clue_id}", "clues", clue.clue_id, case_id,
+                             f"Clue: {clue.clue_summary or clue.clue_id}", "\n".join(text_fields(clue)))
+    interviewees = list(case_file.key_suspects)
+    for location in case_file.locations:
+        interviewees.extend(location.witnesses)
+    for interviewee in interviewees:
+        for i, interview in enumerate(interviewee.interviews):
+            question_id = interview.question_id or str(i)
+            yield SearchDocument(f"{prefix}:interview:{interviewee.character_id}:{question_id}", "interviews",
+                                 interviewee.character_id, case_id, f"Interview: {interview.question or question_id}",
+                                 "\n".join(text_fields(interview)))
+
+def source_stamp(paths: List[str]) -> Dict[str, List[int]]:
+    """Size and modification time of each data file, to tell whether a saved index is stale."""
+    stamp = {}
+    for path in paths:
+        try:
+            stat = os.stat(path)
+            stamp[os.path.basename(path)] = [stat.st_size, stat.st_mtime_ns]
+        except OSError:
+            pass
+    return stamp
+
+# --- Index ---
+
+class FullTextIndex:
+    """
+    An inverted index from tokens to the documents containing them, ranked with BM25.
+    Documents of a world asset or a whole case can be replaced individually as they are
+    saved, and the index can be written to disk so it isn't rebuilt on every start.
+    """
+    VERSION = 1
+
+    def __init__(self):
+        self.documents: Dict[str, SearchDocument] = {}
+        self.postings: Dict[str, Dict[str, int]] = {} # Token -> {doc id: term frequency}
+        self.lengths: Dict[str, int] = {} # Doc id -> token count
+        self._total_length = 0
+        self._case_docs: Dict[str, set] = {} # Case id -> its doc ids
+
+    @classmethod
+    def build(cls, world_data: schemas.WorldData, case_files: Dict[str, schemas.CaseFile]) -> "FullTextIndex":
+        index = cls()
+        for document in world_documents(world_data):
+            index.add(document)
+        for case_id, case_file in list(case_files.items()):
+            for document in case_documents(case_id, case_file):
+                index.add(document)
+        return index
+
+    def __len__(self):
+        return len(self.documents)
+
+    def add(self, document: SearchDocument):
+        self.remove(document.doc_id)
+        tokens = tokenize(document.text) + tokenize(document.title)
+        self.documents[document.doc_id] = document
+        self.lengths[document.doc_id] = len(tokens)
+        self._total_length += len(tokens)
+        for token in tokens:
+            doc_frequencies = self.postings.setdefault(token, {})
+            doc_frequencies[document.doc_id] = doc_frequencies.get(document.doc_id, 0) + 1
+        if document.case_id is not None:
+            self._case_docs.setdefault(document.case_id, set()).add(document.doc_id)
+
+    def remove(self, doc_id: str):
+        document = self.documents.pop(doc_id, None)
+        if document is None:
+            return
+        self._total_length -= self.lengths.pop(doc_id, 0)
+        for token in set(tokenize(document.text) + tokenize(document.title)):
+            doc_frequencies = self.postings.get(token)
+            if doc_frequencies is not None:
+                doc_frequencies.pop(doc_id, None)
+                if not doc_frequencies:
+                    del self.postings[token]
+        if document.case_id is not None:
+            self._case_docs.get(document.case_id, set()).discard(doc_id)
+
+    def update_world_asset(self, world_data: schemas.WorldData, asset_type: str, asset_id: str):
+        """Re-indexes one world asset after it was saved, or drops it if it was deleted."""
+        if asset_type == "sleuth":
+            self.add(world_asset_document("sleuth", "sleuth", world_data.sleuth))
+            return
+        asset = getattr(world_data, asset_type).get(asset_id)
+        if asset is None:
+            self.remove(f"{asset_type}:{asset_id}")
+        else:
+            self.add(world_asset_document(asset_type, asset_id, asset))
+
+    def update_world(self, world_data: schemas.WorldData):
+        """Re-indexes every world asset, keeping the case documents."""
+        for doc_id in [doc_id for doc_id, document in self.documents.items() if document.case_id is None]:
+            self.remove(doc_id)
+        for document in world_documents(world_data):
+            self.add(document)
+
+    def update_case(self, case_id: str, case_file: Optional[schemas.CaseFile]):
+        """Replaces every document of a case after it was saved, or drops them if it was deleted."""
+        for doc_id in list(self._case_docs.pop(case_id, ())):
+            self.remove(doc_id)
+        if case_file is not None:
+            for document in case_documents(case_id, case_file):
+                self.add(document)
+
+    def search(self, query: str, limit: int = 50) -> List[SearchResult]:
+        """Ranks the documents matching any query token; ones containing the whole phrase first."""
+        query_tokens = list(dict.fromkeys(tokenize(query)))
+        if not query_tokens or not self.documents:
+            return []
+        average_length = self._total_length / len(self.documents) or 1
+        scores: Dict[str, float] = {}
+        for token in query_tokens:
+            doc_frequencies = self.postings.get(token)
+            if not doc_frequencies:
+                continue
+            idf = math.log(1 + (len(self.documents) - len(doc_frequencies) + 0.5) / (len(doc_frequencies) + 0.5))
+            for doc_id, tf in doc_frequencies.items():
+                norm = K1 * (1 - B + B * self.lengths[doc_id] / average_length)
+                scores[doc_id] = scores.get(doc_id, 0.0) + idf * tf * (K1 + 1) / (tf + norm)
+
+        phrase = f" {' '.join(query_tokens)} " # Padded, so "cat" matches the word and not "concatenate"
+        ranked = sorted(scores.items(), key=lambda item: item[1], reverse=True)[:limit * 4]
+        results = []
+        for doc_id, score in ranked:
+            document = self.documents[doc_id]
+            if len(query_tokens) > 1 and phrase in f" {' '.join(tokenize(document.text))} ":
+                score *= PHRASE_BOOST
+            results.append(SearchResult(document, score, self.snippet(document, query_tokens)))
+        results.sort(key=lambda result: result.score, reverse=True)
+        return results[:limit]
+
+    @staticmethod
+    def snippet(document: SearchDocument, query_tokens: List[str], width: int = 80) -> str:
+        """The part of the document text around the first query token."""
+        text = " ".join(document.text.split())
+        lowered = text.casefold()
+        positions = [p for p in (lowered.find(token) for token in query_tokens) if p >= 0]
+        if not positions:
+            return text[:width]
+        start = max(0, min(positions) - width // 4)
+        return ("..." if start else "") + text[start:start + width] + ("..." if start + width < len(text) else "")
+
+    # --- Persistence ---
+
+    def snapshot(self) -> List[SearchDocument]:
+        """
+        The current documents, for saving from another thread with save_snapshot().
+        Documents are replaced on update, never changed, so copying the list is enough.
+        """
+        return list(self.documents.values())
+
+    @classmethod
+    def save_snapshot(cls, path: str, documents: List[SearchDocument], stamp: Dict[str, List[int]]):
+        """Writes the index of a snapshot(), building its postings again from the documents."""
+        index = cls()
+        for document in documents:
+            index.add(document)
+        index.save(path, stamp)
+
+    def save(self, path: str, stamp: Dict[str, List[int]]):
+        """Writes the index; only call it from the thread that updates the index."""
+        data = {
+            "version": self.VERSION,
+            "stamp": stamp,
+            "documents": [[d.doc_id, d.kind, d.target_id, d.case_id, d.title, d.text] for d in self.documents.values()],
+            "postings": self.postings,
+            "lengths": self.lengths,
+        }
+        temp_path = f"{path}.tmp"
+        with open(temp_path, "w", encoding="utf-8") as f:
+            json.dump(data, f, separators=(",", ":"))
+        os.replace(temp_path, path)
+
+    @classmethod
+    def load(cls, path: str, stamp: Dict[str, List[int]]) -> Optional["FullTextIndex"]:
+        """Reads a saved index, or returns None if it is missing, unreadable or older than the data."""
+        try:
+            with open(path, "r", encoding="utf-8") as f:
+                data = json.load(f)
+        except (OSError, ValueError):
+            return None
+        if data.get("version") != cls.VERSION or data.get("stamp") != stamp:
+            return None
+        index = cls()
+        for doc_id, kind, target_id, case_id, title, text in data["documents"]:
+            index.documents[doc_id] = SearchDocument(doc_id, kind, target_id, case_id, title, text)
+            if case_id is not None:
+                index._case_docs.setdefault(case_id, set()).add(doc_id)
+        index.postings = data["postings"]
+        index.lengths = data["lengths"]
+        index._total_length = sum(index.lengths.values())
+        return index
@@ -0,0 +1,105 @@
+# theme.py
+# The UI themes. Each theme is a set of colour tokens, compiled once into a QPalette
+# and into the stylesheet template style.qss; custom-painted widgets read the same
+# tokens through color().
+
+import logging
+import os
+from functools import lru_cache
+from string import Template
+
+from PySide6.QtGui import QColor, QPalette
+
+from core.instrumentation import profiler
+
+logger = logging.getLogger(__name__)
+
+STYLESHEET_TEMPLATE = os.path.join(os.path.dirname(os.path.abspath(__file__)), "style.qss")
+DEFAULT_THEME = "noir"
+
+THEMES = {
+    "noir": {
+        "background": "#10141a", # Base charcoal
+        "surface": "#1a1f25", # Inputs, cards, lists
+        "raised": "#2a2f38", # Buttons, placeholders
+        "border": "#4a4f58",
+        "text": "#f0f0f0",
+        "muted": "#8a8f98",
+        "accent": "#00e5ff", # Electric cyan
+        "accent_pressed": "#00b8d4",
+        "gold": "#D4AF37",
+        "error": "#FF6B6B",
+        "hud_background": "rgba(10, 12, 16, 210)",
+    },
+    "daylight": {
+        "background": "#f4f1ea",
+        "surface": "#ffffff",
+        "raised": "#e6e1d6",
+        "border": "#b9b2a3",
+        "text": "#1d1f24",
+        "muted": "#6b6f78",
+        "accent": "#00838f",
+        "accent_pressed": "#006064",
+        "gold": "#9c7a1c",
+        "error": "#c62828",
+        "hud_background": "rgba(250, 248, 242, 220)",
+    },
+}
+
+_current = DEFAULT_THEME
+
+@lru_cache(maxsize=1)
+def _template():
+    try:
+        with open(STYLESHEET_TEMPLATE, "r", encoding="utf-8") as f:
+            return Template(f.read())
+    except FileNotFoundError:
+        logger.warning(f"{STYLESHEET_TEMPLATE} not found. Using the palette only.")
+        return Template("")
+
+@lru_cache(maxsize=None)
+def compile_stylesheet(name: str) -> str:
+    """style.qss with the theme's tokens filled in."""
+    return _template().substitute(THEMES[name])
+
+@lru_cache(maxsize=None)
+def compile_palette(name: str) -> QPalette:
+    """The theme as a palette, for the parts of widgets the stylesheet does not cover (menus, views, tooltips)."""
+    tokens = THEMES[name]
+    palette = QPalette()
+    for role, token in ((QPalette.Window, "background"), (QPalette.WindowText, "text"), (QPalette.Base, "surface"),
+                        (QPalette.AlternateBase, "raised"), (QPalette.Text, "text"), (QPalette.Button, "raised"),
+                        (QPalette.ButtonText, "accent"), (QPalette.Highlight, "accent"),
+                        (QPalette.HighlightedText, "background"), (QPalette.ToolTipBase, "surface"),
+                        (QPalette.ToolTipText, "text"), (QPalette.PlaceholderText, "muted"), (QPalette.Link, "accent")):
+        palette.setColor(role, QColor(tokens[token]))
+    palette.setColor(QPalette.Disabled, QPalette.Text, QColor(tokens["muted"]))
+    palette.setColor(QPalette.Disabled, QPalette.ButtonText, QColor(tokens["muted"]))
+    return palette
+
+@lru_cache(maxsize=None)
+def _color(name: str, token: str) -> QColor:
+    return QColor(THEMES[name][token])
+
+def color(token: str) -> QColor:
+    """A colour of the current theme. The QColor is shared: copy it before changing it."""
+    return _color(_current, token)
+
+def current() -> str:
+    return _current
+
+def apply_theme(app, name: str) -> str:
+    """
+    Makes name the application's theme and returns the name applied, falling back to
+    the default for unknown names. Applying the current theme again does nothing.
+    """
+    global _current
+    if name not in THEMES:
+        name = DEFAULT_THEME
+    if name == _current and app.styleSheet():
+        return name
+    with profiler.span("theme.apply", "ui"):
+        _current = name
+        app.setPalette(compile_palette(name))
+        app.setStyleSheet(compile_stylesheet(name)) # One polish pass over the widgets, whatever their number
+    return name